@@ -0,0 +1,116 @@
+"""
+Decoding and encoding speed of the JSON codecs on the test fixtures.
+
+Decodes every response of `tests/fixtures` (the templates rendered with
+random ids) and encodes the result again with each installed backend
+of `pyimgurapi.codec`. A listing of `--count` images built from the
+image fixture stands for the large responses of inventory scans.
+Backends which aren't installed are skipped.
+
+Usage:
+    $ python benchmarks/bench_json_codecs.py --count 1000 --repeat 200
+"""
+import argparse
+import json
+import os
+import random
+import string
+import time
+
+from jinja2 import Environment, FileSystemLoader
+
+from pyimgurapi.codec import CODECS, get_codec
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "tests", "fixtures"
+)
+TEMPLATES_DIR = os.path.join(FIXTURES_DIR, "templates")
+
+
+def random_imgur_id():
+    return "".join(random.choices(string.digits + string.ascii_letters, k=7))
+
+
+def fixtures():
+    """Raw bodies of the fixtures, by name."""
+    bodies = dict()
+    for name in sorted(os.listdir(FIXTURES_DIR)):
+        if name.endswith(".json"):
+            with open(os.path.join(FIXTURES_DIR, name), "rb") as file:
+                bodies[name] = file.read()
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+    for name in sorted(os.listdir(TEMPLATES_DIR)):
+        context = dict(
+            image_id=random_imgur_id(),
+            album_cover=random_imgur_id(),
+            album_cover_id=random_imgur_id(),
+            username="tester123",
+        )
+        # Comments have numeric ids, the templates generate them.
+        if not name.startswith("imgur_comment"):
+            context.update(id=random_imgur_id())
+        body = env.get_template(name).render(**context)
+        bodies[name.rsplit(".", 1)[0]] = body.encode("utf-8")
+    return bodies
+
+
+def listing(image_body, count):
+    image = json.loads(image_body)["data"]
+    images = [dict(image, id=f"img{i:07d}") for i in range(count)]
+    return json.dumps({"data": images, "success": True}).encode("utf-8")
+
+
+def measure(func, items, repeat):
+    """Microseconds per call of `func` on every item of `items`."""
+    for item in items:
+        func(item)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - started) / repeat / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    bodies = fixtures()
+    cases = [
+        ("fixtures", list(bodies.values()), args.repeat),
+        (
+            f"{args.count} images",
+            [listing(bodies["imgur_image_get_200.json"], args.count)],
+            max(args.repeat // 10, 1),
+        ),
+    ]
+    for label, items, repeat in cases:
+        values = [json.loads(item) for item in items]
+        timings = dict()
+        for name in CODECS:
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                continue
+            timings[name] = (
+                measure(codec.loads, items, repeat),
+                measure(codec.dumps, values, repeat),
+            )
+        base_loads, base_dumps = timings["json"]
+        print(f"{label}:")
+        for name in CODECS:
+            if name not in timings:
+                print(f"  {name:9} not installed")
+                continue
+            loads, dumps = timings[name]
+            print(
+                f"  {name:9} loads: {loads:9.1f} us "
+                f"({base_loads / loads:4.1f}x), "
+                f"dumps: {dumps:9.1f} us ({base_dumps / dumps:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
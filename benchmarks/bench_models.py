@@ -0,0 +1,186 @@
+"""
+Memory of responses kept as dicts versus `__slots__` models.
+
+Decodes a page of resources the way Imgur returns them (including
+blocks like `ad_config`) and measures the memory retained per object
+by the parsed JSON dict wrapped in `DynamicResponseData` and by the
+model of `pyimgurapi.models` built from it.
+
+Usage:
+    $ python benchmarks/bench_models.py --count 10000
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from pyimgurapi import models
+from pyimgurapi.utils import DynamicResponseData
+
+AD_CONFIG = {
+    "safeFlags": ["album", "in_gallery", "gallery"],
+    "highRiskFlags": [],
+    "unsafeFlags": ["sixth_mod_unsafe"],
+    "wallUnsafeFlags": [],
+    "showsAds": False,
+    "showAdLevel": 1,
+    "safe_flags": ["album", "in_gallery", "gallery"],
+    "high_risk_flags": [],
+    "unsafe_flags": ["sixth_mod_unsafe"],
+    "wall_unsafe_flags": [],
+    "show_ads": False,
+    "show_ad_level": 1,
+    "nsfw_score": 0,
+}
+
+
+def image(i):
+    return {
+        "id": f"img{i:07d}",
+        "title": f"Image number {i}",
+        "description": None,
+        "datetime": 1690046994 + i,
+        "type": "image/jpeg",
+        "animated": False,
+        "width": 1920,
+        "height": 1080,
+        "size": 123456 + i,
+        "views": i,
+        "bandwidth": 1000 * i,
+        "vote": None,
+        "favorite": False,
+        "nsfw": None,
+        "section": None,
+        "account_url": "tester123",
+        "account_id": 63193032,
+        "is_ad": False,
+        "in_most_viral": False,
+        "has_sound": False,
+        "tags": [],
+        "ad_type": 0,
+        "ad_url": "",
+        "edited": "0",
+        "in_gallery": False,
+        "deletehash": f"del{i:012d}",
+        "name": f"image{i}.jpg",
+        "link": f"https://i.imgur.com/img{i:07d}.jpeg",
+        "mp4": "",
+        "hls": "",
+        "ad_config": AD_CONFIG,
+    }
+
+
+def album(i):
+    return {
+        "id": f"alb{i:04d}",
+        "title": f"Album number {i}",
+        "description": "lorem ipsum dolor sit amet",
+        "datetime": 1690046994 + i,
+        "cover": f"img{i:07d}",
+        "cover_edited": None,
+        "cover_width": 1920,
+        "cover_height": 1080,
+        "account_url": "tester123",
+        "account_id": 63193032,
+        "privacy": "hidden",
+        "layout": "blog",
+        "views": i,
+        "link": f"https://imgur.com/a/alb{i:04d}",
+        "favorite": False,
+        "nsfw": False,
+        "section": None,
+        "images_count": 0,
+        "in_gallery": False,
+        "is_ad": False,
+        "include_album_ads": False,
+        "is_album": True,
+        "deletehash": f"del{i:012d}",
+        "images": [],
+        "ad_config": AD_CONFIG,
+    }
+
+
+def comment(i):
+    return {
+        "id": 632941205 + i,
+        "image_id": f"img{i:07d}",
+        "comment": "Lorem ipsum dolor sit amet",
+        "author": "tester1",
+        "author_id": 63193032,
+        "on_album": True,
+        "album_cover": None,
+        "ups": 5,
+        "downs": 0,
+        "points": 5,
+        "datetime": 1687062012 + i,
+        "parent_id": 0,
+        "deleted": False,
+        "vote": None,
+        "platform": "iphone",
+        "has_admin_badge": False,
+        "children": [],
+    }
+
+
+def account(i):
+    return {
+        "id": 63193032 + i,
+        "url": f"tester{i}",
+        "bio": None,
+        "avatar": f"https://imgur.com/user/tester{i}/avatar",
+        "avatar_name": "default/T",
+        "cover": "https://imgur.com/user/cover",
+        "cover_name": "default/1-space",
+        "reputation": i,
+        "reputation_name": "Neutral",
+        "created": 1502138950 + i,
+        "pro_expiration": False,
+        "user_follow": {"status": False},
+        "is_blocked": False,
+    }
+
+
+def retained(build):
+    """Bytes retained by the objects `build()` returns."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    resources = [
+        (models.Image, image),
+        (models.Album, album),
+        (models.Comment, comment),
+        (models.Account, account),
+    ]
+    for model, factory in resources:
+        body = json.dumps({"data": [factory(i) for i in range(args.count)]})
+
+        def as_dicts():
+            data = json.loads(body)["data"]
+            return [DynamicResponseData(item) for item in data]
+
+        def as_models():
+            return [model.from_dict(item) for item in json.loads(body)["data"]]
+
+        before = retained(as_dicts) / args.count
+        after = retained(as_models) / args.count
+        print(
+            f"{model.__name__:8} dict: {before / 1024:5.2f} KiB/object, "
+            f"model: {after / 1024:5.2f} KiB/object "
+            f"({before / after:4.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
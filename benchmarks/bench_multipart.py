@@ -0,0 +1,95 @@
+"""
+Micro-benchmark of encoding multipart upload bodies.
+
+Compares the previous way of sending an in-memory image, which encoded
+the whole body three times (twice in `get_headers()` and once more in
+the endpoint), with the memoized encoding of `MultipartForm`.
+
+Usage:
+    $ python benchmarks/bench_multipart.py --size 8 --repeat 20
+"""
+import argparse
+import io
+import os
+import time
+import tracemalloc
+
+from pyimgurapi.utils import ENCODING, EOL, Field, File, MultipartForm
+
+MB = 2**20
+
+
+def legacy_bytes(form):
+    """Encoding of `MultipartForm.__bytes__()` before memoization."""
+    buffer = io.BytesIO()
+    boundary_bytes = b"".join(
+        (b"--", form.boundary.encode(ENCODING), EOL.encode(ENCODING))
+    )
+    for field in form.fields:
+        buffer.write(boundary_bytes)
+        buffer.write("Content-Disposition: form-data; ".encode(ENCODING))
+        buffer.write(f'name="{field.field_name}"{EOL}'.encode(ENCODING))
+        buffer.write(EOL.encode(ENCODING))
+        buffer.write(field.value.encode(ENCODING))
+        buffer.write(EOL.encode(ENCODING))
+    for file in form.files:
+        buffer.write(boundary_bytes)
+        buffer.write("Content-Disposition: form-data; ".encode(ENCODING))
+        buffer.write(f'name="{file.field_name}"; '.encode(ENCODING))
+        buffer.write(f'filename="{file.name}"{EOL}'.encode(ENCODING))
+        buffer.write(EOL.encode(ENCODING))
+        buffer.write(file.data)
+        buffer.write(EOL.encode(ENCODING))
+        buffer.write(boundary_bytes)
+    return buffer.getvalue()
+
+
+def before(form):
+    if legacy_bytes(form):
+        str(len(legacy_bytes(form)))
+    return legacy_bytes(form)
+
+
+def after(form):
+    if len(form):
+        str(len(form))
+    return form.payload()
+
+
+def measure(func, data, repeat):
+    """CPU seconds and peak allocated bytes of encoding one body."""
+    cpu = 0.0
+    peak = 0
+    for _ in range(repeat):
+        form = MultipartForm(
+            fields=[Field("title", "Benchmark")],
+            files=[File("image.jpg", data, "image")],
+        )
+        tracemalloc.start()
+        started = time.process_time()
+        body = func(form)
+        cpu += time.process_time() - started
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del body
+    return cpu / repeat, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=8, help="image MB")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = os.urandom(args.size * MB)
+    print(f"{'':8} {'CPU ms/MB':>10} {'peak MB/MB':>12}")
+    for name, func in (("before", before), ("after", after)):
+        cpu, peak = measure(func, data, args.repeat)
+        print(
+            f"{name:8} {cpu * 1000 / args.size:10.3f} "
+            f"{peak / MB / args.size:12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Micro-benchmark of attribute access on `DynamicResponseData`.
+
+Reads the `link` of every image of a 10k-item `album_images` response,
+by index and by iteration, with the previous implementation (a new
+wrapper on every access of a nested object) and the current one
+(wrappers cached per child).
+
+Usage:
+    $ python benchmarks/bench_response_data.py --count 10000 --repeat 20
+"""
+import argparse
+import json
+import time
+
+from pyimgurapi.utils import DynamicResponseData
+
+
+class LegacyResponseData:
+    """`DynamicResponseData` before caching the child wrappers."""
+
+    def __init__(self, source_dict, name="data"):
+        self._source_dict = source_dict
+        self._name = name
+
+    def __getattr__(self, item):
+        if isinstance(self._source_dict, (list, tuple)):
+            raise AttributeError(item)
+        if item in self._source_dict:
+            value = self._source_dict[item]
+            if isinstance(value, (list, tuple, dict)):
+                return self.__class__(self._source_dict[item], name=item)
+            return value
+        raise AttributeError(item)
+
+    def __getitem__(self, key):
+        if isinstance(self._source_dict[key], (list, tuple, dict)):
+            return self.__class__(
+                self._source_dict[key],
+                name=f"'{key}' item of '{self._name}'",
+            )
+        return self._source_dict[key]
+
+
+def album_images(count):
+    images = [
+        {
+            "id": f"img{i:07d}",
+            "title": None,
+            "datetime": 1690046994 + i,
+            "type": "image/jpeg",
+            "width": 1920,
+            "height": 1080,
+            "link": f"https://i.imgur.com/img{i:07d}.jpeg",
+        }
+        for i in range(count)
+    ]
+    return json.loads(json.dumps({"data": images, "success": True}))
+
+
+def by_index(response):
+    for i in range(len(response.as_dict()["data"])):
+        response.data[i].link
+
+
+def by_iteration(response):
+    for image in response.data:
+        image.link
+
+
+def measure(func, response, repeat):
+    """Seconds per repeated pass over the response."""
+    func(response)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(response)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = album_images(args.count)
+    legacy = LegacyResponseData(data)
+    legacy.as_dict = lambda: data
+    # Iteration wasn't supported, indexing was the only way.
+    cases = [
+        ("data[i].link", by_index, by_index),
+        ("for image in data", by_index, by_iteration),
+    ]
+    for label, before, after in cases:
+        legacy_time = measure(before, legacy, args.repeat)
+        cached_time = measure(after, DynamicResponseData(data), args.repeat)
+        print(
+            f"{label:18} before: {legacy_time * 1e3:6.2f} ms, "
+            f"after: {cached_time * 1e3:6.2f} ms "
+            f"({legacy_time / cached_time:3.1f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from .aio import AsyncImgurAPI
 from .api import ImgurAPI
 
-__all__ = ("ImgurAPI",)
+__all__ = ("AsyncImgurAPI", "ImgurAPI")
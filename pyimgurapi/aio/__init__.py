@@ -0,0 +1,4 @@
+from .api import AsyncImgurAPI
+from .transport import AsyncConnectionPool
+
+__all__ = ("AsyncConnectionPool", "AsyncImgurAPI")
@@ -0,0 +1,183 @@
+from ..api import DEFAULT_TIMEOUT, ImgurAPI
+from ..batch import amap_concurrently
+from ..bulk import abulk_upload
+from ..coalesce import AsyncSingleFlight
+from .endpoints import Account, Album, Comment, Image
+from .transport import AsyncConnectionPool
+
+
+class AsyncImgurAPI(ImgurAPI):
+    """
+    Representation of Imgur API for asyncio applications.
+
+    Exposes the same endpoints as `ImgurAPI`, but every endpoint
+    method returns an awaitable.
+    """
+
+    account: Account
+    album: Album
+    comment: Comment
+    image: Image
+
+    single_flight_class = AsyncSingleFlight
+
+    def __init__(
+        self,
+        refresh_token=None,
+        client_id=None,
+        client_secret=None,
+        transport=None,
+        rate_limiter=None,
+        retry_policy=None,
+        timeout=DEFAULT_TIMEOUT,
+        cache=None,
+        coalesce=True,
+        dedupe=None,
+        json_codec=None,
+        max_concurrency=100,
+    ):
+        """
+        Initialize asynchronous Imgur API object.
+
+        Args:
+            refresh_token (str, optional): OAuth2 refresh token.
+            client_id (str, optional): Imgur client ID.
+            client_secret (str, optional): Imgur client Secret.
+            transport (AsyncConnectionPool, optional): Non-blocking
+                transport shared by all endpoints. Defaults to a new
+                `AsyncConnectionPool` owned by this object.
+            rate_limiter (RateLimiter, optional): Scheduler pacing the
+                requests of all endpoints. Defaults to a new
+                `RateLimiter`.
+            retry_policy (RetryPolicy, optional): Policy retrying failed
+                requests of all endpoints. Defaults to a new
+                `RetryPolicy`.
+            timeout (float|Timeout, optional): Connect, read and total
+                timeouts of every call. Defaults to 10 seconds to
+                connect and 30 seconds to read.
+            cache (ResponseCache, optional): Cache of GET responses
+                shared by all endpoints. Defaults to no caching.
+            coalesce (bool, optional): Make concurrent identical GET
+                requests share one network call. Defaults to True.
+            dedupe (DedupeIndex, optional): Index of uploaded content,
+                which lets `Image.upload()` skip uploading the same
+                bytes twice. Defaults to no deduplication.
+            json_codec (str|JSONCodec, optional): JSON backend of all
+                endpoints. Defaults to the fastest installed one.
+            max_concurrency (int, optional): Upper bound of requests in
+                flight for the default transport. Defaults to 100.
+
+        Examples:
+        >>> import asyncio
+        >>> from pyimgurapi import AsyncImgurAPI
+        >>> async def main():
+        ...     async with AsyncImgurAPI(client_id="***") as api:
+        ...         return await asyncio.gather(
+        ...             api.image.get_image("3MvMVho"),
+        ...             api.album.get_album("Ff3bHm8"),
+        ...         )
+        >>> image, album = asyncio.run(main())
+        """
+        if transport is None:
+            transport = AsyncConnectionPool(max_concurrency=max_concurrency)
+        super().__init__(
+            refresh_token=refresh_token,
+            client_id=client_id,
+            client_secret=client_secret,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            cache=cache,
+            coalesce=coalesce,
+            dedupe=dedupe,
+            json_codec=json_codec,
+        )
+        self.endpoints = dict(
+            account=Account,
+            album=Album,
+            comment=Comment,
+            image=Image,
+        )
+
+    async def auth(self):
+        """
+        Authenticate an API-object.
+
+        See `ImgurAPI.auth()`.
+
+        Returns:
+            (DynamicResponseData): Response from Imgur.
+        """
+        auth_response = await self.account.generate_access_token(
+            refresh_token=self.refresh_token,
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+        )
+        self.access_token = auth_response.access_token
+        return auth_response
+
+    def map(self, func, items, max_in_flight=16, ordered=True):
+        """
+        Await an endpoint method for many arguments concurrently.
+
+        See `ImgurAPI.map()`; the calls run as coroutines instead of
+        threads.
+
+        Returns:
+            (AsyncIterator[BatchResult]): Lazy iterator over the
+                                          outcomes.
+
+        Examples:
+        >>> async for res in api.map(api.image.get_image, hashes):
+        ...     print(res.item, res.ok)
+        """
+        return amap_concurrently(
+            func, items, max_in_flight=max_in_flight, ordered=ordered
+        )
+
+    async def bulk_upload(
+        self,
+        sources,
+        album=None,
+        create_album=False,
+        album_options=None,
+        manifest=None,
+        max_in_flight=4,
+    ):
+        """
+        Upload many image files concurrently and put them into an album.
+
+        See `ImgurAPI.bulk_upload()`; the uploads run as coroutines
+        instead of threads.
+
+        Returns:
+            (BulkUploadResult): Outcome of every upload and the album.
+        """
+        return await abulk_upload(
+            self,
+            sources,
+            album=album,
+            create_album=create_album,
+            album_options=album_options,
+            manifest=manifest,
+            max_in_flight=max_in_flight,
+        )
+
+    async def close(self):
+        """Close idle connections of the shared transport."""
+        await self.transport.close()
+
+    def __enter__(self):
+        raise TypeError(
+            f"Use 'async with' with {self.__class__.__name__} instead"
+        )
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
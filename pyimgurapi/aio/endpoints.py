@@ -0,0 +1,249 @@
+import asyncio
+import http.client
+import urllib.error
+
+from .. import endpoints
+from ..endpoints.base_endpoint import BaseEndpoint
+from ..exceptions import PyImgurApiTimeout
+from ..pagination import agather_pages, aiter_pages
+from ..streaming import aiter_json_array
+from ..threads import awalk_thread
+from ..timeouts import Timeout
+
+
+async def run_until(awaitable, deadline):
+    """
+    Await `awaitable`, cancelling it once `deadline` has passed.
+
+    Raises:
+        PyImgurApiTimeout: If the deadline has passed first.
+    """
+    if deadline is None:
+        return await awaitable
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait((task,), timeout=deadline.remaining())
+    except BaseException:
+        task.cancel()
+        raise
+    if not done:
+        task.cancel()
+        await asyncio.wait((task,))
+        raise PyImgurApiTimeout("Deadline exceeded")
+    return task.result()
+
+
+class AsyncBaseEndpoint(BaseEndpoint):
+    """
+    Base class of the awaitable endpoints.
+
+    Every public method of the synchronous endpoints ends with
+    `return self.make_request(...)`, so overriding `make_request` with
+    a coroutine turns each of them into an awaitable one. Likewise the
+    listing iterators, which end with `return self.paginate(...)`,
+    become asynchronous iterators.
+
+    Unlike the synchronous endpoints, they need a `transport`, e.g. an
+    `AsyncConnectionPool`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.transport is None:
+            raise TypeError(
+                f"{self.__class__.__name__}() requires a transport, "
+                f"e.g. an AsyncConnectionPool"
+            )
+
+    async def send(self, request, deadline=None):
+        """Send `request` once, pacing it with the rate limiter."""
+        method = request.get_method()
+        timeout = Timeout.coerce(self.timeout)
+        if deadline is not None:
+            timeout = Timeout(*timeout.socket_timeouts(deadline))
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(method, deadline=deadline)
+
+        try:
+            response = await self.transport.urlopen(request, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(e.headers, status=e.code)
+            raise
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.headers)
+        return response
+
+    async def send_and_read(self, request, deadline=None):
+        """Send `request` once and read the whole response body."""
+        response = await self.send(request, deadline=deadline)
+        try:
+            return response.headers, await response.read()
+        finally:
+            response.close()
+
+    async def fetch(self, request, stream=False):
+        """
+        Send `request` and read the response body, retrying failures.
+
+        See `BaseEndpoint.fetch()`.
+
+        Returns:
+            (tuple): Response headers and raw response body, the body
+                     is `None` if the response is "304 Not Modified".
+        """
+        method = request.get_method()
+        deadline = self.call_deadline()
+        if self.retry_policy is not None:
+            self.retry_policy.record_request()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if deadline is not None:
+                deadline.check()
+            try:
+                if stream:
+                    response = await run_until(
+                        self.send(request, deadline=deadline), deadline
+                    )
+                    return response.headers, response
+                return await run_until(
+                    self.send_and_read(request, deadline=deadline), deadline
+                )
+            except (OSError, http.client.HTTPException) as e:
+                if self.is_not_modified(e):
+                    return e.headers, None
+                delay = self.retry_delay(e, attempt, method, deadline)
+            await asyncio.sleep(delay)
+
+    def paginate(self, fetch_page, prefetch=True, model=None):
+        """
+        Iterate over the items of a paginated listing asynchronously.
+
+        See `aiter_pages()`.
+
+        Returns:
+            (AsyncIterator): Lazy iterator over the items.
+        """
+        return aiter_pages(fetch_page, prefetch=prefetch, model=model)
+
+    def gather(
+        self, fetch_page, fetch_count, max_workers=8, key=None, model=None
+    ):
+        """
+        Fetch all pages of a listing concurrently.
+
+        See `agather_pages()`.
+
+        Returns:
+            (Awaitable[list]): Items of all pages.
+        """
+        return agather_pages(
+            fetch_page,
+            fetch_count,
+            max_in_flight=max_workers,
+            key=key,
+            model=model,
+        )
+
+    async def stream_items(self, request, array=("data",), fields=None):
+        """
+        Send `request` and parse an array of the response as it's read.
+
+        See `BaseEndpoint.stream_items()`.
+
+        Returns:
+            (AsyncIterator[DynamicResponseData]): Lazy iterator over
+                                                  the items.
+        """
+        deadline = self.call_deadline()
+        _, response = await self.fetch(request, stream=True)
+        return aiter_json_array(
+            response, array, deadline=deadline, fields=fields
+        )
+
+    async def make_request(
+        self,
+        url_path,
+        data=None,
+        headers=None,
+        method="GET",
+        resource=None,
+        tags=(),
+        content=None,
+        array=("data",),
+        fields=None,
+        streamable=False,
+    ):
+        digest = None
+        if content is not None and self.dedupe is not None:
+            # Hashing a large file would block the event loop.
+            digest = await asyncio.get_running_loop().run_in_executor(
+                None, self.dedupe.digest, content
+            )
+        call = self.prepare_call(
+            url_path,
+            data,
+            headers,
+            method,
+            resource,
+            tags,
+            digest,
+            array,
+            fields,
+            streamable,
+        )
+        if call.response is not None:
+            return call.response
+        if call.stream:
+            return await self.stream_items(call.request, array, call.fields)
+
+        async def load():
+            return call.store(*await self.fetch(call.request))
+
+        if method != "GET":
+            try:
+                return await load()
+            finally:
+                # Even a failed mutation may have been applied.
+                self.after_mutation(method, tags)
+        if call.coalescing_key is None:
+            return await load()
+        # Concurrent identical GETs share one network call.
+        return await self.single_flight.do(
+            call.coalescing_key, load, deadline=self.call_deadline()
+        )
+
+
+class Account(AsyncBaseEndpoint, endpoints.Account):
+    """Account management (asyncio)"""
+
+
+class Album(AsyncBaseEndpoint, endpoints.Album):
+    """Album management (asyncio)"""
+
+
+class Comment(AsyncBaseEndpoint, endpoints.Comment):
+    """Comment management (asyncio)"""
+
+    async def thread(
+        self, comment_id, max_depth=None, max_comments=1000, max_workers=8
+    ):
+        """
+        Fetch a whole comment thread as a flat list.
+
+        See `endpoints.Comment.thread()`.
+        """
+        return await awalk_thread(
+            self.with_options(stream=False).replies,
+            comment_id,
+            max_depth=max_depth,
+            max_comments=max_comments,
+            max_in_flight=max_workers,
+        )
+
+
+class Image(AsyncBaseEndpoint, endpoints.Image):
+    """Image management (asyncio)"""
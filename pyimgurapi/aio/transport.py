@@ -0,0 +1,411 @@
+import asyncio
+import collections
+import email.parser
+import http.client
+import io
+import logging
+import socket
+import ssl
+import time
+import urllib.error
+from urllib.parse import urlsplit
+
+from ..retry import IDEMPOTENT_METHODS
+from ..timeouts import Timeout
+from ..transport import DEFAULT_PORTS, USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+
+async def wait_for(awaitable, timeout):
+    """
+    `asyncio.wait_for()` raising `socket.timeout` like blocking sockets.
+    """
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise socket.timeout("timed out") from None
+
+
+class AsyncPooledResponse:
+    """
+    Response handed out by `AsyncConnectionPool`.
+
+    The body is read lazily with `await response.read()`; the
+    connection is returned to the pool once the body is exhausted.
+    """
+
+    def __init__(
+        self,
+        pool,
+        key,
+        connection,
+        method,
+        status,
+        reason,
+        headers,
+        timeout=None,
+    ):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._timeout = timeout
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+        self._chunked = "chunked" in headers.get("Transfer-Encoding", "")
+        self._chunk_left = 0
+        self._will_close = "close" in headers.get("Connection", "").lower()
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            self._remaining = 0
+        elif self._chunked:
+            self._remaining = None
+        elif headers.get("Content-Length") is not None:
+            self._remaining = int(headers["Content-Length"])
+        else:
+            # No framing at all: the body lasts until the server closes
+            # the connection, so the socket can't be reused.
+            self._remaining = None
+            self._will_close = True
+        self._eof = self._remaining == 0
+
+        if self._eof:
+            self.close()
+
+    async def _read_chunk(self, amt):
+        reader = self._connection[0]
+        if self._chunk_left == 0:
+            size_line = await reader.readuntil(b"\r\n")
+            self._chunk_left = int(size_line.split(b";", 1)[0], 16)
+            if self._chunk_left == 0:
+                # Skip optional trailers up to the final empty line.
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                self._eof = True
+                return b""
+        size = self._chunk_left if amt is None else min(amt, self._chunk_left)
+        data = await reader.readexactly(size)
+        self._chunk_left -= size
+        if self._chunk_left == 0:
+            await reader.readexactly(2)
+        return data
+
+    async def read(self, amt=None):
+        """
+        Read up to `amt` bytes of the body, the whole rest by default.
+        """
+        if self._eof:
+            return b""
+        try:
+            data = await wait_for(self._read(amt), self._timeout)
+        except BaseException:
+            self._will_close = True
+            self.close()
+            raise
+
+        if self._eof:
+            self.close()
+        return data
+
+    async def _read(self, amt):
+        reader = self._connection[0]
+        if self._chunked:
+            if amt is not None:
+                data = await self._read_chunk(amt)
+            else:
+                parts = list()
+                while not self._eof:
+                    parts.append(await self._read_chunk(None))
+                data = b"".join(parts)
+        elif self._remaining is not None:
+            if amt is None:
+                data = await reader.readexactly(self._remaining)
+            else:
+                data = await reader.read(min(amt, self._remaining))
+                if not data:
+                    raise asyncio.IncompleteReadError(b"", self._remaining)
+            self._remaining -= len(data)
+            self._eof = self._remaining == 0
+        else:
+            data = await reader.read(-1 if amt is None else amt)
+            self._eof = not data or amt is None
+        return data
+
+    def close(self):
+        """Give the connection back to the pool (or drop it)."""
+        if self._connection is None:
+            return
+        reusable = self._eof and not self._will_close
+        self._pool.release(self._key, self._connection, reusable=reusable)
+        self._connection = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncConnectionPool:
+    """
+    Non-blocking pool of persistent HTTP/1.1 connections.
+
+    The asyncio counterpart of `pyimgurapi.transport.ConnectionPool`.
+    On top of the per-host connection limit it bounds the total number
+    of requests in flight with `max_concurrency`; the rest of the
+    coroutines wait on a semaphore rather than occupying threads.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host=10,
+        max_concurrency=100,
+        idle_timeout=60.0,
+        ssl_context=None,
+    ):
+        """
+        Initialize connection pool.
+
+        Args:
+            max_connections_per_host (int, optional): Upper bound of
+                simultaneously opened connections to a single host.
+                Defaults to 10.
+            max_concurrency (int, optional): Upper bound of requests
+                in flight across all hosts. Defaults to 100.
+            idle_timeout (float, optional): Seconds an unused connection
+                is kept open. Defaults to 60.
+            ssl_context (ssl.SSLContext, optional): Context for HTTPS
+                connections. Defaults to the system default one.
+        """
+        if max_connections_per_host < 1 or max_concurrency < 1:
+            raise ValueError("Connection limits must be positive")
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl_context
+
+        # Semaphores are created lazily: on Python < 3.10 they bind to
+        # the event loop which is current at construction time.
+        self._concurrency = None
+        self._host_limits = dict()
+        self._idle = collections.defaultdict(collections.deque)
+        self._closed = False
+
+    def _semaphores(self, key):
+        if self._concurrency is None:
+            self._concurrency = asyncio.Semaphore(self.max_concurrency)
+        if key not in self._host_limits:
+            self._host_limits[key] = asyncio.Semaphore(
+                self.max_connections_per_host
+            )
+        return self._concurrency, self._host_limits[key]
+
+    async def _open_connection(self, key, timeout):
+        scheme, host, port = key
+        context = None
+        if scheme == "https":
+            context = self.ssl_context or ssl.create_default_context()
+        return await wait_for(
+            asyncio.open_connection(host, port, ssl=context), timeout
+        )
+
+    @staticmethod
+    async def _take_slot(semaphore, key, wait_until):
+        if wait_until is None or not semaphore.locked():
+            await semaphore.acquire()
+            return
+        try:
+            await asyncio.wait_for(
+                semaphore.acquire(), max(wait_until - time.monotonic(), 0)
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"No free connection to {key[1]}:{key[2]}"
+            ) from None
+
+    async def acquire(self, key, timeout=None):
+        """
+        Take a connection for `key` out of the pool.
+
+        Args:
+            key (tuple): `(scheme, host, port)` of the connection.
+            timeout (float, optional): Connect timeout of a new
+                connection, and the longest wait for a free one.
+
+        Returns:
+            (tuple): `(reader, writer)` pair and a flag whether it was
+                     reused.
+
+        Raises:
+            TimeoutError: If no connection got free within `timeout`.
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        concurrency, host_limit = self._semaphores(key)
+        wait_until = None if timeout is None else time.monotonic() + timeout
+        await self._take_slot(concurrency, key, wait_until)
+        try:
+            await self._take_slot(host_limit, key, wait_until)
+        except BaseException:
+            concurrency.release()
+            raise
+
+        idle, now = self._idle[key], time.monotonic()
+        while idle:
+            connection, last_used = idle.pop()
+            if (
+                now - last_used <= self.idle_timeout
+                and not connection[0].at_eof()
+            ):
+                return connection, True
+            connection[1].close()
+
+        try:
+            return await self._open_connection(key, timeout), False
+        except BaseException:
+            host_limit.release()
+            concurrency.release()
+            raise
+
+    def release(self, key, connection, reusable=True):
+        """Return a connection taken by `acquire()` back to the pool."""
+        if reusable and not self._closed:
+            self._idle[key].append((connection, time.monotonic()))
+        else:
+            connection[1].close()
+        concurrency, host_limit = self._semaphores(key)
+        host_limit.release()
+        concurrency.release()
+
+    @staticmethod
+    def _serialize_head(request, host_header, body):
+        headers = {"Host": host_header, "User-Agent": USER_AGENT}
+        headers.update(request.header_items())
+        if body is not None or request.get_method() in ("POST", "PUT"):
+            if not any(h.lower() == "content-length" for h in headers):
+                headers["Content-Length"] = str(len(body or b""))
+        lines = [f"{request.get_method()} {request.selector} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _send(self, connection, request, host_header, timeout):
+        _, writer = connection
+        body = request.data
+        writer.write(self._serialize_head(request, host_header, body))
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            writer.write(body)
+        elif body is not None:
+            # Streamed body, e.g. `MultipartForm` uploading a file.
+            for chunk in body:
+                writer.write(chunk)
+                await wait_for(writer.drain(), timeout)
+        await wait_for(writer.drain(), timeout)
+
+    @staticmethod
+    async def _read_head(connection, timeout):
+        reader, _ = connection
+        head = await wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+        status_line, _, header_block = head.partition(b"\r\n")
+        version, status, reason = (
+            status_line.decode("latin-1").split(" ", 2) + [""]
+        )[:3]
+        if not version.startswith("HTTP/"):
+            raise http.client.BadStatusLine(status_line)
+        headers = email.parser.BytesParser(
+            _class=http.client.HTTPMessage
+        ).parsebytes(header_block)
+        return int(status), reason.strip(), headers
+
+    async def urlopen(self, request, timeout=None):
+        """
+        Send `urllib.request.Request` over a pooled connection.
+
+        Behaves like `urllib.request.urlopen()`: any non-2xx response
+        is raised as `urllib.error.HTTPError`.
+
+        Args:
+            request (urllib.request.Request): Request to send.
+            timeout (float|Timeout, optional): Timeout in seconds for
+                connecting and for every network wait, or separate
+                connect and read timeouts.
+
+        Returns:
+            (AsyncPooledResponse): Response from the server.
+        """
+        parts = urlsplit(request.full_url)
+        if parts.scheme not in DEFAULT_PORTS:
+            raise ValueError(f"Unsupported URL scheme: '{parts.scheme}'")
+        key = (
+            parts.scheme,
+            parts.hostname,
+            parts.port or DEFAULT_PORTS[parts.scheme],
+        )
+
+        connect_timeout, read_timeout = Timeout.coerce(
+            timeout
+        ).socket_timeouts()
+
+        replayable = request.get_method() in IDEMPOTENT_METHODS
+        while True:
+            connection, reused = await self.acquire(
+                key, timeout=connect_timeout
+            )
+            sent = False
+            try:
+                await self._send(
+                    connection, request, parts.netloc, read_timeout
+                )
+                sent = True
+                status, reason, headers = await self._read_head(
+                    connection, read_timeout
+                )
+            except BaseException as exc:
+                self.release(key, connection, reusable=False)
+                # The server may drop a keep-alive connection at any
+                # moment; replay the request on another socket, unless
+                # the server may have got a non-idempotent one.
+                if (
+                    reused
+                    and (replayable or not sent)
+                    and isinstance(
+                        exc, (asyncio.IncompleteReadError, ConnectionError)
+                    )
+                ):
+                    logger.debug(f"Stale connection to {key}, reconnecting")
+                    continue
+                raise
+            break
+
+        response = AsyncPooledResponse(
+            self,
+            key,
+            connection,
+            request.get_method(),
+            status,
+            reason,
+            headers,
+            timeout=read_timeout,
+        )
+        if not 200 <= status < 300:
+            body = await response.read()
+            raise urllib.error.HTTPError(
+                request.full_url, status, reason, headers, io.BytesIO(body)
+            )
+        return response
+
+    async def close(self):
+        """Close all idle connections and refuse new requests."""
+        self._closed = True
+        idle, self._idle = self._idle, collections.defaultdict(
+            collections.deque
+        )
+        for connections in idle.values():
+            for (_, writer), _ in connections:
+                writer.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,16 +1,43 @@
 import itertools
 
+from .batch import map_concurrently
+from .bulk import bulk_upload
+from .codec import get_codec
+from .coalesce import SingleFlight
 from .endpoints import Account, Album, Comment, Image
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .timeouts import Deadline, Timeout
+from .transport import ConnectionPool
+
+
+DEFAULT_TIMEOUT = Timeout(connect=10, read=30)
 
 
 class ImgurAPI:
     """Representation of Imgur API"""
+
     account: Account
     album: Album
     comment: Comment
     image: Image
 
-    def __init__(self, refresh_token=None, client_id=None, client_secret=None):
+    single_flight_class = SingleFlight
+
+    def __init__(
+        self,
+        refresh_token=None,
+        client_id=None,
+        client_secret=None,
+        transport=None,
+        rate_limiter=None,
+        retry_policy=None,
+        timeout=DEFAULT_TIMEOUT,
+        cache=None,
+        coalesce=True,
+        dedupe=None,
+        json_codec=None,
+    ):
         """
         Initialize Imgur API object.
 
@@ -18,6 +45,30 @@ class ImgurAPI:
             refresh_token (str, optional): OAuth2 refresh token.
             client_id (str, optional): Imgur client ID.
             client_secret (str, optional): Imgur client Secret.
+            transport (ConnectionPool, optional): Keep-alive transport
+                shared by all endpoints. Defaults to a new
+                `ConnectionPool` owned by this object.
+            rate_limiter (RateLimiter, optional): Scheduler pacing the
+                requests of all endpoints by the credits Imgur reports.
+                Defaults to a new `RateLimiter`.
+            retry_policy (RetryPolicy, optional): Policy retrying failed
+                requests of all endpoints; its retry budget is shared
+                by them. Defaults to a new `RetryPolicy`.
+            timeout (float|Timeout, optional): Connect, read and total
+                timeouts of every call, can be overridden per endpoint
+                with `with_options(timeout=...)`. Defaults to 10
+                seconds to connect and 30 seconds to read.
+            cache (ResponseCache, optional): Cache of GET responses
+                shared by all endpoints. Defaults to no caching.
+            coalesce (bool, optional): Make concurrent identical GET
+                requests share one network call. Defaults to True.
+            dedupe (DedupeIndex, optional): Index of uploaded content,
+                which lets `Image.upload()` skip uploading the same
+                bytes twice. Defaults to no deduplication.
+            json_codec (str|JSONCodec, optional): JSON backend of all
+                endpoints: `"json"`, `"orjson"`, `"simdjson"`,
+                `"ujson"` or a codec object. Defaults to the fastest
+                installed one.
 
         Notes:
             - To make authorized requests each of `refresh_token`,
@@ -28,6 +79,20 @@ class ImgurAPI:
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = None
+        self.transport = (
+            transport if transport is not None else ConnectionPool()
+        )
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else RateLimiter()
+        )
+        self.retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.timeout = timeout
+        self.cache = cache
+        self.single_flight = self.single_flight_class() if coalesce else None
+        self.dedupe = dedupe
+        self.codec = get_codec(json_codec)
 
         self.endpoints = dict(
             account=Account,
@@ -76,10 +141,146 @@ class ImgurAPI:
         self.access_token = token
         return auth_response
 
+    @staticmethod
+    def deadline(seconds):
+        """
+        Limit the latency of a composite operation.
+
+        Every request made inside the `with` block, including retries
+        and further pages, shares the deadline and fails with
+        `PyImgurApiTimeout` once it has passed.
+
+        Args:
+            seconds (float): Latency budget in seconds.
+
+        Returns:
+            (Deadline): Context manager applying the deadline.
+
+        Examples:
+        >>> with api.deadline(5):
+        ...     album = api.album.get_album("Ff3bHm8")
+        ...     images = api.album.album_images("Ff3bHm8")
+        """
+        return Deadline(seconds)
+
+    def map(
+        self, func, items, max_workers=8, max_in_flight=None, ordered=True
+    ):
+        """
+        Call an endpoint method for many arguments concurrently.
+
+        Calls are fanned out over a thread pool and share the keep-alive
+        transport of this object. A failed call doesn't abort the batch,
+        its exception is stored in the corresponding result.
+
+        Args:
+            func (callable): Function of a single argument, usually an
+                             endpoint method like `api.image.get_image`.
+            items (iterable): Arguments to call `func` with.
+            max_workers (int, optional): Number of threads.
+                                         Defaults to 8.
+            max_in_flight (int, optional): Upper bound of submitted but
+                                           not yet consumed calls.
+                                           Defaults to
+                                           `2 * max_workers`.
+            ordered (bool, optional): Yield results in the input order
+                                      if True, as soon as they complete
+                                      otherwise. Defaults to True.
+
+        Returns:
+            (Iterator[BatchResult]): Lazy iterator over the outcomes.
+
+        Examples:
+        >>> from pyimgurapi import ImgurAPI
+        >>> api = ImgurAPI(client_id="***")
+        >>> hashes = ["3MvMVho", "bad"]
+        >>> for res in api.map(api.image.get_image, hashes):
+        ...     print(res.item, res.ok, res.error)
+        3MvMVho True None
+        bad False Not Found
+        """
+        return map_concurrently(
+            func,
+            items,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+        )
+
+    def bulk_upload(
+        self,
+        sources,
+        album=None,
+        create_album=False,
+        album_options=None,
+        manifest=None,
+        max_workers=4,
+    ):
+        """
+        Upload many image files concurrently and put them into an album.
+
+        Uploads run over a thread pool and are paced by the POST budget
+        of the shared rate limiter. Once every file has been uploaded,
+        the images are added to `album` (with `Album.add`) or to a new
+        album (with `Album.create`) in the order of `sources`.
+
+        A manifest records every finished upload and the album as soon
+        as they're known. Running the same upload again with the same
+        manifest, e.g. after a crash, skips the files which have been
+        uploaded already and extends the same album.
+
+        Args:
+            sources (iterable): Paths of the image files.
+            album (str, optional): Album to add the images to, its
+                deletehash for anonymous albums. Defaults to None.
+            create_album (bool, optional): Create a new album if
+                `album` isn't given. Defaults to False.
+            album_options (dict, optional): Keyword arguments of
+                `Album.create`, e.g. `title` or `privacy`.
+            manifest (str|PathLike|UploadManifest, optional): Manifest
+                to resume from and write to. Defaults to None.
+            max_workers (int, optional): Number of concurrent uploads.
+                Defaults to 4.
+
+        Returns:
+            (BulkUploadResult): Outcome of every upload in the order of
+                                `sources` and the album, which is
+                                `None` if some uploads failed.
+
+        Examples:
+        >>> from pathlib import Path
+        >>> res = api.bulk_upload(
+        ...     sorted(Path("holiday").glob("*.jpg")),
+        ...     create_album=True,
+        ...     album_options=dict(title="Holiday"),
+        ...     manifest="holiday.manifest",
+        ... )
+        >>> res.ok, res.album.id
+        (True, 'Ff3bHm8')
+        """
+        return bulk_upload(
+            self,
+            sources,
+            album=album,
+            create_album=create_album,
+            album_options=album_options,
+            manifest=manifest,
+            max_workers=max_workers,
+        )
+
     def __getattr__(self, item):
         if item in self.endpoints:
             return self.endpoints[item](
-                client_id=self.client_id, access_token=self.access_token
+                client_id=self.client_id,
+                access_token=self.access_token,
+                transport=self.transport,
+                rate_limiter=self.rate_limiter,
+                retry_policy=self.retry_policy,
+                timeout=self.timeout,
+                cache=self.cache,
+                single_flight=self.single_flight,
+                dedupe=self.dedupe,
+                codec=self.codec,
             )
         raise NotImplementedError(
             f"Endpoint {item} is not supported or is not implemented yet."
@@ -87,3 +288,13 @@ class ImgurAPI:
 
     def __dir__(self):
         return itertools.chain(super().__dir__(), self.endpoints.keys())
+
+    def close(self):
+        """Close idle connections of the shared transport."""
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,150 @@
+import asyncio
+import collections
+import concurrent.futures
+import contextvars
+import itertools
+
+
+class BatchResult(
+    collections.namedtuple("BatchResult", ("index", "item", "result", "error"))
+):
+    """
+    Outcome of a single call made by `map_concurrently()`.
+
+    Attributes:
+        index (int): Position of `item` in the input iterable.
+        item: Argument the function was called with.
+        result: Return value of the call, `None` if it failed.
+        error (Exception): Exception raised by the call, `None` if it
+                           succeeded.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _call(func, index, item):
+    try:
+        return BatchResult(index, item, func(item), None)
+    except Exception as exc:
+        return BatchResult(index, item, None, exc)
+
+
+def map_concurrently(
+    func, items, max_workers=8, max_in_flight=None, ordered=True
+):
+    """
+    Call `func` for every element of `items` using a thread pool.
+
+    At most `max_in_flight` calls are submitted at a time, so `items`
+    may be a lazy iterable of any length. An exception raised by a call
+    is stored in its `BatchResult` instead of aborting the batch.
+
+    Args:
+        func (callable): Function of a single argument, e.g.
+                         `api.image.get_image`.
+        items (iterable): Arguments to call `func` with.
+        max_workers (int, optional): Number of threads. Defaults to 8.
+        max_in_flight (int, optional): Upper bound of submitted but not
+                                       yet consumed calls. Defaults to
+                                       `2 * max_workers`.
+        ordered (bool, optional): Yield results in the input order if
+                                  True, as soon as they complete
+                                  otherwise. Defaults to True.
+
+    Yields:
+        (BatchResult): Outcome of every call.
+    """
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be positive")
+    max_in_flight = max(max_in_flight or 2 * max_workers, 1)
+    items = enumerate(items)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending = collections.deque()
+
+    def submit(count):
+        for index, item in itertools.islice(items, count):
+            # Run the call in a copy of the caller's context, so that
+            # e.g. the current `Deadline` applies to it as well.
+            context = contextvars.copy_context()
+            pending.append(
+                executor.submit(context.run, _call, func, index, item)
+            )
+
+    try:
+        submit(max_in_flight)
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                yield future.result()
+            submit(len(done))
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def _acall(func, index, item):
+    try:
+        return BatchResult(index, item, await func(item), None)
+    except Exception as exc:
+        return BatchResult(index, item, None, exc)
+
+
+async def amap_concurrently(func, items, max_in_flight=16, ordered=True):
+    """
+    Asynchronous counterpart of `map_concurrently()`.
+
+    Args:
+        func (callable): Coroutine function of a single argument, e.g.
+                         `api.image.get_image` of `AsyncImgurAPI`.
+        items (iterable): Arguments to call `func` with.
+        max_in_flight (int, optional): Upper bound of concurrently
+                                       running calls. Defaults to 16.
+        ordered (bool, optional): Yield results in the input order if
+                                  True, as soon as they complete
+                                  otherwise. Defaults to True.
+
+    Yields:
+        (BatchResult): Outcome of every call.
+    """
+    if max_in_flight < 1:
+        raise ValueError("`max_in_flight` must be positive")
+    items = enumerate(items)
+    pending = collections.deque()
+
+    def submit(count):
+        for index, item in itertools.islice(items, count):
+            pending.append(asyncio.ensure_future(_acall(func, index, item)))
+
+    try:
+        submit(max_in_flight)
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+                await done[0]
+            else:
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                done = [task for task in pending if task in finished]
+                for task in done:
+                    pending.remove(task)
+            for task in done:
+                yield task.result()
+            submit(len(done))
+    finally:
+        for task in pending:
+            task.cancel()
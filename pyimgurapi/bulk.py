@@ -0,0 +1,288 @@
+import collections
+import json
+import os
+import threading
+
+from .batch import BatchResult, amap_concurrently, map_concurrently
+
+
+class UploadRecord(
+    collections.namedtuple(
+        "UploadRecord", ("source", "id", "deletehash", "link")
+    )
+):
+    """
+    Image uploaded by `bulk_upload()`.
+
+    Attributes:
+        source (str): Path of the uploaded file.
+        id (str): ID of the image.
+        deletehash (str): Hash to delete or modify the image with.
+        link (str): Direct link to the image.
+    """
+
+    __slots__ = ()
+
+
+class AlbumRecord(
+    collections.namedtuple("AlbumRecord", ("id", "deletehash", "images"))
+):
+    """
+    Album assembled by `bulk_upload()`.
+
+    Attributes:
+        id (str): ID of the album.
+        deletehash (str): Hash to modify the album with, `None` for
+                          existing albums of the account.
+        images (tuple): IDs of the images added to the album.
+    """
+
+    __slots__ = ()
+
+
+class BulkUploadResult(
+    collections.namedtuple("BulkUploadResult", ("uploads", "album"))
+):
+    """
+    Outcome of `bulk_upload()`.
+
+    Attributes:
+        uploads (list): `BatchResult` of every file in the input order,
+                        its `result` is an `UploadRecord`.
+        album (AlbumRecord): Album the images were added to, `None` if
+                             no album was requested or some uploads
+                             failed.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return all(upload.ok for upload in self.uploads)
+
+
+class UploadManifest:
+    """
+    Append-only journal of a bulk upload, used to resume it.
+
+    Every uploaded file and every change of the album is written as
+    a JSON line and flushed to disk at once, so after a crash a new run
+    with the same manifest skips the files which have been uploaded
+    already and extends the same album.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize manifest, loading the records of previous runs.
+
+        Args:
+            path (str): Path of the manifest file, created if missing.
+        """
+        self.path = os.fspath(path)
+        self.uploads = dict()
+        self.album = None
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A line torn by a crash.
+                        continue
+                    self._load(record)
+
+    def _load(self, record):
+        kind = record.pop("type", None)
+        if kind == "image":
+            upload = UploadRecord(**record)
+            self.uploads[upload.source] = upload
+        elif kind == "album":
+            record["images"] = tuple(record["images"])
+            self.album = AlbumRecord(**record)
+
+    def _append(self, kind, record):
+        line = json.dumps(dict(record._asdict(), type=kind))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+        self._load(dict(record._asdict(), type=kind))
+
+    def add_upload(self, upload):
+        self._append("image", upload)
+
+    def set_album(self, album):
+        self._append("album", album)
+
+
+class _BulkUpload:
+    """State of a `bulk_upload()` run shared by both variants."""
+
+    def __init__(self, api, sources, album, create_album, options, manifest):
+        if isinstance(manifest, (str, os.PathLike)):
+            manifest = UploadManifest(manifest)
+        self.api = api
+        self.manifest = manifest
+        self.options = options or {}
+        self.sources = [os.fspath(source) for source in sources]
+        done = manifest.uploads if manifest is not None else {}
+        self.uploads = [
+            BatchResult(index, source, done[source], None)
+            if source in done
+            else None
+            for index, source in enumerate(self.sources)
+        ]
+        self.pending = [
+            index
+            for index, upload in enumerate(self.uploads)
+            if upload is None
+        ]
+
+        if manifest is not None and manifest.album is not None:
+            self.album = manifest.album
+        elif album is not None:
+            # Albums are modified by their deletehash anonymously.
+            anonymous = api.access_token is None
+            self.album = AlbumRecord(album, album if anonymous else None, ())
+        else:
+            self.album = None
+        self.create_album = create_album
+
+    def upload_args(self):
+        return [self.sources[index] for index in self.pending]
+
+    def record(self, result):
+        """Store the outcome of an upload as soon as it's known."""
+        index = self.pending[result.index]
+        if result.ok:
+            data = result.result.data
+            upload = UploadRecord(
+                result.item, data.id, data.deletehash, data.link
+            )
+            if self.manifest is not None:
+                self.manifest.add_upload(upload)
+            result = result._replace(result=upload)
+        self.uploads[index] = result._replace(index=index)
+
+    def album_call(self):
+        """
+        Next call assembling the album, `None` if there's none.
+
+        The album is only touched once every file has been uploaded,
+        so its images keep the order of `sources`.
+
+        Returns:
+            (tuple): Endpoint method, its positional and keyword
+                     arguments.
+        """
+        if self.album is None and not self.create_album:
+            return None
+        if not all(upload.ok for upload in self.uploads):
+            return None
+
+        added = set(self.album.images) if self.album is not None else ()
+        self.added = [
+            upload.result
+            for upload in self.uploads
+            if upload.result.id not in added
+        ]
+        if self.album is not None and not self.added:
+            return None
+
+        # Anonymous albums and images are identified by delete hashes.
+        if self.api.access_token is not None:
+            images = dict(image_ids=[image.id for image in self.added])
+            album_hash = self.album.id if self.album is not None else None
+        else:
+            images = dict(
+                delete_hashes=[image.deletehash for image in self.added]
+            )
+            album_hash = (
+                self.album.deletehash if self.album is not None else None
+            )
+
+        if self.album is None:
+            return self.api.album.create, (), dict(images, **self.options)
+        return self.api.album.add, (album_hash,), images
+
+    def album_done(self, response):
+        ids = tuple(image.id for image in self.added)
+        if self.album is None:
+            self.album = AlbumRecord(
+                response.data.id, response.data.deletehash, ids
+            )
+        else:
+            self.album = self.album._replace(images=self.album.images + ids)
+        if self.manifest is not None:
+            self.manifest.set_album(self.album)
+
+    def result(self):
+        ok = all(upload.ok for upload in self.uploads)
+        return BulkUploadResult(self.uploads, self.album if ok else None)
+
+
+def bulk_upload(
+    api,
+    sources,
+    album=None,
+    create_album=False,
+    album_options=None,
+    manifest=None,
+    max_workers=4,
+):
+    """
+    Upload many files concurrently and assemble them into an album.
+
+    See `ImgurAPI.bulk_upload()`.
+    """
+    run = _BulkUpload(
+        api, sources, album, create_album, album_options, manifest
+    )
+    for result in map_concurrently(
+        api.image.upload,
+        run.upload_args(),
+        max_workers=max_workers,
+        ordered=False,
+    ):
+        run.record(result)
+
+    call = run.album_call()
+    if call is not None:
+        method, args, kwargs = call
+        run.album_done(method(*args, **kwargs))
+    return run.result()
+
+
+async def abulk_upload(
+    api,
+    sources,
+    album=None,
+    create_album=False,
+    album_options=None,
+    manifest=None,
+    max_in_flight=4,
+):
+    """
+    Asynchronous counterpart of `bulk_upload()`.
+
+    See `AsyncImgurAPI.bulk_upload()`.
+    """
+    run = _BulkUpload(
+        api, sources, album, create_album, album_options, manifest
+    )
+    async for result in amap_concurrently(
+        api.image.upload,
+        run.upload_args(),
+        max_in_flight=max_in_flight,
+        ordered=False,
+    ):
+        run.record(result)
+
+    call = run.album_call()
+    if call is not None:
+        method, args, kwargs = call
+        run.album_done(await method(*args, **kwargs))
+    return run.result()
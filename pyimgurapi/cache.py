@@ -0,0 +1,393 @@
+import collections
+import hashlib
+import threading
+import time
+
+
+def make_cache_key(method, url, authorization=None, fields=None):
+    """
+    Build a cache key out of a request.
+
+    The authorization header is hashed, so that responses of different
+    users never mix while tokens don't end up in the cache. Responses
+    projected to different `fields` get different keys.
+    """
+    identity = hashlib.sha256((authorization or "").encode()).hexdigest()
+    key = f"{method.upper()} {url} {identity[:16]}"
+    if fields is not None:
+        key = f"{key} fields={','.join(sorted(fields))}"
+    return key
+
+
+IMAGE_RESOURCES = frozenset(("image", "album_image", "account_image"))
+IMAGE_LIST_RESOURCES = frozenset(("album_images", "account_images"))
+COMMENT_RESOURCES = frozenset(("comment", "comment_replies"))
+
+
+def _object_tags(kind, obj):
+    if isinstance(obj, dict):
+        for field in ("id", "deletehash"):
+            if obj.get(field) not in (None, ""):
+                yield f"{kind}:{obj[field]}"
+
+
+def dependency_tags(resource, value):
+    """
+    Tags of the objects a response contains, e.g. "image:3MvMVho".
+
+    A response depends on every object it contains: e.g. the images of
+    an album are tagged with the IDs (and delete hashes) of all the
+    listed images, so that updating any of them evicts the list.
+
+    Args:
+        resource (str): Name of the resource, e.g. "album_images".
+        value: Decoded JSON of the response.
+
+    Returns:
+        (set): Dependency tags.
+    """
+    data = value.get("data") if isinstance(value, dict) else None
+    tags = set()
+    if resource in IMAGE_RESOURCES:
+        tags.update(_object_tags("image", data))
+    elif resource in IMAGE_LIST_RESOURCES and isinstance(data, list):
+        for image in data:
+            tags.update(_object_tags("image", image))
+    elif resource == "account_image_ids" and isinstance(data, list):
+        tags.update(f"image:{image_id}" for image_id in data)
+    elif resource == "album" and isinstance(data, dict):
+        tags.update(_object_tags("album", data))
+        for image in data.get("images") or ():
+            tags.update(_object_tags("image", image))
+    elif resource in COMMENT_RESOURCES:
+        comments = data if isinstance(data, list) else [data]
+        while comments:
+            comment = comments.pop()
+            if isinstance(comment, dict):
+                tags.update(_object_tags("comment", comment))
+                comments.extend(comment.get("children") or ())
+    return tags
+
+
+class CacheStats(
+    collections.namedtuple(
+        "CacheStats",
+        ("hits", "misses", "evictions", "revalidations", "entries", "size"),
+    )
+):
+    """
+    Snapshot of cache counters.
+
+    Attributes:
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups which had to go to the network.
+        evictions (int): Entries dropped to fit the size bounds.
+        revalidations (int): Stale entries refreshed by a
+                             "304 Not Modified" response.
+        entries (int): Entries currently stored.
+        size (int): Bytes of response bodies currently stored.
+    """
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheEntry:
+    """
+    Cached response.
+
+    Attributes:
+        body (bytes): Raw response body.
+        value: Decoded JSON of the body.
+        resource (str): Name of the resource, e.g. "image".
+        stored_at (float): Unix timestamp when the entry was stored.
+        expires_at (float): Unix timestamp when the entry goes stale.
+        etag (str): `ETag` header of the response, if any.
+        last_modified (str): `Last-Modified` header of the response,
+                             if any.
+        tags (frozenset): Tags of the objects the response depends on,
+                          see `BaseCache.invalidate()`.
+    """
+
+    __slots__ = (
+        "body",
+        "value",
+        "resource",
+        "stored_at",
+        "expires_at",
+        "etag",
+        "last_modified",
+        "tags",
+    )
+
+    def __init__(
+        self,
+        body,
+        value,
+        resource,
+        stored_at,
+        expires_at,
+        etag=None,
+        last_modified=None,
+        tags=(),
+    ):
+        self.body = body
+        self.value = value
+        self.resource = resource
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.tags = frozenset(tags)
+
+    @property
+    def size(self):
+        return len(self.body)
+
+    def is_fresh(self, now=None):
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def can_revalidate(self):
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self):
+        """Headers making a request conditional on the entry's data."""
+        headers = dict()
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def update_validators(self, headers):
+        if headers is None:
+            return
+        self.etag = headers.get("ETag", self.etag)
+        self.last_modified = headers.get("Last-Modified", self.last_modified)
+
+
+class BaseCache:
+    """
+    Base class of the response caches.
+
+    Subclasses implement `get()`, `set()`, `refresh()`, `delete()`,
+    `invalidate()`, `clear()` and `stats()`.
+
+    Every entry may be stored with dependency tags like "image:<id>" or
+    "album:<id>". Mutating endpoints (e.g. `Image.update()`) evict all
+    the entries tagged with the objects they change, so long TTLs don't
+    make the cache serve outdated objects.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None, ttl=300, ttls=None):
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries (int, optional): Upper bound of stored entries.
+                Defaults to 1024.
+            max_bytes (int, optional): Upper bound of the total size of
+                stored bodies. Defaults to no limit.
+            ttl (float, optional): Default seconds an entry stays
+                fresh. Defaults to 300.
+            ttls (dict, optional): Per-resource TTLs overriding the
+                default one, e.g. `{"album_images": 60}`. A zero TTL
+                disables caching of the resource.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+        self._revalidations = 0
+
+    def ttl_for(self, resource):
+        return self.ttls.get(resource, self.ttl)
+
+    def is_cacheable(self, body, resource):
+        ttl = self.ttl_for(resource)
+        return bool(ttl) and (
+            self.max_bytes is None or len(body) <= self.max_bytes
+        )
+
+
+class ResponseCache(BaseCache):
+    """
+    Thread-safe in-memory LRU cache of GET responses with TTLs.
+
+    Entries are keyed by request method, URL and authorization, and
+    bounded both by count and by total size of the bodies. Every
+    resource (e.g. "image", "album_images") may have its own TTL.
+
+    Stale entries carrying an `ETag` or `Last-Modified` validator are
+    kept until evicted, so that they can be revalidated with
+    a conditional request instead of being downloaded again.
+
+    Notes:
+        - Cached responses are shared between the callers, treat them
+        as read-only.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._entries = collections.OrderedDict()
+        self._tagged = collections.defaultdict(set)
+        self._size = 0
+
+    def _pop(self, key):
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+        for tag in entry.tags:
+            keys = self._tagged[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tagged[tag]
+        return entry
+
+    def get(self, key, stale=False, decode=None):
+        """
+        Look up a fresh entry and count a hit or a miss.
+
+        Args:
+            key (str): Cache key of the request.
+            stale (bool, optional): Return a stale entry which can be
+                revalidated instead of `None`. Defaults to False.
+            decode (callable, optional): Unused, entries keep their
+                decoded JSON.
+
+        Returns:
+            (CacheEntry): Entry stored under `key`, `None` if there's
+                          no (fresh) one.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if not entry.is_fresh():
+                self._misses += 1
+                if not entry.can_revalidate():
+                    self._pop(key)
+                    return None
+                return entry if stale else None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def set(self, key, body, value, resource=None, headers=None, tags=()):
+        """
+        Store a response, evicting least recently used entries.
+
+        Args:
+            key (str): Cache key of the request.
+            body (bytes): Raw response body.
+            value: Decoded JSON of the body.
+            resource (str, optional): Name of the resource, selects
+                the TTL.
+            headers (Message, optional): Response headers to take the
+                validators from.
+            tags (iterable, optional): Dependency tags of the response.
+
+        Returns:
+            (CacheEntry): Stored entry, `None` if the response isn't
+                          cacheable.
+        """
+        if not self.is_cacheable(body, resource):
+            return None
+        now = time.time()
+        entry = CacheEntry(
+            body,
+            value,
+            resource,
+            now,
+            now + self.ttl_for(resource),
+            tags=tags,
+        )
+        entry.update_validators(headers)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            for tag in entry.tags:
+                self._tagged[tag].add(key)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._size > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+                self._evictions += 1
+        return entry
+
+    def refresh(self, key, headers=None):
+        """
+        Mark an entry fresh again after a "304 Not Modified" response.
+
+        Args:
+            key (str): Cache key of the request.
+            headers (Message, optional): Headers of the 304 response,
+                which may carry new validators.
+
+        Returns:
+            (bool): False if the entry has been evicted meanwhile.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            now = time.time()
+            entry.stored_at = now
+            entry.expires_at = now + self.ttl_for(entry.resource)
+            entry.update_validators(headers)
+            self._entries.move_to_end(key)
+            self._revalidations += 1
+            return True
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+    def invalidate(self, tags):
+        """
+        Evict every entry depending on any of `tags`.
+
+        Returns:
+            (int): Number of evicted entries.
+        """
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self._tagged.get(tag, ()))
+            for key in keys:
+                self._pop(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tagged.clear()
+            self._size = 0
+
+    def stats(self):
+        """Snapshot of the counters as `CacheStats`."""
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._revalidations,
+                len(self._entries),
+                self._size,
+            )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+from .exceptions import PyImgurApiTimeout
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls made by several threads.
+
+    The first caller of `do()` for a key (the leader) makes the call,
+    callers arriving with the same key while it's in flight wait for
+    and share its outcome: the result or the exception.
+
+    Attributes:
+        coalesced (int): Calls served by another caller's call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = dict()
+        self.coalesced = 0
+
+    def do(self, key, func, deadline=None):
+        """
+        Call `func` unless an identical call is already in flight.
+
+        Args:
+            key (str): Identity of the call, e.g. a cache key.
+            func (callable): Function without arguments making the call.
+            deadline (Deadline, optional): Deadline of waiting for the
+                in-flight call.
+
+        Returns:
+            Result of `func`, possibly returned by another thread.
+
+        Raises:
+            PyImgurApiTimeout: If the deadline passes while waiting.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            timeout = deadline.remaining() if deadline is not None else None
+            if not call.done.wait(timeout):
+                raise PyImgurApiTimeout("Deadline exceeded")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Asynchronous counterpart of `SingleFlight` for asyncio tasks.
+
+    The call runs in a task of its own, so cancelling one of the
+    waiting callers (the first one included) doesn't affect the others.
+
+    Attributes:
+        coalesced (int): Calls served by another caller's call.
+    """
+
+    def __init__(self):
+        self._calls = dict()
+        self.coalesced = 0
+
+    async def do(self, key, func, deadline=None):
+        """
+        Await `func()` unless an identical call is already in flight.
+
+        Args:
+            key (str): Identity of the call, e.g. a cache key.
+            func (callable): Coroutine function without arguments
+                making the call.
+            deadline (Deadline, optional): Deadline of waiting for the
+                in-flight call.
+
+        Returns:
+            Result of `func()`, possibly awaited by another task.
+
+        Raises:
+            PyImgurApiTimeout: If the deadline passes while waiting.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        timeout = deadline.remaining() if deadline is not None else None
+        # Unlike `asyncio.wait_for()`, `asyncio.wait()` never cancels
+        # the shared task.
+        done, _ = await asyncio.wait((task,), timeout=timeout)
+        if not done:
+            raise PyImgurApiTimeout("Deadline exceeded")
+        return task.result()
@@ -0,0 +1,132 @@
+import functools
+import json
+
+
+class JSONCodec:
+    """Codec based on the stdlib `json` module."""
+
+    name = "json"
+
+    def loads(self, data):
+        """
+        Decode a JSON document.
+
+        Args:
+            data (bytes|str): JSON document.
+
+        Returns:
+            Decoded value.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj, indent=False):
+        """
+        Encode a value as JSON.
+
+        Args:
+            obj: Value to encode.
+            indent (bool, optional): Indent nested values by two spaces,
+                                     for humans. Defaults to False.
+
+        Returns:
+            (bytes): UTF-8 encoded JSON document.
+        """
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec based on `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self.loads = orjson.loads
+
+    def dumps(self, obj, indent=False):
+        option = self._orjson.OPT_INDENT_2 if indent else 0
+        return self._orjson.dumps(obj, option=option)
+
+
+class SimdjsonCodec(JSONCodec):
+    """Codec decoding with `pysimdjson`, encoding with the stdlib."""
+
+    name = "simdjson"
+
+    def __init__(self):
+        import simdjson
+
+        self.loads = simdjson.loads
+
+
+class UjsonCodec(JSONCodec):
+    """Codec based on `ujson`."""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+        self.loads = ujson.loads
+
+    def dumps(self, obj, indent=False):
+        return self._ujson.dumps(
+            obj,
+            indent=2 if indent else 0,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+        ).encode("utf-8")
+
+
+# In the order of preference.
+CODECS = {
+    codec.name: codec
+    for codec in (OrjsonCodec, SimdjsonCodec, UjsonCodec, JSONCodec)
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _codec_by_name(name):
+    if name == "auto":
+        for codec in CODECS.values():
+            try:
+                return codec()
+            except ImportError:
+                continue
+    if name not in CODECS:
+        raise ValueError(
+            f"Unknown JSON codec: {name!r}; "
+            f"expected 'auto' or one of {sorted(CODECS)}"
+        )
+    return CODECS[name]()
+
+
+def get_codec(codec=None):
+    """
+    Resolve a JSON codec.
+
+    Args:
+        codec (str|JSONCodec, optional): Name of a backend (`"json"`,
+            `"orjson"`, `"simdjson"` or `"ujson"`), a codec object,
+            or `"auto"` for the fastest installed backend.
+            Defaults to `"auto"`.
+
+    Returns:
+        (JSONCodec): Codec, shared by the callers asking for the same
+                     backend.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend isn't installed.
+    """
+    if codec is None:
+        codec = "auto"
+    if isinstance(codec, str):
+        return _codec_by_name(codec)
+    return codec
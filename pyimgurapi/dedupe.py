@@ -0,0 +1,160 @@
+import collections
+import hashlib
+import json
+import os
+import threading
+
+from .utils import DynamicResponseData
+
+
+class IndexEntry(
+    collections.namedtuple("IndexEntry", ("id", "deletehash", "link"))
+):
+    """
+    Image already uploaded with some content.
+
+    Attributes:
+        id (str): ID of the image.
+        deletehash (str): Hash to delete or modify the image with.
+        link (str): Direct link to the image.
+    """
+
+    __slots__ = ()
+
+    def as_response(self):
+        """Response of an upload which would have created the image."""
+        return DynamicResponseData(
+            {"data": self._asdict(), "success": True, "status": 200}
+        )
+
+
+def file_digest(file, algorithm="sha256"):
+    """
+    Hash the content of a form file without reading it into memory.
+
+    `hashlib` releases the GIL while hashing big chunks, so files are
+    hashed in parallel by concurrent uploads.
+
+    Args:
+        file (File): File part of an upload form.
+        algorithm (str, optional): Name of a `hashlib` algorithm.
+                                   Defaults to "sha256".
+
+    Returns:
+        (str): Hexadecimal digest of the content.
+    """
+    digest = hashlib.new(algorithm)
+    for chunk in file.iter_chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DedupeIndex:
+    """
+    Index of uploaded images by the hash of their content.
+
+    `Image.upload()` looks the content up before uploading it: if the
+    same bytes have been uploaded already, the existing image is
+    returned without a network request, saving both bandwidth and the
+    POST budget of the rate limiter.
+
+    The index is kept in memory and, if `path` is given, journaled to
+    a file, so it's shared by later runs. Deleting an image through
+    the API removes it from the index.
+
+    Notes:
+        - Images uploaded anonymously and by an account aren't
+        interchangeable, use an index per account.
+
+    Attributes:
+        hits (int): Uploads served from the index.
+    """
+
+    def __init__(self, path=None, algorithm="sha256"):
+        """
+        Initialize index, loading the journal if there's one.
+
+        Args:
+            path (str|PathLike, optional): Journal file, created if
+                missing. Defaults to an index kept in memory only.
+            algorithm (str, optional): Name of the `hashlib` algorithm
+                hashing the content. Defaults to "sha256".
+        """
+        self.path = os.fspath(path) if path is not None else None
+        self.algorithm = algorithm
+        self.hits = 0
+        self._entries = dict()
+        self._lock = threading.Lock()
+
+        if self.path is not None and os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        digest, entry = json.loads(line)
+                    except ValueError:
+                        # A line torn by a crash.
+                        continue
+                    if entry is None:
+                        self._entries.pop(digest, None)
+                    else:
+                        self._entries[digest] = IndexEntry(*entry)
+
+    def _journal(self, records):
+        if self.path is None or not records:
+            return
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.writelines(json.dumps(record) + "\n" for record in records)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def digest(self, file):
+        """Digest of the content of form file `file`."""
+        return file_digest(file, self.algorithm)
+
+    def get(self, digest):
+        """
+        Look an image up by the digest of its content.
+
+        Returns:
+            (IndexEntry): The image, `None` if it isn't indexed.
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self.hits += 1
+            return entry
+
+    def add(self, digest, entry):
+        """Index the image `entry` uploaded with content `digest`."""
+        entry = IndexEntry(*entry)
+        with self._lock:
+            self._entries[digest] = entry
+            self._journal([(digest, entry)])
+
+    def discard(self, image_hashes):
+        """
+        Remove images from the index.
+
+        Args:
+            image_hashes (iterable): IDs or deletehashes of the images.
+
+        Returns:
+            (int): Number of removed entries.
+        """
+        image_hashes = set(image_hashes)
+        with self._lock:
+            removed = [
+                digest
+                for digest, entry in self._entries.items()
+                if entry.id in image_hashes or entry.deletehash in image_hashes
+            ]
+            for digest in removed:
+                del self._entries[digest]
+            self._journal([(digest, None) for digest in removed])
+        return len(removed)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, digest):
+        return digest in self._entries
@@ -61,7 +61,7 @@ class Account(BaseEndpoint):
             url_path, data=data, headers=headers, method="POST"
         )
 
-    def base(self, username="me"):
+    def base(self, username="me", fields=None):
         """
         Fetch base information about account.
 
@@ -74,6 +74,9 @@ class Account(BaseEndpoint):
                                       meaning the current account
                                       (supposing the application works
                                       in authorized mode).
+            fields (iterable, optional): Fields of the account to keep,
+                the others are dropped as the response is parsed.
+                Defaults to all of them.
 
         Returns:
             (DynamicResponseData): Response from Imgur.
@@ -119,9 +122,13 @@ class Account(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path, headers=headers, resource="account", fields=fields
+        )
 
-    def gallery_favorites(self, username="me", page=None, sort=None):
+    def gallery_favorites(
+        self, username="me", page=None, sort=None, fields=None
+    ):
         url_path = f"/{self.api_version}/account/{username}/gallery_favorites"
 
         if page is not None:
@@ -132,9 +139,42 @@ class Account(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="account_gallery_favorites",
+            fields=fields,
+        )
+
+    def iter_gallery_favorites(self, username="me", sort=None, prefetch=True):
+        """
+        Iterate over the gallery favorites of an account.
+
+        Pages are fetched lazily, the next one in the background while
+        the current one is being consumed, until the last page.
+
+        Args:
+            username (str, optional): Account ID. Defaults to "me".
+            sort (str, optional): Sorting of the favorites.
+            prefetch (bool, optional): Fetch the next page in the
+                                       background. Defaults to True.
+
+        Returns:
+            (Iterator[DynamicResponseData]): Lazy iterator over the
+                favorites; an asynchronous one for `AsyncImgurAPI`.
 
-    def favorites(self, username="me", page=None, favorite_sort=None):
+        Examples:
+        >>> for item in api.account.iter_gallery_favorites():
+        ...     print(item.id)
+        """
+        return self.paginate(
+            lambda page: self.gallery_favorites(username, page, sort),
+            prefetch=prefetch,
+        )
+
+    def favorites(
+        self, username="me", page=None, favorite_sort=None, fields=None
+    ):
         url_path = f"/{self.api_version}/account/{username}/favorites"
 
         if page is not None:
@@ -145,9 +185,29 @@ class Account(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="account_favorites",
+            fields=fields,
+        )
+
+    def iter_favorites(self, username="me", favorite_sort=None, prefetch=True):
+        """
+        Iterate over the favorites of an account.
+
+        See `iter_gallery_favorites()`.
 
-    def images(self, username="me", page=None):
+        Returns:
+            (Iterator[DynamicResponseData]): Lazy iterator over the
+                favorites; an asynchronous one for `AsyncImgurAPI`.
+        """
+        return self.paginate(
+            lambda page: self.favorites(username, page, favorite_sort),
+            prefetch=prefetch,
+        )
+
+    def images(self, username="me", page=None, fields=None):
         url_path = f"/{self.api_version}/account/{username}/images"
 
         if page is not None:
@@ -155,31 +215,155 @@ class Account(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="account_images",
+            fields=fields,
+            streamable=True,
+        )
+
+    def iter_images(
+        self, username="me", prefetch=True, model=None, fields=None
+    ):
+        """
+        Iterate over the images of an account.
+
+        See `iter_gallery_favorites()`.
+
+        Args:
+            username (str, optional): Account ID. Defaults to "me".
+            prefetch (bool, optional): Fetch the next page in the
+                                       background. Defaults to True.
+            model (type, optional): Compact model to decode the images
+                into, e.g. `models.Image`. Defaults to None.
+            fields (iterable, optional): Fields of the images to keep,
+                the others are dropped as the response is parsed.
+                Defaults to all of them.
+
+        Returns:
+            (Iterator[DynamicResponseData]): Lazy iterator over the
+                images; an asynchronous one for `AsyncImgurAPI`.
+
+        Examples:
+        >>> for image in api.account.iter_images():
+        ...     print(image.id, image.link)
+        >>> async for image in async_api.account.iter_images():
+        ...     print(image.id, image.link)
+        """
+        # Pages are parsed whole, even with `stream=True`.
+        endpoint = self.with_options(stream=False)
+        return self.paginate(
+            lambda page: endpoint.images(username, page, fields=fields),
+            prefetch=prefetch,
+            model=model,
+        )
+
+    def all_images(
+        self, username="me", max_workers=8, model=None, fields=None
+    ):
+        """
+        Fetch all images of an account with concurrent page requests.
+
+        The number of pages is worked out from `image_count()`, then
+        the pages are fetched concurrently, paced by the rate limiter,
+        and merged in order. Images repeated because the listing has
+        changed during the scan are dropped.
+
+        Args:
+            username (str, optional): Account ID. Defaults to "me".
+            max_workers (int, optional): Upper bound of concurrently
+                                         fetched pages. Defaults to 8.
+            model (type, optional): Compact model to decode the images
+                into, e.g. `models.Image`, which keeps a big inventory
+                small in memory. Defaults to None.
+            fields (iterable, optional): Fields of the images to keep;
+                `id` is always kept, to drop repeated images. Defaults
+                to all of them.
+
+        Returns:
+            (list[DynamicResponseData]): Images of the account; an
+                awaitable of them for `AsyncImgurAPI`.
+
+        Examples:
+        >>> images = api.account.all_images(max_workers=16)
+        >>> len(images)
+        100000
+        """
+        if fields is not None:
+            fields = frozenset(fields).union(("id",))
+        endpoint = self.with_options(stream=False)
+        return self.gather(
+            lambda page: endpoint.images(username, page, fields=fields),
+            lambda: self.image_count(username),
+            max_workers=max_workers,
+            key=lambda image: image.id,
+            model=model,
+        )
 
-    def image(self, image_hash, username="me"):
+    def image(self, image_hash, username="me", fields=None):
         url_path = f"/{self.api_version}/account/{username}/image/{image_hash}"
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="account_image",
+            tags=[f"image:{image_hash}"],
+            fields=fields,
+        )
 
     def image_ids(self, username="me", page=None):
-        url_path = f"/{self.api_version}/account/{username}/images/ids/{page}"
+        url_path = f"/{self.api_version}/account/{username}/images/ids"
 
         if page is not None:
             url_path = urljoin(f"{url_path}/", str(page))
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path, headers=headers, resource="account_image_ids"
+        )
+
+    def iter_image_ids(self, username="me", prefetch=True):
+        """
+        Iterate over the IDs of the images of an account.
+
+        See `iter_gallery_favorites()`.
+
+        Returns:
+            (Iterator[str]): Lazy iterator over the IDs; an
+                             asynchronous one for `AsyncImgurAPI`.
+        """
+        return self.paginate(
+            lambda page: self.image_ids(username, page), prefetch=prefetch
+        )
+
+    def all_image_ids(self, username="me", max_workers=8):
+        """
+        Fetch all image IDs of an account with concurrent page requests.
+
+        See `all_images()`.
+
+        Returns:
+            (list[str]): IDs of the images of the account; an awaitable
+                         of them for `AsyncImgurAPI`.
+        """
+        return self.gather(
+            lambda page: self.image_ids(username, page),
+            lambda: self.image_count(username),
+            max_workers=max_workers,
+        )
 
     def image_count(self, username="me"):
         url_path = f"/{self.api_version}/account/{username}/images/count"
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path, headers=headers, resource="account_image_count"
+        )
 
     def image_delete(self, delete_hash, username="me"):
         url_path = (
@@ -188,7 +372,12 @@ class Account(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers, method="DELETE")
+        return self.make_request(
+            url_path,
+            headers=headers,
+            method="DELETE",
+            tags=[f"image:{delete_hash}"],
+        )
 
     def replies(self, username="me"):
         url_path = (
@@ -197,4 +386,6 @@ class Account(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path, headers=headers, resource="account_replies"
+        )
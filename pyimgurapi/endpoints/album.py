@@ -3,26 +3,45 @@ from ..form_factories import get_album_form
 
 
 class Album(BaseEndpoint):
-    def get_album(self, album_hash):
+    def get_album(self, album_hash, fields=None):
         url_path = f"/{self.api_version}/album/{album_hash}"
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="album",
+            tags=[f"album:{album_hash}"],
+            fields=fields,
+        )
 
-    def album_images(self, album_hash):
+    def album_images(self, album_hash, fields=None):
         url_path = f"/{self.api_version}/album/{album_hash}/images"
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="album_images",
+            tags=[f"album:{album_hash}"],
+            fields=fields,
+            streamable=True,
+        )
 
-    def album_image(self, album_hash, image_hash):
+    def album_image(self, album_hash, image_hash, fields=None):
         url_path = f"/{self.api_version}/album/{album_hash}/image/{image_hash}"
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="album_image",
+            tags=[f"album:{album_hash}", f"image:{image_hash}"],
+            fields=fields,
+        )
 
     def create(
         self,
@@ -49,7 +68,10 @@ class Album(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form) or None, headers=headers, method="POST"
+            url_path,
+            data=form.payload() or None,
+            headers=headers,
+            method="POST",
         )
 
     def update(
@@ -78,7 +100,11 @@ class Album(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form) or None, headers=headers, method="POST"
+            url_path,
+            data=form.payload() or None,
+            headers=headers,
+            method="POST",
+            tags=[f"album:{album_hash}"],
         )
 
     def delete(self, album_hash):
@@ -89,14 +115,24 @@ class Album(BaseEndpoint):
         }
         headers.update(**self.get_headers())
 
-        return self.make_request(url_path, headers=headers, method="DELETE")
+        return self.make_request(
+            url_path,
+            headers=headers,
+            method="DELETE",
+            tags=[f"album:{album_hash}"],
+        )
 
     def favorite(self, album_hash):
         url_path = f"/{self.api_version}/album/{album_hash}/favorite"
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers, method="POST")
+        return self.make_request(
+            url_path,
+            headers=headers,
+            method="POST",
+            tags=[f"album:{album_hash}"],
+        )
 
     def set_images(self, album_hash, image_ids=None, delete_hashes=None):
         url_path = f"/{self.api_version}/album/{album_hash}"
@@ -106,7 +142,11 @@ class Album(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form) or None, headers=headers, method="POST"
+            url_path,
+            data=form.payload() or None,
+            headers=headers,
+            method="POST",
+            tags=[f"album:{album_hash}"],
         )
 
     def add(self, album_hash, image_ids=None, delete_hashes=None):
@@ -117,7 +157,11 @@ class Album(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form) or None, headers=headers, method="POST"
+            url_path,
+            data=form.payload() or None,
+            headers=headers,
+            method="POST",
+            tags=[f"album:{album_hash}"],
         )
 
     def remove_images(self, album_hash, image_ids):
@@ -128,7 +172,11 @@ class Album(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form) or None, headers=headers, method="POST"
+            url_path,
+            data=form.payload() or None,
+            headers=headers,
+            method="POST",
+            tags=[f"album:{album_hash}"],
         )
 
     def __call__(self, album_hash):
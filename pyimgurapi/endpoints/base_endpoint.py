@@ -1,29 +1,147 @@
-import json
+import copy
+import functools
+import http.client
+from http import HTTPStatus
 import logging
+import time
 import urllib.error
 import urllib.request
 from urllib.parse import urljoin
 
-from ..exceptions import HTTP_CODES_ERRORS_MAP
-from ..utils import DynamicResponseData
+from ..cache import dependency_tags, make_cache_key
+from ..codec import get_codec
+from ..exceptions import HTTP_CODES_ERRORS_MAP, PyImgurApiTimeout
+from ..pagination import gather_pages, iter_pages
+from ..streaming import iter_json_array
+from ..timeouts import Deadline, Timeout
+from ..utils import DynamicResponseData, MultipartForm, project_fields
 
 logger = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class PreparedCall:
+    """
+    Request of an endpoint call, built by `prepare_call()`.
+
+    Attributes:
+        response: Response known without a network call (a deduplicated
+                  upload or a fresh cached one), `None` otherwise.
+        request (urllib.request.Request): Request to send.
+        fields (frozenset): Fields of the response to keep.
+        stream (bool): Whether to stream the items of the response.
+        coalescing_key (tuple): Key sharing the network call with
+                                identical concurrent calls, `None` if
+                                it mustn't be shared.
+        store (Callable): Takes the response headers and raw body, and
+                          returns the response after caching it.
+    """
+
+    def __init__(self, response=None):
+        self.response = response
+        self.request = None
+        self.fields = None
+        self.stream = False
+        self.coalescing_key = None
+        self.store = None
+
 
 class BaseEndpoint:
     base_url = "https://api.imgur.com/"
     api_version = "3"
+    # Attributes which can be overridden with `with_options()`
+    request_options = (
+        "retry",
+        "timeout",
+        "deadline",
+        "cache",
+        "dedupe",
+        "lazy",
+        "raw",
+        "stream",
+        "codec",
+    )
 
-    def __init__(self, client_id=None, access_token=None):
+    def __init__(
+        self,
+        client_id=None,
+        access_token=None,
+        transport=None,
+        rate_limiter=None,
+        retry_policy=None,
+        timeout=None,
+        cache=None,
+        single_flight=None,
+        dedupe=None,
+        codec=None,
+    ):
         self.client_id = client_id
         self.access_token = access_token
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.cache = cache
+        self.single_flight = single_flight
+        self.dedupe = dedupe
+        self.codec = get_codec(codec)
+        self.retry = None
+        self.deadline = None
+        self.lazy = False
+        self.raw = False
+        self.stream = False
+
+    def with_options(self, **options):
+        """
+        Make a copy of the endpoint with some request options changed.
+
+        Args:
+            retry (bool, optional): True allows retrying
+                non-idempotent requests (e.g. `Image.upload()`), False
+                disables retries.
+            timeout (float|Timeout, optional): Timeouts of every call.
+            deadline (Deadline, optional): Deadline of every call, on
+                top of the one set with `with Deadline(...)`.
+            cache (ResponseCache, optional): Cache of GET responses,
+                `None` bypasses it.
+            dedupe (DedupeIndex, optional): Index of uploaded content,
+                `None` bypasses it.
+            lazy (bool, optional): Keep the raw body and decode it on
+                first access of the response.
+            raw (bool, optional): Return the raw response body
+                (bytes) without decoding it at all.
+            stream (bool, optional): Make `Album.album_images()`,
+                `Account.images()` and `Comment.replies()` return an
+                iterator over the items of their array, parsed one by
+                one as the body downloads. Such calls bypass the cache
+                and aren't coalesced.
+            codec (JSONCodec, optional): Codec of request and
+                response bodies, see `get_codec()`.
+
+        Returns:
+            (BaseEndpoint): New endpoint of the same class.
+
+        Examples:
+        >>> image = api.image.with_options(retry=True, timeout=120)
+        >>> with open("image.jpg", "rb") as file:
+        ...     response = image.upload(file, "image.jpg")
+        """
+        unknown = set(options).difference(self.request_options)
+        if unknown:
+            raise TypeError(f"Unknown request options: {sorted(unknown)}")
+        if "codec" in options:
+            options["codec"] = get_codec(options["codec"])
+        endpoint = copy.copy(self)
+        endpoint.__dict__.update(options)
+        return endpoint
 
     def get_headers(self, form=None):
         headers = dict()
 
-        if form is not None and bytes(form):
+        if form is not None and len(form):
             headers["Content-Type"] = form.get_content_type()
-            headers["Content-length"] = str(len(bytes(form)))
+            headers["Content-length"] = str(len(form))
 
         if self.access_token:
             headers["Authorization"] = f"Bearer {self.access_token}"
@@ -31,25 +149,25 @@ class BaseEndpoint:
             headers["Authorization"] = f"Client-ID {self.access_token}"
         return headers
 
-    def make_request(self, url_path, data=None, headers=None, method="GET"):
+    def build_request(self, url_path, data=None, headers=None, method="GET"):
         url = urljoin(self.base_url, url_path)
 
         request_object_params = dict()
         request_object_params.update(url=url)
         if isinstance(data, dict):
             try:
-                serialized_data = json.dumps(data).encode("utf-8")
+                serialized_data = self.codec.dumps(data)
             except TypeError:
                 logger.error(f"Invalid data passed: {data}")
                 raise
             request_object_params.update(data=serialized_data)
-        elif isinstance(data, bytes):
+        elif isinstance(data, (bytes, MultipartForm)):
             request_object_params.update(data=data)
         elif data is not None:
             raise TypeError(
                 f"Invalid type of `data` parameter: "
                 f"{data.__class__.__module__}.{data.__class__.__name__}; "
-                f"Expected bytes or dict."
+                f"Expected bytes, dict or MultipartForm."
             )
         request_object_params.update(method=method)
 
@@ -58,18 +176,465 @@ class BaseEndpoint:
         if isinstance(headers, dict):
             for header, value in headers.items():
                 request.add_header(header, value)
+        return request
+
+    @staticmethod
+    def raise_for_http_error(error):
+        if error.code in HTTP_CODES_ERRORS_MAP:
+            raise HTTP_CODES_ERRORS_MAP[error.code](
+                error.reason, headers=error.headers
+            ) from None
+        raise error
+
+    def decode(self, raw_response_data):
+        return self.codec.loads(raw_response_data)
+
+    def parse_response(self, raw_response_data):
+        json_response_data = self.decode(raw_response_data)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Re-encoding a large body is costly, skip it unless logged.
+            body = self.codec.dumps(json_response_data, indent=True)
+            logger.debug("Response body:\n%s", body.decode("utf-8"))
+
+        return DynamicResponseData(json_response_data)
+
+    def response_from(self, raw_response_data, value=None):
+        """
+        Response in the mode set with `with_options()`.
+
+        Args:
+            raw_response_data (bytes): Raw response body.
+            value: Decoded JSON of the body, if it's decoded already.
+
+        Returns:
+            (DynamicResponseData|bytes): The raw body with `raw`,
+                                         a lazily decoded response
+                                         with `lazy`.
+        """
+        if self.raw:
+            return raw_response_data
+        if value is not None:
+            return DynamicResponseData(value)
+        if self.lazy:
+            return DynamicResponseData.from_bytes(
+                raw_response_data, self.decode
+            )
+        return self.parse_response(raw_response_data)
+
+    def call_deadline(self):
+        """
+        Deadline of a call starting now, `None` if it's unlimited.
+
+        The earliest of the `total` timeout, the `deadline` option and
+        the deadline of the enclosing `with Deadline(...)` block.
+        """
+        timeout = Timeout.coerce(self.timeout)
+        return Deadline.earliest(
+            Deadline(timeout.total) if timeout.total is not None else None,
+            self.deadline,
+            Deadline.current(),
+        )
+
+    def send(self, request, deadline=None):
+        """Send `request` once, pacing it with the rate limiter."""
+        method = request.get_method()
+        timeout = Timeout.coerce(self.timeout)
+        if deadline is not None:
+            timeout = Timeout(*timeout.socket_timeouts(deadline))
+
+        if self.transport is not None:
+            urlopen = self.transport.urlopen
+            urlopen_params = dict(timeout=timeout)
+        else:
+            urlopen = urllib.request.urlopen
+            urlopen_params = dict()
+            # urllib applies a single timeout to connecting and reading.
+            timeouts = [t for t in timeout.socket_timeouts() if t is not None]
+            if timeouts:
+                urlopen_params.update(timeout=max(timeouts))
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, deadline=deadline)
 
         try:
-            response = urllib.request.urlopen(request)
+            response = urlopen(request, **urlopen_params)
         except urllib.error.HTTPError as e:
-            if e.code in HTTP_CODES_ERRORS_MAP:
-                raise HTTP_CODES_ERRORS_MAP[e.code](e.reason) from None
-            raise e
-        raw_response_data = response.read()
-        json_response_data = json.loads(raw_response_data.decode("utf-8"))
-
-        logger.debug(
-            f"Response body:\n{json.dumps(json_response_data, indent=2)}"
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(e.headers, status=e.code)
+            raise
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.headers)
+        return response
+
+    @staticmethod
+    def read_response(response, deadline=None):
+        """Read the whole body, giving up once `deadline` has passed."""
+        if deadline is None:
+            return response.read()
+        chunks = list()
+        while True:
+            deadline.check()
+            chunk = response.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+    @staticmethod
+    def is_not_modified(error):
+        return (
+            isinstance(error, urllib.error.HTTPError)
+            and error.code == HTTPStatus.NOT_MODIFIED
         )
 
-        return DynamicResponseData(json_response_data)
+    @staticmethod
+    def request_key(request, fields=None):
+        """Key identifying `request` for caching and coalescing."""
+        return make_cache_key(
+            request.get_method(),
+            request.full_url,
+            request.get_header("Authorization"),
+            fields=fields,
+        )
+
+    def cache_key(self, request, fields=None):
+        """Cache key of `request`, `None` if it mustn't be cached."""
+        if self.cache is None or request.get_method() != "GET":
+            return None
+        return self.request_key(request, fields)
+
+    def fetch(self, request, stream=False):
+        """
+        Send `request` and read the response body, retrying failures.
+
+        Args:
+            request (urllib.request.Request): Request to send.
+            stream (bool, optional): Return the response itself, its
+                body not read yet, instead of the raw body.
+
+        Returns:
+            (tuple): Response headers and raw response body, the body
+                     is `None` if the response is "304 Not Modified".
+        """
+        method = request.get_method()
+        deadline = self.call_deadline()
+        if self.retry_policy is not None:
+            self.retry_policy.record_request()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if deadline is not None:
+                deadline.check()
+            try:
+                response = self.send(request, deadline=deadline)
+                if stream:
+                    return response.headers, response
+                try:
+                    return (
+                        response.headers,
+                        self.read_response(response, deadline),
+                    )
+                finally:
+                    # Gives the connection back even if reading failed.
+                    response.close()
+            except (OSError, http.client.HTTPException) as e:
+                if self.is_not_modified(e):
+                    return e.headers, None
+                delay = self.retry_delay(e, attempt, method, deadline)
+            time.sleep(delay)
+
+    def retry_delay(self, error, attempt, method, deadline=None):
+        """
+        Delay before the next attempt of `fetch()`, after `error`.
+
+        Returns:
+            (float): Delay in seconds.
+
+        Raises:
+            PyImgurApiTimeout: If the deadline has passed, or will have
+                               before the next attempt.
+            Exception: `error`, or the matching `PyImgurApi*`
+                       exception, if it mustn't be retried.
+        """
+        if deadline is not None and deadline.expired:
+            raise PyImgurApiTimeout("Deadline exceeded") from error
+        delay = None
+        if self.retry_policy is not None:
+            delay = self.retry_policy.next_delay(
+                attempt, method, error, retry=self.retry
+            )
+        if delay is None:
+            if isinstance(error, urllib.error.HTTPError):
+                self.raise_for_http_error(error)
+            raise error
+        if deadline is not None and delay >= deadline.remaining():
+            raise PyImgurApiTimeout(
+                "Deadline exceeded before the next retry"
+            ) from error
+        return delay
+
+    def cached_response(self, request, fields=None):
+        """
+        Look `request` up in the cache.
+
+        A stale entry with validators makes `request` conditional, so
+        that the server may answer it with "304 Not Modified".
+
+        Returns:
+            (tuple): Cache key (`None` if the request isn't cacheable)
+                     and the cached entry (`None` if there's none).
+        """
+        cache_key = self.cache_key(request, fields)
+        if cache_key is None:
+            return None, None
+        entry = self.cache.get(cache_key, stale=True, decode=self.decode)
+        if entry is not None and not entry.is_fresh():
+            for header, value in entry.conditional_headers().items():
+                request.add_header(header, value)
+        return cache_key, entry
+
+    def store_response(
+        self,
+        cache_key,
+        entry,
+        headers,
+        raw_response_data,
+        resource=None,
+        tags=(),
+        digest=None,
+        fields=None,
+        array=("data",),
+    ):
+        """
+        Parse a fetched response and update the cache with it.
+
+        The body is decoded here only if the cache, the dedupe index or
+        a projection to `fields` needs it, otherwise as
+        `response_from()` does. A projected response is cached (and
+        returned in `raw` mode) re-encoded, without the dropped fields
+        of the items of `array` (or of the object there).
+
+        Returns:
+            (DynamicResponseData|bytes): Response, the cached one if
+                                         the server answered "304 Not
+                                         Modified".
+        """
+        if raw_response_data is None:
+            # Not modified: no body to download or parse.
+            self.cache.refresh(cache_key, headers)
+            return self.response_from(entry.body, entry.value)
+
+        value = None
+        indexed = digest is not None and self.dedupe is not None
+        if cache_key is not None or indexed or fields is not None:
+            value = self.parse_response(raw_response_data).as_dict()
+        if indexed:
+            data = value["data"]
+            self.dedupe.add(
+                digest, (data["id"], data["deletehash"], data.get("link"))
+            )
+        if cache_key is not None:
+            # Tagged before projecting, which may drop IDs.
+            tags = dependency_tags(resource, value).union(tags)
+        if fields is not None:
+            value = project_fields(value, fields, array)
+            if cache_key is not None or self.raw:
+                raw_response_data = self.codec.dumps(value)
+        if cache_key is not None:
+            self.cache.set(
+                cache_key,
+                raw_response_data,
+                value,
+                resource=resource,
+                headers=headers,
+                tags=tags,
+            )
+        return self.response_from(raw_response_data, value)
+
+    def deduplicated(self, digest):
+        """
+        Image uploaded earlier with content `digest`, if there's one.
+
+        Returns:
+            (DynamicResponseData): Response of the earlier upload,
+                                   `None` if the content is new.
+        """
+        if digest is None or self.dedupe is None:
+            return None
+        entry = self.dedupe.get(digest)
+        if entry is None:
+            return None
+        response_data = entry.as_response()
+        if self.raw:
+            return self.codec.dumps(response_data.as_dict())
+        return response_data
+
+    def invalidate(self, tags):
+        """Evict cached responses depending on any of `tags`."""
+        if self.cache is not None and tags:
+            self.cache.invalidate(tags)
+
+    def after_mutation(self, method, tags):
+        """Forget the state which a non-GET call may have changed."""
+        self.invalidate(tags)
+        if self.dedupe is not None and method == "DELETE":
+            self.dedupe.discard(
+                tag.partition(":")[2]
+                for tag in tags
+                if tag.startswith("image:")
+            )
+
+    def paginate(self, fetch_page, prefetch=True, model=None):
+        """
+        Iterate over the items of a paginated listing.
+
+        See `iter_pages()`.
+
+        Returns:
+            (Iterator): Lazy iterator over the items.
+        """
+        return iter_pages(fetch_page, prefetch=prefetch, model=model)
+
+    def gather(
+        self, fetch_page, fetch_count, max_workers=8, key=None, model=None
+    ):
+        """
+        Fetch all pages of a listing concurrently.
+
+        See `gather_pages()`.
+
+        Returns:
+            (list): Items of all pages.
+        """
+        return gather_pages(
+            fetch_page,
+            fetch_count,
+            max_workers=max_workers,
+            key=key,
+            model=model,
+        )
+
+    def stream_items(self, request, array=("data",), fields=None):
+        """
+        Send `request` and parse an array of the response as it's read.
+
+        See `iter_json_array()`.
+
+        Args:
+            request (urllib.request.Request): Request to send.
+            array (tuple, optional): Keys leading to the array.
+                                     Defaults to `("data",)`.
+            fields (frozenset, optional): Fields of the items to keep.
+
+        Returns:
+            (Iterator[DynamicResponseData]): Lazy iterator over the
+                                             items.
+        """
+        deadline = self.call_deadline()
+        _, response = self.fetch(request, stream=True)
+        return iter_json_array(
+            response, array, deadline=deadline, fields=fields
+        )
+
+    def prepare_call(
+        self,
+        url_path,
+        data=None,
+        headers=None,
+        method="GET",
+        resource=None,
+        tags=(),
+        digest=None,
+        array=("data",),
+        fields=None,
+        streamable=False,
+    ):
+        """
+        Steps of `make_request()` which come before the network call.
+
+        Returns:
+            (PreparedCall): The request and what's known about it.
+        """
+        call = PreparedCall(self.deduplicated(digest))
+        if call.response is not None:
+            return call
+
+        if fields is not None:
+            call.fields = fields = frozenset(fields)
+        call.request = self.build_request(
+            url_path, data=data, headers=headers, method=method
+        )
+        if self.stream and streamable:
+            call.stream = True
+            return call
+
+        cache_key, entry = self.cached_response(call.request, fields)
+        if entry is not None and entry.is_fresh():
+            call.response = self.response_from(entry.body, entry.value)
+            return call
+        if method == "GET" and self.single_flight is not None:
+            # Only callers expecting the same kind of response share it.
+            mode = "raw" if self.raw else "lazy" if self.lazy else "parsed"
+            request_key = self.request_key(call.request, fields)
+            call.coalescing_key = f"{request_key} {mode}"
+        call.store = functools.partial(
+            self.store_response,
+            cache_key,
+            entry,
+            resource=resource,
+            tags=tags,
+            digest=digest,
+            fields=fields,
+            array=array,
+        )
+        return call
+
+    def make_request(
+        self,
+        url_path,
+        data=None,
+        headers=None,
+        method="GET",
+        resource=None,
+        tags=(),
+        content=None,
+        array=("data",),
+        fields=None,
+        streamable=False,
+    ):
+        digest = None
+        if content is not None and self.dedupe is not None:
+            digest = self.dedupe.digest(content)
+        call = self.prepare_call(
+            url_path,
+            data,
+            headers,
+            method,
+            resource,
+            tags,
+            digest,
+            array,
+            fields,
+            streamable,
+        )
+        if call.response is not None:
+            return call.response
+        if call.stream:
+            return self.stream_items(call.request, array, call.fields)
+
+        def load():
+            return call.store(*self.fetch(call.request))
+
+        if method != "GET":
+            try:
+                return load()
+            finally:
+                # Even a failed mutation may have been applied.
+                self.after_mutation(method, tags)
+        if call.coalescing_key is None:
+            return load()
+        # Concurrent identical GETs share one network call.
+        return self.single_flight.do(
+            call.coalescing_key, load, deadline=self.call_deadline()
+        )
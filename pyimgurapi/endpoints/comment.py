@@ -1,9 +1,10 @@
 from .base_endpoint import BaseEndpoint
 from ..form_factories import get_comment_form, get_comment_report_form
+from ..threads import walk_thread
 
 
 class Comment(BaseEndpoint):
-    def get_comment(self, comment_id):
+    def get_comment(self, comment_id, fields=None):
         """
         Fetch info about comment.
 
@@ -12,6 +13,9 @@ class Comment(BaseEndpoint):
 
         Args:
             comment_id (str|int): Unique ID representing the comment.
+            fields (iterable, optional): Fields of the comment to keep,
+                the others are dropped as the response is parsed.
+                Defaults to all of them.
 
         Returns:
             (DynamicResponseData): Response from Imgur.
@@ -55,7 +59,13 @@ class Comment(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="comment",
+            tags=[f"comment:{comment_id}"],
+            fields=fields,
+        )
 
     def create(self, image_id, comment):
         """
@@ -101,7 +111,7 @@ class Comment(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form), headers=headers, method="POST"
+            url_path, data=form.payload(), headers=headers, method="POST"
         )
 
     def delete(self, comment_id):
@@ -140,9 +150,14 @@ class Comment(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers, method="DELETE")
+        return self.make_request(
+            url_path,
+            headers=headers,
+            method="DELETE",
+            tags=[f"comment:{comment_id}"],
+        )
 
-    def replies(self, comment_id):
+    def replies(self, comment_id, fields=None):
         """
         Fetch replies to a specific comment.
 
@@ -151,6 +166,9 @@ class Comment(BaseEndpoint):
 
         Args:
             comment_id (str|int): Unique ID representing the comment.
+            fields (iterable, optional): Fields of the replies to keep,
+                the others are dropped as the response is parsed.
+                Defaults to all of them.
 
         Returns:
             (DynamicResponseData): Response from Imgur.
@@ -233,7 +251,55 @@ class Comment(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="comment_replies",
+            tags=[f"comment:{comment_id}"],
+            array=("data", "children"),
+            fields=fields,
+            streamable=True,
+        )
+
+    def thread(
+        self, comment_id, max_depth=None, max_comments=1000, max_workers=8
+    ):
+        """
+        Fetch a whole comment thread as a flat list.
+
+        The tree of replies is walked breadth-first, the replies of
+        each level fetched concurrently.
+
+        Args:
+            comment_id (str|int): Unique ID of the root comment.
+            max_depth (int, optional): Depth of the deepest replies to
+                                       fetch, 1 for the direct replies
+                                       only. Defaults to no limit.
+            max_comments (int, optional): Upper bound of returned
+                                          comments, `None` for no
+                                          limit. Defaults to 1000.
+            max_workers (int, optional): Upper bound of concurrently
+                                         fetched comments.
+                                         Defaults to 8.
+
+        Returns:
+            (list[ThreadComment]): The root comment and its replies in
+                                   breadth-first order.
+
+        Examples:
+        >>> for c in api.comment.thread(632941205, max_depth=3):
+        ...     print(c.id, c.parent_id, c.author, c.points, c.text)
+        632941205 0 tester1 5 Lorem ipsum
+        632941206 632941205 tester2 5 Lorem ipsum dolor
+        632941207 632941205 tester3 5 Lorem ipsum dolor sit amet
+        """
+        return walk_thread(
+            self.with_options(stream=False).replies,
+            comment_id,
+            max_depth=max_depth,
+            max_comments=max_comments,
+            max_workers=max_workers,
+        )
 
     def create_reply(self, image_id, comment_id, comment):
         """
@@ -280,7 +346,11 @@ class Comment(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form), headers=headers, method="POST"
+            url_path,
+            data=form.payload(),
+            headers=headers,
+            method="POST",
+            tags=[f"comment:{comment_id}"],
         )
 
     def vote(self, comment_id, vote="up"):
@@ -326,7 +396,12 @@ class Comment(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers, method="POST")
+        return self.make_request(
+            url_path,
+            headers=headers,
+            method="POST",
+            tags=[f"comment:{comment_id}"],
+        )
 
     def report(self, comment_id, reason=None):
         """
@@ -367,7 +442,10 @@ class Comment(BaseEndpoint):
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form) or None, headers=headers, method="POST"
+            url_path,
+            data=form.payload() or None,
+            headers=headers,
+            method="POST",
         )
 
     def __call__(self, comment_id):
@@ -5,7 +5,7 @@ from ..form_factories import get_image_form
 class Image(BaseEndpoint):
     """Image management"""
 
-    def get_image(self, image_hash):
+    def get_image(self, image_hash, fields=None):
         """
         Fetch info about image.
 
@@ -14,6 +14,9 @@ class Image(BaseEndpoint):
 
         Args:
             image_hash (str): Unique ID representing the image.
+            fields (iterable, optional): Fields of the image to keep,
+                the others are dropped as the response is parsed.
+                Defaults to all of them.
 
         Returns:
             (DynamicResponseData): Response from Imgur.
@@ -99,10 +102,21 @@ class Image(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers)
+        return self.make_request(
+            url_path,
+            headers=headers,
+            resource="image",
+            tags=[f"image:{image_hash}"],
+            fields=fields,
+        )
 
     def upload(
-        self, file_obj, filename, title=None, description=None, album=None
+        self,
+        file_obj,
+        filename=None,
+        title=None,
+        description=None,
+        album=None,
     ):
         """
         Upload an image.
@@ -110,13 +124,25 @@ class Image(BaseEndpoint):
         Sends an image file to the server along with optional metadata
         such as title, description, and album information.
 
+        With a `DedupeIndex` the content is hashed first, and if the
+        same bytes have been uploaded already, the existing image is
+        returned without uploading them again. Uploads into an album
+        bypass the index.
+
         See
         https://apidocs.imgur.com/#c85c9dfc-7487-4de2-9ecd-66f727cf3139
 
         Args:
-            file_obj (BufferedReader): File-like object containing
-                                       the image data to be uploaded.
-            filename (str): Filename of the image being uploaded.
+            file_obj (BufferedReader|str|PathLike|memoryview|mmap):
+                File-like object containing the image data to be
+                uploaded, a path of the image file, or a bytes-like
+                object. Paths, buffers and seekable files are sent
+                without copying their content into memory.
+            filename (str, optional): Filename of the image being
+                                      uploaded. Defaults to the name
+                                      of the file if `file_obj` is
+                                      a path or a file opened by
+                                      name, required otherwise.
             title (str, optional): Title or caption for the
                                    uploaded image. Defaults to None.
             description (str, optional): Description of the uploaded
@@ -190,10 +216,19 @@ class Image(BaseEndpoint):
             album=album,
         )
 
+        content = None
+        if self.dedupe is not None and album is None:
+            content = form.files[0]
+
         headers = self.get_headers(form=form)
 
         return self.make_request(
-            url_path, data=bytes(form), headers=headers, method="POST"
+            url_path,
+            data=form.payload(),
+            headers=headers,
+            method="POST",
+            tags=[f"album:{album}"] if album is not None else (),
+            content=content,
         )
 
     def delete(self, image_hash):
@@ -232,7 +267,12 @@ class Image(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers, method="DELETE")
+        return self.make_request(
+            url_path,
+            headers=headers,
+            method="DELETE",
+            tags=[f"image:{image_hash}"],
+        )
 
     def update(self, image_hash, title=None, description=None, album=None):
         """
@@ -279,8 +319,16 @@ class Image(BaseEndpoint):
 
         headers = self.get_headers(form=form)
 
+        tags = [f"image:{image_hash}"]
+        if album is not None:
+            tags.append(f"album:{album}")
+
         return self.make_request(
-            url_path, data=bytes(form) or None, headers=headers, method="POST"
+            url_path,
+            data=form.payload() or None,
+            headers=headers,
+            method="POST",
+            tags=tags,
         )
 
     def favorite(self, image_hash):
@@ -314,7 +362,12 @@ class Image(BaseEndpoint):
 
         headers = self.get_headers()
 
-        return self.make_request(url_path, headers=headers, method="POST")
+        return self.make_request(
+            url_path,
+            headers=headers,
+            method="POST",
+            tags=[f"image:{image_hash}"],
+        )
 
     def __call__(self, image_hash):
         return self.get_image(image_hash)
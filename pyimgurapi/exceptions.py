@@ -17,4 +17,16 @@ class PyImgurApiUnauthorized(PyImgurApiError):
     pass
 
 
-HTTP_CODES_ERRORS_MAP = {403: PyImgurApiUnauthorized, 404: PyImgurApiNotFound}
+class PyImgurApiRateLimited(PyImgurApiError):
+    pass
+
+
+class PyImgurApiTimeout(PyImgurApiError):
+    pass
+
+
+HTTP_CODES_ERRORS_MAP = {
+    403: PyImgurApiUnauthorized,
+    404: PyImgurApiNotFound,
+    429: PyImgurApiRateLimited,
+}
@@ -1,3 +1,5 @@
+import os
+
 from .utils import MultipartForm, Field, File
 
 
@@ -55,11 +57,26 @@ def get_image_form(
         fields.append(Field(field_name="album", value=album))
 
     files = None
-    if file_obj and filename:
-        file_data = file_obj.read()
-        files = [
-            File(name=filename, data=file_data, field_name="image"),
-        ]
+    if filename is None:
+        if isinstance(file_obj, (str, os.PathLike)):
+            filename = os.path.basename(file_obj)
+        elif isinstance(getattr(file_obj, "name", None), str):
+            # A file opened by name.
+            filename = os.path.basename(file_obj.name)
+    if file_obj is not None:
+        if not filename:
+            raise TypeError(
+                "filename is required unless file_obj is a path "
+                "or a file opened by name"
+            )
+        try:
+            # Paths, buffers and seekable files are sent as they are.
+            file = File(name=filename, data=file_obj, field_name="image")
+        except ValueError:
+            file = File(
+                name=filename, data=file_obj.read(), field_name="image"
+            )
+        files = [file]
     return MultipartForm(fields=fields, files=files)
 
 
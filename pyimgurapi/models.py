@@ -0,0 +1,157 @@
+class Model:
+    """Base class of the resource models, keeping documented fields."""
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a model from a parsed JSON object.
+
+        Args:
+            data (dict): Resource as decoded from JSON; unknown keys
+                         are ignored, missing ones become `None`.
+
+        Returns:
+            (Model): New model.
+        """
+        obj = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(obj, name, data.get(name))
+        return obj
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        Build models from the `data` of a response.
+
+        Args:
+            response (DynamicResponseData): Response from Imgur.
+
+        Returns:
+            (Model|list[Model]): A model, or a list of them if `data`
+                                 is an array.
+        """
+        data = response.as_dict()["data"]
+        if isinstance(data, list):
+            return [cls.from_dict(item) for item in data]
+        return cls.from_dict(data)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={getattr(self, 'id', None)!r}>"
+
+
+class Image(Model):
+    """Image, see https://api.imgur.com/models/image"""
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "datetime",
+        "type",
+        "animated",
+        "width",
+        "height",
+        "size",
+        "views",
+        "bandwidth",
+        "deletehash",
+        "name",
+        "link",
+        "mp4",
+        "favorite",
+        "nsfw",
+        "in_gallery",
+        "account_id",
+        "account_url",
+    )
+
+
+class Album(Model):
+    """Album, see https://api.imgur.com/models/album"""
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "datetime",
+        "cover",
+        "account_id",
+        "account_url",
+        "privacy",
+        "layout",
+        "views",
+        "link",
+        "favorite",
+        "nsfw",
+        "images_count",
+        "in_gallery",
+        "deletehash",
+        "images",
+    )
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = super().from_dict(data)
+        if obj.images is not None:
+            obj.images = tuple(Image.from_dict(i) for i in obj.images)
+        return obj
+
+
+class Comment(Model):
+    """Comment, see https://api.imgur.com/models/comment"""
+
+    __slots__ = (
+        "id",
+        "image_id",
+        "comment",
+        "author",
+        "author_id",
+        "on_album",
+        "ups",
+        "downs",
+        "points",
+        "datetime",
+        "parent_id",
+        "deleted",
+        "vote",
+        "children",
+    )
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = super().from_dict(data)
+        if obj.children is not None:
+            obj.children = tuple(cls.from_dict(c) for c in obj.children)
+        return obj
+
+
+class Account(Model):
+    """Account, see https://api.imgur.com/models/account"""
+
+    __slots__ = (
+        "id",
+        "url",
+        "bio",
+        "avatar",
+        "reputation",
+        "reputation_name",
+        "created",
+        "pro_expiration",
+    )
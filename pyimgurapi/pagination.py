@@ -0,0 +1,223 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import itertools
+
+from .batch import amap_concurrently, map_concurrently
+
+
+def page_items(response, model=None):
+    """
+    Items of a page of a listing.
+
+    Args:
+        response (DynamicResponseData): Page response.
+        model (type, optional): `Model` class to decode the items into.
+
+    Returns:
+        (list): Elements of `response.data`, wrapped like the ones got
+                with the subscript notation, or decoded into `model`.
+    """
+    if model is not None:
+        return [model.from_dict(item) for item in response.as_dict()["data"]]
+    return list(response.data)
+
+
+def iter_pages(fetch_page, first_page=0, prefetch=True, model=None):
+    """
+    Yield the items of a paginated listing until its last page.
+
+    While the items of page N are being consumed, page N+1 is already
+    fetched by a background thread. An empty page ends the listing.
+
+    Args:
+        fetch_page (callable): Function taking the page number and
+                               returning the page response.
+        first_page (int, optional): Page to start at. Defaults to 0.
+        prefetch (bool, optional): Fetch the next page in the
+                                   background. Defaults to True.
+        model (type, optional): `Model` class to decode the items
+                                into. Defaults to None.
+
+    Yields:
+        Items of the pages, in order.
+    """
+    if not prefetch:
+        for page in itertools.count(first_page):
+            items = page_items(fetch_page(page), model)
+            if not items:
+                return
+            yield from items
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def submit(page):
+        # Fetch in a copy of the caller's context, so that e.g. the
+        # current `Deadline` applies to the prefetched page as well.
+        context = contextvars.copy_context()
+        return executor.submit(context.run, fetch_page, page)
+
+    future = submit(first_page)
+    try:
+        for page in itertools.count(first_page + 1):
+            items = page_items(future.result(), model)
+            if not items:
+                return
+            future = submit(page)
+            yield from items
+    finally:
+        future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(fetch_page, first_page=0, prefetch=True, model=None):
+    """
+    Asynchronous counterpart of `iter_pages()`.
+
+    Args:
+        fetch_page (callable): Coroutine function taking the page
+                               number and returning the page response.
+        first_page (int, optional): Page to start at. Defaults to 0.
+        prefetch (bool, optional): Fetch the next page in a background
+                                   task. Defaults to True.
+        model (type, optional): `Model` class to decode the items
+                                into. Defaults to None.
+
+    Yields:
+        Items of the pages, in order.
+    """
+    if not prefetch:
+        for page in itertools.count(first_page):
+            items = page_items(await fetch_page(page), model)
+            if not items:
+                return
+            for item in items:
+                yield item
+
+    task = asyncio.ensure_future(fetch_page(first_page))
+    try:
+        for page in itertools.count(first_page + 1):
+            items = page_items(await task, model)
+            if not items:
+                return
+            task = asyncio.ensure_future(fetch_page(page))
+            for item in items:
+                yield item
+    finally:
+        task.cancel()
+
+
+def unique_items(items, key=None):
+    """Drop repeated items, e.g. shifted by a concurrent upload."""
+    seen = set()
+    result = list()
+    for item in items:
+        item_key = key(item) if key is not None else item
+        if item_key not in seen:
+            seen.add(item_key)
+            result.append(item)
+    return result
+
+
+def gather_pages(
+    fetch_page,
+    fetch_count,
+    page_size=50,
+    max_workers=8,
+    key=None,
+    model=None,
+):
+    """
+    Fetch all pages of a listing concurrently.
+
+    The number of pages is worked out from the number of items, the
+    pages are fetched over a thread pool and merged in order. Pages
+    past the counted ones are fetched too, until an empty one, in case
+    items have been added during the scan. Items repeated because the
+    listing has shifted between the pages are dropped.
+
+    Args:
+        fetch_page (callable): Function taking the page number and
+                               returning the page response.
+        fetch_count (callable): Function without arguments returning
+                                the response with the number of items.
+        page_size (int, optional): Items per page. Defaults to 50.
+        max_workers (int, optional): Number of threads. Defaults to 8.
+        key (callable, optional): Function returning the identity of
+                                  an item. Defaults to the item itself.
+        model (type, optional): `Model` class to decode the items
+                                into. Defaults to None.
+
+    Returns:
+        (list): Items of all pages.
+
+    Raises:
+        PyImgurApiError: If fetching some page has failed.
+    """
+    count = fetch_count().data
+    page_count = -(-count // page_size)
+    items = list()
+    with contextlib.closing(
+        map_concurrently(fetch_page, range(page_count), max_workers)
+    ) as results:
+        for result in results:
+            if not result.ok:
+                raise result.error
+            items.extend(page_items(result.result, model))
+
+    for page in itertools.count(page_count):
+        extra = page_items(fetch_page(page), model)
+        if not extra:
+            break
+        items.extend(extra)
+    return unique_items(items, key)
+
+
+async def agather_pages(
+    fetch_page,
+    fetch_count,
+    page_size=50,
+    max_in_flight=8,
+    key=None,
+    model=None,
+):
+    """
+    Asynchronous counterpart of `gather_pages()`.
+
+    Args:
+        fetch_page (callable): Coroutine function taking the page
+                               number and returning the page response.
+        fetch_count (callable): Coroutine function without arguments
+                                returning the number of items.
+        page_size (int, optional): Items per page. Defaults to 50.
+        max_in_flight (int, optional): Upper bound of concurrently
+                                       fetched pages. Defaults to 8.
+        key (callable, optional): Function returning the identity of
+                                  an item. Defaults to the item itself.
+        model (type, optional): `Model` class to decode the items
+                                into. Defaults to None.
+
+    Returns:
+        (list): Items of all pages.
+    """
+    count = (await fetch_count()).data
+    page_count = -(-count // page_size)
+    items = list()
+    results = amap_concurrently(
+        fetch_page, range(page_count), max_in_flight=max_in_flight
+    )
+    try:
+        async for result in results:
+            if not result.ok:
+                raise result.error
+            items.extend(page_items(result.result, model))
+    finally:
+        await results.aclose()
+
+    for page in itertools.count(page_count):
+        extra = page_items(await fetch_page(page), model)
+        if not extra:
+            break
+        items.extend(extra)
+    return unique_items(items, key)
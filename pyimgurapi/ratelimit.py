@@ -0,0 +1,280 @@
+import asyncio
+import collections
+import logging
+import threading
+import time
+
+from .exceptions import PyImgurApiTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBudget(
+    collections.namedtuple(
+        "RateLimitBudget", ("limit", "remaining", "reset_at")
+    )
+):
+    """
+    Snapshot of a single Imgur credit budget.
+
+    Attributes:
+        limit (int): Total credits of the budget, `None` if unknown.
+        remaining (int): Credits left.
+        reset_at (float): Unix timestamp when the budget is refilled,
+                          `None` if unknown.
+    """
+
+    __slots__ = ()
+
+
+# Budget name -> (limit header, remaining header, reset header, whether
+# the reset value is a unix timestamp rather than a number of seconds).
+RATE_LIMIT_HEADERS = {
+    "user": (
+        "X-RateLimit-UserLimit",
+        "X-RateLimit-UserRemaining",
+        "X-RateLimit-UserReset",
+        True,
+    ),
+    "client": (
+        "X-RateLimit-ClientLimit",
+        "X-RateLimit-ClientRemaining",
+        None,
+        True,
+    ),
+    "post": (
+        "X-Post-Rate-Limit-Limit",
+        "X-Post-Rate-Limit-Remaining",
+        "X-Post-Rate-Limit-Reset",
+        False,
+    ),
+}
+DEFAULT_WINDOW = 3600.0
+
+
+def _int_header(headers, name):
+    value = headers.get(name) if name else None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitTracker:
+    """
+    Thread-safe store of the credit budgets reported by Imgur.
+
+    Budgets are parsed from the `X-RateLimit-*` and
+    `X-Post-Rate-Limit-*` response headers. See
+    https://apidocs.imgur.com/#rate-limits
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._budgets = dict()
+
+    def update(self, headers):
+        """
+        Update budgets from response headers.
+
+        Returns:
+            (set): Names of the budgets present in `headers`.
+        """
+        if not headers:
+            return set()
+        now, updated = time.time(), dict()
+        for name, spec in RATE_LIMIT_HEADERS.items():
+            limit_header, remaining_header, reset_header, absolute = spec
+            remaining = _int_header(headers, remaining_header)
+            if remaining is None:
+                continue
+            reset = _int_header(headers, reset_header)
+            if reset is not None and not absolute:
+                reset += now
+            updated[name] = RateLimitBudget(
+                _int_header(headers, limit_header), remaining, reset
+            )
+        with self._lock:
+            self._budgets.update(updated)
+        return set(updated)
+
+    def get(self, name):
+        """Return `RateLimitBudget` named `name`, `None` if unknown."""
+        with self._lock:
+            return self._budgets.get(name)
+
+    @property
+    def budgets(self):
+        """Mapping of all known budgets by name."""
+        with self._lock:
+            return dict(self._budgets)
+
+
+class TokenBucket:
+    """
+    Token bucket which paces calls over a rate-limit window.
+
+    An unconfigured bucket (`rate` is `None`) never delays. Not
+    thread-safe on its own, `RateLimiter` serializes the access.
+    """
+
+    def __init__(self, rate=None, capacity=10):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now):
+        if self.rate:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+    def delay(self, now):
+        """Seconds to wait before a token is available."""
+        self._refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.rate == 0:
+            # The exhausted budget has been reset in the meantime; run
+            # unpaced until the next response reports the new one.
+            self.rate, self.tokens = None, float(self.capacity)
+        if self.rate is None or self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self):
+        if self.rate is not None:
+            self.tokens -= 1
+
+    def configure(self, available, window, now):
+        """
+        Spread `available` credits evenly over `window` seconds.
+        """
+        self._refill(now)
+        if available <= 0:
+            self.rate, self.tokens = 0.0, 0.0
+            self.blocked_until = now + window
+            return
+        self.rate = available / window
+        self.tokens = min(self.tokens, self.capacity, available)
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """
+    Scheduler which delays calls before Imgur's credits run out.
+
+    Every call takes a token from the shared bucket; POST calls
+    additionally take one from the POST bucket. Both buckets are
+    re-tuned from the `RateLimitTracker` after each response, spreading
+    the remaining credits (minus `reserve`) until the reset time. When a
+    budget is exhausted the calls wait for its reset instead of failing
+    with HTTP 429.
+    """
+
+    def __init__(self, tracker=None, reserve=10, burst=10):
+        """
+        Initialize rate limiter.
+
+        Args:
+            tracker (RateLimitTracker, optional): Budget tracker.
+                Defaults to a new one.
+            reserve (int, optional): Credits of every budget which are
+                never spent. Defaults to 10.
+            burst (int, optional): Calls allowed back to back without
+                pacing. Defaults to 10.
+        """
+        self.tracker = tracker if tracker is not None else RateLimitTracker()
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._buckets = dict(
+            request=TokenBucket(capacity=burst),
+            post=TokenBucket(capacity=burst),
+        )
+
+    def _bucket_names(self, method):
+        if method.upper() == "POST":
+            return "request", "post"
+        return ("request",)
+
+    def _reserve(self, method):
+        """Take tokens if available, otherwise return the delay."""
+        with self._lock:
+            now = time.monotonic()
+            buckets = [self._buckets[n] for n in self._bucket_names(method)]
+            delay = max(bucket.delay(now) for bucket in buckets)
+            if delay <= 0:
+                for bucket in buckets:
+                    bucket.consume()
+            return delay
+
+    def _next_delay(self, method, deadline):
+        delay = self._reserve(method)
+        if delay > 0:
+            if deadline is not None and delay >= deadline.remaining():
+                raise PyImgurApiTimeout(
+                    "Rate limit delay doesn't fit into the deadline"
+                )
+            logger.debug(f"Rate limit: delaying {method} by {delay:.2f}s")
+        return delay
+
+    def acquire(self, method="GET", deadline=None):
+        """
+        Block until a call with `method` may be sent.
+
+        Args:
+            method (str, optional): HTTP method of the call.
+                                    Defaults to "GET".
+            deadline (Deadline, optional): Raise `PyImgurApiTimeout`
+                instead of waiting past the deadline.
+        """
+        while True:
+            delay = self._next_delay(method, deadline)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    async def acquire_async(self, method="GET", deadline=None):
+        """Asynchronous counterpart of `acquire()`."""
+        while True:
+            delay = self._next_delay(method, deadline)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _configure(self, bucket_name, budgets, now):
+        known = [budget for budget in budgets if budget is not None]
+        if not known:
+            return
+        available = min(budget.remaining for budget in known) - self.reserve
+        resets = [b.reset_at for b in known if b.reset_at is not None]
+        window = max(resets) - time.time() if resets else DEFAULT_WINDOW
+        self._buckets[bucket_name].configure(available, max(window, 1), now)
+
+    def update(self, headers, status=None):
+        """
+        Feed response headers to the tracker and re-tune the buckets.
+
+        Args:
+            headers (Mapping): Response headers.
+            status (int, optional): HTTP status of the response.
+        """
+        updated = self.tracker.update(headers)
+        with self._lock:
+            now = time.monotonic()
+            if updated & {"user", "client"}:
+                self._configure(
+                    "request",
+                    (self.tracker.get("user"), self.tracker.get("client")),
+                    now,
+                )
+            if "post" in updated:
+                self._configure("post", (self.tracker.get("post"),), now)
+            if status == 429 and not updated:
+                retry_after = _int_header(headers or {}, "Retry-After")
+                self._buckets["request"].blocked_until = now + (
+                    retry_after if retry_after is not None else 1
+                )
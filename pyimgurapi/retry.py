@@ -0,0 +1,174 @@
+import email.utils
+import http.client
+import logging
+import random
+import threading
+import time
+import urllib.error
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+RETRY_STATUSES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+def parse_retry_after(headers):
+    """
+    Parse `Retry-After` header into seconds, `None` if absent.
+
+    Both forms of the header are supported: a number of seconds and
+    an HTTP-date.
+    """
+    value = headers.get("Retry-After") if headers else None
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryBudget:
+    """
+    Global budget limiting the share of retried requests.
+
+    Every request deposits `ratio` tokens, every retry withdraws one.
+    A failing API therefore receives at most `ratio` extra requests per
+    request instead of `max_attempts` times the load. The budget starts
+    with `initial` tokens and never holds more than `capacity`.
+    """
+
+    def __init__(self, ratio=0.2, initial=10, capacity=100):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tokens = float(min(initial, capacity))
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.capacity)
+
+    def withdraw(self):
+        """Take a token for a retry, return False if none is left."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and when.
+
+    Connection errors and HTTP responses with a status in
+    `retry_statuses` are retried with exponential backoff and full
+    jitter, honoring the `Retry-After` header. Only idempotent methods
+    (GET, DELETE, ...) are retried unless the caller opts in, either
+    for every request with `retry_non_idempotent` or for one endpoint
+    with `endpoint.with_options(retry=True)`.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        retry_statuses=RETRY_STATUSES,
+        retry_non_idempotent=False,
+        max_retry_after=60.0,
+        budget=None,
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts (int, optional): Attempts per request including
+                the first one. Defaults to 3.
+            backoff_base (float, optional): Backoff cap of the first
+                retry in seconds, doubled with every attempt.
+                Defaults to 0.5.
+            backoff_max (float, optional): Upper bound of the backoff
+                in seconds. Defaults to 30.
+            retry_statuses (Iterable[int], optional): HTTP statuses
+                worth retrying. Defaults to 408, 429 and 5xx gateway
+                errors.
+            retry_non_idempotent (bool, optional): Retry POST requests
+                too. Defaults to False.
+            max_retry_after (float, optional): Give up instead of
+                waiting when the server asks for a longer pause.
+                Defaults to 60.
+            budget (RetryBudget, optional): Global retry budget.
+                Defaults to a new `RetryBudget`.
+        """
+        if max_attempts < 1:
+            raise ValueError("`max_attempts` must be positive")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def record_request(self):
+        """Account a new request in the retry budget."""
+        self.budget.deposit()
+
+    def is_retryable_error(self, error):
+        if isinstance(error, urllib.error.HTTPError):
+            return error.code in self.retry_statuses
+        return isinstance(error, (OSError, http.client.HTTPException))
+
+    def backoff(self, attempt):
+        """Full-jitter backoff before the retry number `attempt`."""
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def next_delay(self, attempt, method, error, retry=None):
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 1.
+            method (str): HTTP method of the request.
+            error (Exception): Error the attempt failed with.
+            retry (bool, optional): Per-call override: True allows
+                retrying a non-idempotent request, False disables
+                retries. Defaults to the policy settings.
+
+        Returns:
+            (float): Seconds to wait before the next attempt, `None` if
+                     the error must be raised.
+        """
+        if retry is False or attempt >= self.max_attempts:
+            return None
+        if (
+            retry is None
+            and not self.retry_non_idempotent
+            and method.upper() not in IDEMPOTENT_METHODS
+        ):
+            return None
+        if not self.is_retryable_error(error):
+            return None
+
+        delay = self.backoff(attempt)
+        retry_after = parse_retry_after(getattr(error, "headers", None))
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+
+        if not self.budget.withdraw():
+            logger.debug("Retry budget is exhausted")
+            return None
+        logger.debug(
+            f"Retrying {method} after {error!r} "
+            f"(attempt {attempt}) in {delay:.2f}s"
+        )
+        return delay
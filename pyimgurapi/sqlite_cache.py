@@ -0,0 +1,392 @@
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from .cache import BaseCache, CacheEntry, CacheStats
+from .codec import get_codec
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    resource TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at
+    ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+CREATE INDEX IF NOT EXISTS tags_key ON tags (key);
+CREATE TRIGGER IF NOT EXISTS responses_delete_tags
+    AFTER DELETE ON responses
+BEGIN
+    DELETE FROM tags WHERE key = OLD.key;
+END;
+"""
+
+ENTRY_COLUMNS = "body, resource, stored_at, expires_at, etag, last_modified"
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent cache of GET responses stored in an SQLite database.
+
+    The database file may be shared by any number of threads and
+    processes (e.g. web server workers and cron jobs), so a restarted
+    or newly forked process starts with a warm cache. Bodies are stored
+    compressed with zlib; `max_bytes` bounds their compressed size.
+    Least recently used entries are evicted once a bound is exceeded.
+
+    Notes:
+        - Each process opens a single connection, which its threads
+        take turns to use.
+        - Hit and miss counters returned by `stats()` are kept per
+        process, the number and the size of the entries are global.
+
+    Examples:
+    >>> cache = SQLiteCache("/var/cache/imgur.sqlite3", ttl=600)
+    >>> api = ImgurAPI(client_id="<client_id>", cache=cache)
+    """
+
+    def __init__(
+        self,
+        path,
+        max_entries=1024,
+        max_bytes=None,
+        ttl=300,
+        ttls=None,
+        compress_level=6,
+        busy_timeout=30.0,
+    ):
+        """
+        Initialize SQLite cache, creating the database if needed.
+
+        Args:
+            path (str): Path of the database file.
+            max_entries (int, optional): Upper bound of stored entries.
+                Defaults to 1024.
+            max_bytes (int, optional): Upper bound of the total size of
+                compressed bodies. Defaults to no limit.
+            ttl (float, optional): Default seconds an entry stays
+                fresh. Defaults to 300.
+            ttls (dict, optional): Per-resource TTLs overriding the
+                default one. A zero TTL disables caching of the
+                resource.
+            compress_level (int, optional): zlib compression level of
+                the bodies. Defaults to 6.
+            busy_timeout (float, optional): Seconds to wait for a lock
+                held by another process. Defaults to 30.
+        """
+        super().__init__(
+            max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, ttls=ttls
+        )
+        self.path = os.fspath(path)
+        self.compress_level = compress_level
+        self.busy_timeout = busy_timeout
+
+        # A connection per thread would leak with short-lived threads.
+        self._connection = None
+        self._pid = None
+        self._connection_lock = threading.RLock()
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Connection of the process, for the current thread only."""
+        with self._connection_lock:
+            # A connection mustn't be used across `fork()`.
+            if self._connection is None or self._pid != os.getpid():
+                connection = sqlite3.connect(
+                    self.path,
+                    timeout=self.busy_timeout,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                self._connection = connection
+                self._pid = os.getpid()
+            yield self._connection
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    @staticmethod
+    def _make_entry(row, decode=None):
+        body, resource, stored_at, expires_at, etag, last_modified = row
+        body = zlib.decompress(body)
+        if decode is None:
+            decode = get_codec().loads
+        return CacheEntry(
+            body,
+            decode(body),
+            resource,
+            stored_at,
+            expires_at,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def get(self, key, stale=False, decode=None):
+        """
+        Look up a fresh entry and count a hit or a miss.
+
+        Args:
+            key (str): Cache key of the request.
+            stale (bool, optional): Return a stale entry which can be
+                revalidated instead of `None`. Defaults to False.
+            decode (callable, optional): Function decoding the stored
+                body, e.g. the `loads()` of the endpoint's codec.
+                Defaults to the one of `get_codec()`.
+
+        Returns:
+            (CacheEntry): Entry stored under `key`, `None` if there's
+                          no (fresh) one.
+        """
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            self._count(hit=False)
+            return None
+
+        entry = self._make_entry(row, decode)
+        if not entry.is_fresh(now):
+            self._count(hit=False)
+            if not entry.can_revalidate():
+                self.delete(key)
+                return None
+            return entry if stale else None
+
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+        self._count(hit=True)
+        return entry
+
+    def set(self, key, body, value, resource=None, headers=None, tags=()):
+        """
+        Store a response, evicting least recently used entries.
+
+        Args:
+            key (str): Cache key of the request.
+            body (bytes): Raw response body.
+            value: Decoded JSON of the body.
+            resource (str, optional): Name of the resource, selects
+                the TTL.
+            headers (Message, optional): Response headers to take the
+                validators from.
+            tags (iterable, optional): Dependency tags of the response.
+
+        Returns:
+            (CacheEntry): Stored entry, `None` if the response isn't
+                          cacheable.
+        """
+        compressed = zlib.compress(body, self.compress_level)
+        if not self.is_cacheable(compressed, resource):
+            return None
+        now = time.time()
+        entry = CacheEntry(
+            body,
+            value,
+            resource,
+            now,
+            now + self.ttl_for(resource),
+            tags=tags,
+        )
+        entry.update_validators(headers)
+
+        with self._transaction() as connection:
+            # Replacing a row doesn't fire the delete trigger.
+            connection.execute("DELETE FROM tags WHERE key = ?", (key,))
+            connection.executemany(
+                "INSERT INTO tags VALUES (?, ?)",
+                [(tag, key) for tag in entry.tags],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    compressed,
+                    len(compressed),
+                    resource,
+                    entry.stored_at,
+                    entry.expires_at,
+                    now,
+                    entry.etag,
+                    entry.last_modified,
+                ),
+            )
+            evicted = self._evict(connection, now)
+        with self._lock:
+            self._evictions += evicted
+        return entry
+
+    def _evict(self, connection, now):
+        """Delete entries exceeding the bounds, oldest used first."""
+        # Stale entries which can't be revalidated are useless.
+        connection.execute(
+            "DELETE FROM responses WHERE expires_at <= ? "
+            "AND etag IS NULL AND last_modified IS NULL",
+            (now,),
+        )
+        count, size = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        excess_entries = max(count - self.max_entries, 0)
+        excess_bytes = (
+            max(size - self.max_bytes, 0) if self.max_bytes is not None else 0
+        )
+        if not excess_entries and not excess_bytes:
+            return 0
+
+        victims = list()
+        rows = connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        )
+        for victim, victim_size in rows:
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            victims.append((victim,))
+            excess_entries -= 1
+            excess_bytes -= victim_size
+        connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+        return len(victims)
+
+    def refresh(self, key, headers=None):
+        """
+        Mark an entry fresh again after a "304 Not Modified" response.
+
+        Only the timestamps and validators are updated, the stored body
+        is neither read nor decoded.
+
+        Args:
+            key (str): Cache key of the request.
+            headers (Message, optional): Headers of the 304 response,
+                which may carry new validators.
+
+        Returns:
+            (bool): False if the entry has been evicted meanwhile.
+        """
+        etag = last_modified = None
+        if headers is not None:
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT resource FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False
+            connection.execute(
+                "UPDATE responses SET stored_at = ?, expires_at = ?, "
+                "accessed_at = ?, etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                (
+                    now,
+                    now + self.ttl_for(row[0]),
+                    now,
+                    etag,
+                    last_modified,
+                    key,
+                ),
+            )
+        with self._lock:
+            self._revalidations += 1
+        return True
+
+    def delete(self, key):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def invalidate(self, tags):
+        """
+        Evict every entry depending on any of `tags`.
+
+        Returns:
+            (int): Number of evicted entries.
+        """
+        tags = list(tags)
+        if not tags:
+            return 0
+        placeholders = ", ".join("?" * len(tags))
+        with self._connect() as connection:
+            cursor = connection.execute(
+                f"DELETE FROM responses WHERE key IN "
+                f"(SELECT key FROM tags WHERE tag IN ({placeholders}))",
+                tags,
+            )
+            return cursor.rowcount
+
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def stats(self):
+        """Snapshot of the counters as `CacheStats`."""
+        with self._connect() as connection:
+            count, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._revalidations,
+                count,
+                size,
+            )
+
+    def close(self):
+        """Close the connection, a later call opens a new one."""
+        with self._connection_lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+    def __len__(self):
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def __contains__(self, key):
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
@@ -0,0 +1,299 @@
+import codecs
+import json
+
+from .utils import DynamicResponseData, project_item
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+DELIMITERS = WHITESPACE + ",:]}"
+
+# Yielded by the parser when it needs more data.
+_MORE = object()
+
+
+class JSONArrayScanner:
+    """
+    Push parser of one array of a JSON document.
+
+    Feed it the document chunk by chunk with `feed()`, and call
+    `close()` after the last one. Values outside of the array are
+    decoded only to be skipped; once the array has been read, `done`
+    is set and the rest of the document is ignored.
+
+    Args:
+        path (tuple, optional): Keys of the nested objects leading to
+                                the array. Defaults to `("data",)`.
+    """
+
+    def __init__(self, path=("data",)):
+        self.path = tuple(path)
+        self.done = False
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._parser = self._parse()
+
+    def feed(self, chunk):
+        """
+        Add a chunk of the document.
+
+        Args:
+            chunk (bytes): Next chunk of the raw document.
+
+        Returns:
+            (Iterator): Items of the array completed by this chunk;
+                        must be consumed before feeding the next one.
+        """
+        self._append(self._text_decoder.decode(chunk))
+        return self._items()
+
+    def close(self):
+        """
+        Signal the end of the document.
+
+        Returns:
+            (Iterator): The remaining items of the array.
+
+        Raises:
+            ValueError: If the document ended before the array did.
+        """
+        self._eof = True
+        self._append(self._text_decoder.decode(b"", final=True))
+        return self._items()
+
+    def _append(self, text):
+        # Drop the consumed part, so that only one item is buffered.
+        consumed, self._pos = self._pos, 0
+        self._buffer = self._buffer[consumed:] + text
+
+    def _items(self):
+        while not self.done:
+            item = next(self._parser, _MORE)
+            if item is _MORE:
+                return
+            yield item
+
+    def _fill(self):
+        """Wait until there's an unread character in the buffer."""
+        while self._pos == len(self._buffer):
+            if self._eof:
+                raise ValueError("Truncated JSON document")
+            yield _MORE
+
+    def _char(self, skip_only=False):
+        """Next non-whitespace character, consumed unless peeking."""
+        while True:
+            yield from self._fill()
+            char = self._buffer[self._pos]
+            if char not in WHITESPACE:
+                break
+            self._pos += 1
+        if not skip_only:
+            self._pos += 1
+        return char
+
+    def _value(self):
+        """Decode the next value, as soon as it's complete."""
+        yield from self._char(skip_only=True)
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                yield _MORE
+                continue
+            # A number is complete only once a delimiter follows it.
+            if self._eof or (
+                end < len(self._buffer) and self._buffer[end] in DELIMITERS
+            ):
+                self._pos = end
+                return value
+            yield _MORE
+
+    def _expect(self, expected):
+        char = yield from self._char()
+        if char not in expected:
+            raise ValueError(
+                f"Expected {expected!r} in JSON document, found {char!r}"
+            )
+        return char
+
+    def _parse(self):
+        for key in self.path:
+            yield from self._expect("{")
+            if (yield from self._char(skip_only=True)) == "}":
+                raise ValueError(f"Missing {key!r} in JSON document")
+            while True:
+                name = yield from self._value()
+                yield from self._expect(":")
+                if name == key:
+                    break
+                yield from self._value()
+                if (yield from self._expect(",}")) == "}":
+                    raise ValueError(f"Missing {key!r} in JSON document")
+
+        if (yield from self._char(skip_only=True)) != "[":
+            raise ValueError(f"{'.'.join(self.path)!r} is not an array")
+        self._pos += 1
+        if (yield from self._char(skip_only=True)) == "]":
+            self.done = True
+            return
+        while True:
+            yield (yield from self._value())
+            if (yield from self._expect(",]")) == "]":
+                self.done = True
+                return
+
+
+def wrap_item(item):
+    """Wrap objects and arrays like `DynamicResponseData` does."""
+    if isinstance(item, (dict, list)):
+        return DynamicResponseData(item)
+    return item
+
+
+class JSONArrayIterator:
+    """
+    Iterator over the items of an array of a streamed JSON document.
+
+    The stream is read in chunks of `CHUNK_SIZE` bytes, and drained
+    after the array so that a keep-alive connection can be reused.
+    The iterator owns the stream: it's closed when the iteration ends,
+    by `close()`, or once the iterator is garbage collected, even if
+    the iteration never started.
+    """
+
+    def __init__(self, stream, path=("data",), deadline=None, fields=None):
+        self.stream = stream
+        self.closed = False
+        self.deadline = deadline
+        self.fields = fields
+        self._scanner = JSONArrayScanner(path)
+        self._items = iter(())
+
+    def _next_item(self):
+        """Next item of the chunks read so far, `_MORE` if none."""
+        item = next(self._items, _MORE)
+        if item is _MORE:
+            return item
+        if self.fields is not None:
+            item = project_item(item, self.fields)
+        return wrap_item(item)
+
+    def _feed(self, chunk):
+        scanner = self._scanner
+        self._items = scanner.feed(chunk) if chunk else scanner.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            while not self.closed:
+                item = self._next_item()
+                if item is not _MORE:
+                    return item
+                if self._scanner.done:
+                    while self.stream.read(CHUNK_SIZE):
+                        pass
+                    break
+                if self.deadline is not None:
+                    self.deadline.check()
+                self._feed(self.stream.read(CHUNK_SIZE))
+        except BaseException:
+            self.close()
+            raise
+        self.close()
+        raise StopIteration
+
+    def close(self):
+        """Close the stream, dropping the rest of the items."""
+        if not self.closed:
+            self.closed = True
+            self.stream.close()
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncJSONArrayIterator(JSONArrayIterator):
+    """Asynchronous `JSONArrayIterator`, awaiting `stream.read()`."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            while not self.closed:
+                item = self._next_item()
+                if item is not _MORE:
+                    return item
+                if self._scanner.done:
+                    while await self.stream.read(CHUNK_SIZE):
+                        pass
+                    break
+                if self.deadline is not None:
+                    self.deadline.check()
+                self._feed(await self.stream.read(CHUNK_SIZE))
+        except BaseException:
+            self.close()
+            raise
+        self.close()
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def iter_json_array(stream, path=("data",), deadline=None, fields=None):
+    """
+    Iterate over the items of an array of a streamed JSON document.
+
+    Args:
+        stream: Binary file-like object, e.g. an HTTP response.
+        path (tuple, optional): Keys of the nested objects leading to
+                                the array. Defaults to `("data",)`.
+        deadline (Deadline, optional): Deadline checked before reading
+                                       every chunk.
+        fields (frozenset, optional): Keys of the items to keep, the
+                                      others are dropped as soon as
+                                      each item is parsed.
+
+    Returns:
+        (JSONArrayIterator): Lazy iterator over the items, closing
+                             `stream` once it's done.
+
+    Raises:
+        ValueError: While iterating, if there's no such array in the
+                    document.
+    """
+    return JSONArrayIterator(stream, path, deadline=deadline, fields=fields)
+
+
+def aiter_json_array(stream, path=("data",), deadline=None, fields=None):
+    """
+    Iterate over the items of an array of a streamed JSON document.
+
+    See `iter_json_array()`; `stream.read()` is awaited.
+
+    Returns:
+        (AsyncJSONArrayIterator): Lazy iterator over the items.
+    """
+    return AsyncJSONArrayIterator(
+        stream, path, deadline=deadline, fields=fields
+    )
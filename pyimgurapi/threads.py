@@ -0,0 +1,174 @@
+import collections
+import contextlib
+
+from .batch import amap_concurrently, map_concurrently
+
+
+class ThreadComment(
+    collections.namedtuple(
+        "ThreadComment", ("id", "parent_id", "author", "points", "text")
+    )
+):
+    """
+    Comment of a thread walked by `walk_thread()`.
+
+    Attributes:
+        id (int): ID of the comment.
+        parent_id (int): ID of the comment replied to, 0 for
+                         a top-level comment.
+        author (str): Username of the author.
+        points (int): Upvotes minus downvotes.
+        text (str): Text of the comment.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(
+            data["id"],
+            data.get("parent_id"),
+            data.get("author"),
+            data.get("points"),
+            data.get("comment"),
+        )
+
+
+class _ThreadWalk:
+    """State of a breadth-first walk shared by both variants."""
+
+    def __init__(self, max_depth, max_comments):
+        self.max_depth = max_depth
+        self.max_comments = max_comments
+        self.comments = list()
+        self.frontier = list()
+
+    @property
+    def full(self):
+        return (
+            self.max_comments is not None
+            and len(self.comments) >= self.max_comments
+        )
+
+    def add(self, data, depth):
+        if self.full:
+            return
+        if self.max_depth is not None and depth > self.max_depth:
+            return
+        self.comments.append(ThreadComment.from_data(data))
+        if self.max_depth is None or depth < self.max_depth:
+            self.frontier.append((data["id"], depth))
+
+    def visit_root(self, response):
+        self.comments.append(
+            ThreadComment.from_data(response.as_dict()["data"])
+        )
+        self.visit(response, 0)
+
+    def visit(self, response, depth):
+        """Add the replies of a fetched comment, in order."""
+        for child in response.as_dict()["data"].get("children") or ():
+            self.add(child, depth + 1)
+
+    def next_level(self):
+        """Comments whose replies are fetched next."""
+        level, self.frontier = self.frontier, list()
+        return [] if self.full else level
+
+
+def walk_thread(
+    fetch_replies, comment_id, max_depth=None, max_comments=1000, max_workers=8
+):
+    """
+    Fetch a comment and all of its replies breadth-first.
+
+    The replies of a whole level of the tree are fetched concurrently.
+
+    Args:
+        fetch_replies (callable): Function taking a comment ID and
+                                  returning the comment with its
+                                  direct replies, e.g.
+                                  `api.comment.replies`.
+        comment_id (str|int): ID of the root comment.
+        max_depth (int, optional): Depth of the deepest replies to
+                                   fetch, 1 for the direct replies
+                                   only. Defaults to no limit.
+        max_comments (int, optional): Upper bound of returned comments,
+                                      `None` for no limit. Defaults to
+                                      1000.
+        max_workers (int, optional): Number of threads. Defaults to 8.
+
+    Returns:
+        (list[ThreadComment]): The root comment and its replies in
+                               breadth-first order.
+
+    Raises:
+        PyImgurApiError: If fetching some comment has failed.
+    """
+    walk = _ThreadWalk(max_depth, max_comments)
+    root = fetch_replies(comment_id)
+    walk.visit_root(root)
+
+    level = walk.next_level()
+    while level:
+        depths = dict(level)
+        with contextlib.closing(
+            map_concurrently(fetch_replies, list(depths), max_workers)
+        ) as results:
+            for result in results:
+                if not result.ok:
+                    raise result.error
+                walk.visit(result.result, depths[result.item])
+                if walk.full:
+                    break
+        level = walk.next_level()
+    return walk.comments
+
+
+async def awalk_thread(
+    fetch_replies,
+    comment_id,
+    max_depth=None,
+    max_comments=1000,
+    max_in_flight=8,
+):
+    """
+    Asynchronous counterpart of `walk_thread()`.
+
+    Args:
+        fetch_replies (callable): Coroutine function taking a comment
+                                  ID and returning the comment with
+                                  its direct replies.
+        comment_id (str|int): ID of the root comment.
+        max_depth (int, optional): Depth of the deepest replies to
+                                   fetch. Defaults to no limit.
+        max_comments (int, optional): Upper bound of returned comments.
+                                      Defaults to 1000.
+        max_in_flight (int, optional): Upper bound of concurrently
+                                       fetched comments. Defaults to 8.
+
+    Returns:
+        (list[ThreadComment]): The root comment and its replies in
+                               breadth-first order.
+    """
+    walk = _ThreadWalk(max_depth, max_comments)
+    root = await fetch_replies(comment_id)
+    walk.visit_root(root)
+
+    level = walk.next_level()
+    while level:
+        depths = dict(level)
+        results = amap_concurrently(
+            fetch_replies, list(depths), max_in_flight=max_in_flight
+        )
+        try:
+            async for result in results:
+                if not result.ok:
+                    raise result.error
+                walk.visit(result.result, depths[result.item])
+                if walk.full:
+                    break
+        finally:
+            await results.aclose()
+        level = walk.next_level()
+    return walk.comments
@@ -0,0 +1,112 @@
+import contextvars
+import time
+
+from .exceptions import PyImgurApiTimeout
+
+_current_deadline = contextvars.ContextVar("deadline", default=None)
+
+
+class Timeout:
+    """
+    Timeouts of a single API call.
+
+    Attributes:
+        connect (float): Seconds to establish a connection.
+        read (float): Seconds to wait for any chunk of the response.
+        total (float): Seconds the whole call may take, including
+                       retries and rate-limit delays.
+    """
+
+    def __init__(self, connect=None, read=None, total=None):
+        self.connect = connect
+        self.read = read
+        self.total = total
+
+    @classmethod
+    def coerce(cls, value):
+        """Make `Timeout` out of a number (connect and read) or None."""
+        if isinstance(value, cls):
+            return value
+        if value is None:
+            return cls()
+        return cls(connect=value, read=value)
+
+    def socket_timeouts(self, deadline=None):
+        """
+        Connect and read timeouts clipped by the time left.
+
+        Returns:
+            (tuple): Connect and read timeouts in seconds, `None` stands
+                     for no timeout.
+        """
+        if deadline is None:
+            return self.connect, self.read
+        remaining = deadline.remaining()
+        return tuple(
+            remaining if value is None else min(value, remaining)
+            for value in (self.connect, self.read)
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(connect={self.connect}, "
+            f"read={self.read}, total={self.total})"
+        )
+
+
+class Deadline:
+    """
+    Point in time by which a (composite) operation must complete.
+
+    Used as a context manager the deadline applies to every request
+    made inside the block, including retries and pages fetched by
+    iterators, in the current thread or asyncio task.
+
+    Examples:
+    >>> with Deadline(5):
+    ...     album = api.album.get_album("Ff3bHm8")
+    ...     images = api.album.album_images("Ff3bHm8")
+    """
+
+    def __init__(self, timeout):
+        """
+        Initialize deadline.
+
+        Args:
+            timeout (float): Seconds from now until the deadline.
+        """
+        self.expires_at = time.monotonic() + timeout
+        self._tokens = list()
+
+    @classmethod
+    def current(cls):
+        """Deadline of the innermost `with` block, `None` if none."""
+        return _current_deadline.get()
+
+    @classmethod
+    def earliest(cls, *deadlines):
+        """The earliest of `deadlines`, ignoring `None` values."""
+        known = [deadline for deadline in deadlines if deadline is not None]
+        return min(known, key=lambda d: d.expires_at, default=None)
+
+    def remaining(self):
+        """Seconds left until the deadline, zero if it's passed."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def check(self):
+        """Raise `PyImgurApiTimeout` if the deadline has passed."""
+        if self.expired:
+            raise PyImgurApiTimeout("Deadline exceeded")
+
+    def __enter__(self):
+        # A nested block can't extend the deadline of an outer one.
+        effective = self.earliest(self, self.current())
+        self._tokens.append(_current_deadline.set(effective))
+        return effective
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _current_deadline.reset(self._tokens.pop())
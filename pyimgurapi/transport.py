@@ -0,0 +1,302 @@
+import http.client
+import io
+import logging
+import threading
+import time
+import urllib.error
+from urllib.parse import urlsplit
+
+from .retry import IDEMPOTENT_METHODS
+from .timeouts import Timeout
+from .utils import File, MultipartForm
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+USER_AGENT = "pyimgurapi"
+
+
+class PooledResponse:
+    """
+    Response handed out by `ConnectionPool`.
+
+    Mimics the subset of `http.client.HTTPResponse` used by the
+    endpoints (`status`, `reason`, `headers`, `read()`). The underlying
+    connection goes back to the pool as soon as the body has been read
+    completely.
+    """
+
+    def __init__(self, pool, key, connection, response):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def read(self, amt=None):
+        try:
+            data = self._response.read(amt)
+        except BaseException:
+            # E.g. a read timeout: the rest of the body is lost.
+            self._release(reusable=False)
+            raise
+        if amt is None or not data or self._response.isclosed():
+            self.close()
+        return data
+
+    def close(self):
+        self._release(
+            self._response.isclosed() and not self._response.will_close
+        )
+
+    def _release(self, reusable):
+        if self._connection is None:
+            return
+        self._pool.release(self._key, self._connection, reusable=reusable)
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent (keep-alive) HTTP(S) connections.
+
+    Connections are grouped by `(scheme, host, port)`. At most
+    `max_connections_per_host` connections are opened for a single
+    host, callers beyond the limit wait for a connection to be
+    released. Idle connections older than `idle_timeout` seconds are
+    closed on the next acquisition.
+    """
+
+    def __init__(
+        self, max_connections_per_host=10, idle_timeout=60.0, ssl_context=None
+    ):
+        """
+        Initialize connection pool.
+
+        Args:
+            max_connections_per_host (int, optional): Upper bound of
+                simultaneously opened connections to a single host.
+                Defaults to 10.
+            idle_timeout (float, optional): Seconds an unused connection
+                is kept open. Defaults to 60.
+            ssl_context (ssl.SSLContext, optional): Context for HTTPS
+                connections. Defaults to the system default one.
+        """
+        if max_connections_per_host < 1:
+            raise ValueError("`max_connections_per_host` must be positive")
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl_context
+
+        self._condition = threading.Condition()
+        self._idle = dict()
+        self._opened = dict()
+        self._closed = False
+
+    def _new_connection(self, key, timeout):
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self.ssl_context
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _evict_idle(self, now):
+        expired = list()
+        for key, idle in self._idle.items():
+            while idle and now - idle[0][1] > self.idle_timeout:
+                expired.append(idle.pop(0)[0])
+                self._opened[key] -= 1
+        return expired
+
+    def acquire(self, key, timeout=None):
+        """
+        Take a connection for `key` out of the pool.
+
+        Args:
+            key (tuple): `(scheme, host, port)` of the connection.
+            timeout (float, optional): Connect timeout of a new
+                connection, and the longest wait for a free one.
+
+        Returns:
+            (tuple): Connection and a flag whether it was reused.
+
+        Raises:
+            TimeoutError: If no connection got free within `timeout`.
+        """
+        wait_until = None if timeout is None else time.monotonic() + timeout
+        timed_out = False
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+            expired = self._evict_idle(time.monotonic())
+            while True:
+                idle = self._idle.get(key)
+                if idle:
+                    connection, reused = idle.pop()[0], True
+                    break
+                if self._opened.get(key, 0) < self.max_connections_per_host:
+                    self._opened[key] = self._opened.get(key, 0) + 1
+                    connection, reused = None, False
+                    break
+                remaining = None
+                if wait_until is not None:
+                    remaining = wait_until - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+                self._condition.wait(remaining)
+
+        for stale in expired:
+            stale.close()
+        if timed_out:
+            raise TimeoutError(f"No free connection to {key[1]}:{key[2]}")
+
+        if connection is None:
+            connection = self._new_connection(key, timeout)
+        return connection, reused
+
+    def release(self, key, connection, reusable=True):
+        """Return a connection taken by `acquire()` back to the pool."""
+        with self._condition:
+            if reusable and not self._closed:
+                self._idle.setdefault(key, []).append(
+                    (connection, time.monotonic())
+                )
+                connection = None
+            else:
+                self._opened[key] -= 1
+            self._condition.notify()
+        if connection is not None:
+            connection.close()
+
+    @staticmethod
+    def _send_request(connection, request, headers):
+        body = request.data
+        if not isinstance(body, MultipartForm):
+            connection.request(
+                request.get_method(),
+                request.selector,
+                body=body,
+                headers=headers,
+            )
+            return
+
+        names = {name.lower() for name in headers}
+        connection.putrequest(
+            request.get_method(),
+            request.selector,
+            skip_host="host" in names,
+            skip_accept_encoding="accept-encoding" in names,
+        )
+        for name, value in headers.items():
+            connection.putheader(name, value)
+        if "content-length" not in names:
+            connection.putheader("Content-Length", str(len(body)))
+        connection.endheaders()
+        for part in body.parts():
+            if isinstance(part, File) and part.is_file:
+                # The kernel copies the file to the socket, where it's
+                # supported (i.e. plain HTTP), reads it otherwise.
+                with part.open() as file_obj:
+                    connection.sock.sendfile(
+                        file_obj, offset=part.offset or 0, count=part.size
+                    )
+            elif isinstance(part, File):
+                connection.send(part.data)
+            else:
+                connection.send(part)
+
+    def urlopen(self, request, timeout=None):
+        """
+        Send `urllib.request.Request` over a pooled connection.
+
+        Behaves like `urllib.request.urlopen()`: any non-2xx response
+        is raised as `urllib.error.HTTPError`.
+
+        Args:
+            request (urllib.request.Request): Request to send.
+            timeout (float|Timeout, optional): Socket timeout in
+                seconds, or separate connect and read timeouts.
+
+        Returns:
+            (PooledResponse): Response from the server.
+        """
+        parts = urlsplit(request.full_url)
+        if parts.scheme not in DEFAULT_PORTS:
+            raise ValueError(f"Unsupported URL scheme: '{parts.scheme}'")
+        key = (
+            parts.scheme,
+            parts.hostname,
+            parts.port or DEFAULT_PORTS[parts.scheme],
+        )
+
+        headers = {"User-Agent": USER_AGENT}
+        headers.update(request.header_items())
+        connect_timeout, read_timeout = Timeout.coerce(
+            timeout
+        ).socket_timeouts()
+
+        replayable = request.get_method() in IDEMPOTENT_METHODS
+        while True:
+            connection, reused = self.acquire(key, timeout=connect_timeout)
+            sent = False
+            try:
+                if connection.sock is None:
+                    connection.connect()
+                connection.sock.settimeout(read_timeout)
+                self._send_request(connection, request, headers)
+                sent = True
+                response = connection.getresponse()
+            except (http.client.HTTPException, OSError) as exc:
+                self.release(key, connection, reusable=False)
+                # The server may drop a keep-alive connection at any
+                # moment; replay the request on another socket, unless
+                # the server may have got a non-idempotent one.
+                if (
+                    reused
+                    and (replayable or not sent)
+                    and isinstance(
+                        exc, (http.client.RemoteDisconnected, ConnectionError)
+                    )
+                ):
+                    logger.debug(f"Stale connection to {key}, reconnecting")
+                    continue
+                raise
+            break
+
+        pooled = PooledResponse(self, key, connection, response)
+        if not 200 <= response.status < 300:
+            body = pooled.read()
+            raise urllib.error.HTTPError(
+                request.full_url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(body),
+            )
+        return pooled
+
+    def close(self):
+        """Close all idle connections and refuse new requests."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, dict()
+            self._condition.notify_all()
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
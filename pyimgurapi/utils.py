@@ -1,11 +1,17 @@
+import contextlib
 import io
 import itertools
 import json
 import mimetypes
+import os
+import stat
+import threading
 import uuid
 
+
 ENCODING = "utf-8"
 EOL = "\r\n"
+CHUNK_SIZE = 64 * 1024
 
 
 # @TODO: consider dataclasses
@@ -15,59 +21,382 @@ class Field:
         self.value = value
 
 
+def get_stream_size(file_obj):
+    """
+    Number of bytes left to read from a file object.
+
+    Returns:
+        (int): Size of the rest of the stream, `None` if it can't be
+               found out without reading it.
+    """
+    errors = (AttributeError, OSError, TypeError, ValueError)
+    try:
+        position = file_obj.tell()
+        status = os.fstat(file_obj.fileno())
+        if not stat.S_ISREG(status.st_mode):
+            return None
+        size = status.st_size
+    except errors:
+        try:
+            position = file_obj.tell()
+            size = file_obj.seek(0, io.SEEK_END)
+            file_obj.seek(position)
+        except errors:
+            return None
+    if not isinstance(position, int) or not isinstance(size, int):
+        return None
+    return max(size - position, 0)
+
+
+def is_buffer(obj):
+    """Whether `obj` supports the buffer protocol, e.g. `mmap`."""
+    try:
+        memoryview(obj)
+    except TypeError:
+        return False
+    return True
+
+
 class File:
     def __init__(self, name, data, field_name):
+        """
+        Initialize file part of a multipart form.
+
+        Args:
+            name (str): Filename.
+            data (bytes|str|PathLike|memoryview|mmap|BufferedReader):
+                Content of the file: bytes, a path to read it from,
+                a bytes-like object (sent without copying), or
+                a seekable binary file object to stream it from.
+            field_name (str): Name of the form field.
+        """
         self.name = name
         self.data = data
         self.field_name = field_name
         self.mimetype = (
             mimetypes.guess_type(name)[0] or "application/octet-stream"
         )
+        self.path = None
+        self.offset = None
+        if isinstance(data, bytes):
+            self.size = len(data)
+        elif isinstance(data, (str, os.PathLike)):
+            self.path = os.fspath(data)
+            self.size = os.stat(self.path).st_size
+        elif is_buffer(data):
+            self.data = memoryview(data).cast("B")
+            self.size = self.data.nbytes
+        else:
+            self.size = get_stream_size(data)
+            if self.size is None:
+                raise ValueError(
+                    "Size of the file object can't be determined, "
+                    "pass its content as bytes"
+                )
+            self.offset = data.tell()
+
+    @property
+    def is_stream(self):
+        """Whether the content is sent without building `bytes`."""
+        return not isinstance(self.data, bytes)
+
+    @property
+    def is_file(self):
+        """Whether the content is read from a file or file object."""
+        return self.is_stream and not isinstance(self.data, memoryview)
+
+    @contextlib.contextmanager
+    def open(self):
+        """
+        Open the file to read the content from, at its start.
+
+        Yields:
+            (BufferedReader): Binary file object.
+        """
+        if self.path is not None:
+            with open(self.path, "rb") as file_obj:
+                yield file_obj
+        else:
+            # Rewind, so that a retried request sends the whole file.
+            self.data.seek(self.offset)
+            yield self.data
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Yield the content, reading a file chunk by chunk."""
+        if not self.is_file:
+            yield self.data
+            return
+        with self.open() as file_obj:
+            remaining = self.size
+            while remaining > 0:
+                chunk = file_obj.read(min(chunk_size, remaining))
+                if not chunk:
+                    raise ValueError(
+                        f"File '{self.name}' is shorter than expected"
+                    )
+                remaining -= len(chunk)
+                yield chunk
 
 
 class MultipartForm:
+    """
+    Body of a `multipart/form-data` request.
+
+    The body is produced by iterating over the form: files given as
+    file objects are streamed in chunks, so uploading a big file never
+    holds it in memory, while the length of the body is known up front.
+
+    Notes:
+        - The encoding is built once, on first use, and reused by
+        `len()`, `bytes()` and iteration; don't modify the form
+        afterwards.
+    """
+
     def __init__(self, fields=None, files=None):
         self.boundary = uuid.uuid4().hex
         self.fields = fields or []
         self.files = files or []
+        self._parts = None
+        self._length = None
+        self._body = None
 
-    def __bytes__(self):
-        buffer = io.BytesIO()
-
-        boundary_bytes = b"".join(
+    def _boundary_bytes(self):
+        return b"".join(
             (b"--", self.boundary.encode(ENCODING), EOL.encode(ENCODING))
         )
 
-        for field in self.fields:
-            buffer.write(boundary_bytes)
-            buffer.write("Content-Disposition: form-data; ".encode(ENCODING))
-            buffer.write(f'name="{field.field_name}"{EOL}'.encode(ENCODING))
-            buffer.write(EOL.encode(ENCODING))
-            buffer.write(field.value.encode(ENCODING))
-            buffer.write(EOL.encode(ENCODING))
-
-        for file in self.files:
-            buffer.write(boundary_bytes)
-            buffer.write("Content-Disposition: form-data; ".encode(ENCODING))
-            buffer.write(f'name="{file.field_name}"; '.encode(ENCODING))
-            buffer.write(f'filename="{file.name}"{EOL}'.encode(ENCODING))
-            buffer.write(EOL.encode(ENCODING))
-            buffer.write(file.data)
-            buffer.write(EOL.encode(ENCODING))
-            buffer.write(boundary_bytes)
-
-        return buffer.getvalue()
+    def _field_part(self, field):
+        return b"".join(
+            (
+                self._boundary_bytes(),
+                "Content-Disposition: form-data; ".encode(ENCODING),
+                f'name="{field.field_name}"{EOL}'.encode(ENCODING),
+                EOL.encode(ENCODING),
+                field.value.encode(ENCODING),
+                EOL.encode(ENCODING),
+            )
+        )
+
+    def _file_head(self, file):
+        return b"".join(
+            (
+                self._boundary_bytes(),
+                "Content-Disposition: form-data; ".encode(ENCODING),
+                f'name="{file.field_name}"; '.encode(ENCODING),
+                f'filename="{file.name}"{EOL}'.encode(ENCODING),
+                EOL.encode(ENCODING),
+            )
+        )
+
+    def _file_tail(self):
+        return EOL.encode(ENCODING) + self._boundary_bytes()
+
+    def parts(self):
+        """
+        Encoded parts of the body, built once.
+
+        Returns:
+            (list): Encoded chunks (bytes) and the streamed files
+                    (`File`) in between.
+        """
+        if self._parts is None:
+            parts = [self._field_part(field) for field in self.fields]
+            for file in self.files:
+                parts.append(self._file_head(file))
+                parts.append(file if file.is_stream else file.data)
+                parts.append(self._file_tail())
+            self._parts = parts
+        return self._parts
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """
+        Yield the body of the form chunk by chunk.
+
+        Args:
+            chunk_size (int, optional): Size of the chunks read from
+                the file objects. Defaults to 64 KiB.
+        """
+        for part in self.parts():
+            if isinstance(part, File):
+                yield from part.iter_chunks(chunk_size)
+            else:
+                yield part
+
+    def __iter__(self):
+        return self.iter_chunks()
+
+    def content_length(self):
+        """Length of the body in bytes, computed without building it."""
+        if self._length is None:
+            self._length = sum(
+                part.size if isinstance(part, File) else len(part)
+                for part in self.parts()
+            )
+        return self._length
+
+    def __len__(self):
+        return self.content_length()
+
+    @property
+    def is_stream(self):
+        return any(file.is_stream for file in self.files)
+
+    def payload(self):
+        """
+        Body to pass to a request.
+
+        Returns:
+            (bytes|MultipartForm): The body itself, or the form as an
+                                   iterable over the chunks of the
+                                   body if it streams a file.
+        """
+        return self if self.is_stream else bytes(self)
+
+    def __bytes__(self):
+        if self.is_stream:
+            # Don't keep a copy of a streamed file around.
+            return b"".join(self.iter_chunks())
+        if self._body is None:
+            self._body = b"".join(self.parts())
+        return self._body
 
     def get_content_type(self):
         return f"multipart/form-data; boundary={self.boundary}"
 
 
+def project_item(item, fields):
+    """
+    Keep only `fields` of an object.
+
+    Args:
+        item: Decoded JSON value, anything but an object is kept as is.
+        fields (frozenset): Names of the keys to keep.
+
+    Returns:
+        New object with the requested keys, in their original order.
+    """
+    if not isinstance(item, dict):
+        return item
+    return {key: value for key, value in item.items() if key in fields}
+
+
+def project_fields(value, fields, path=("data",)):
+    """
+    Keep only `fields` of the resources of a response.
+
+    The resources are the items of the array at `path`, or the object
+    there; everything else (e.g. `success` and `status`) is kept.
+
+    Args:
+        value (dict): Decoded JSON of the response.
+        fields (frozenset): Names of the fields to keep.
+        path (tuple, optional): Keys leading to the resources.
+                                Defaults to `("data",)`.
+
+    Returns:
+        (dict): Projected response.
+    """
+    if not path:
+        if isinstance(value, list):
+            return [project_item(item, fields) for item in value]
+        return project_item(value, fields)
+    key = path[0]
+    if not isinstance(value, dict) or key not in value:
+        return value
+    projected = dict(value)
+    projected[key] = project_fields(value[key], fields, path[1:])
+    return projected
+
+
 class DynamicResponseData:
+    """
+    Read-only view of decoded JSON with attribute and item access.
+
+    Nested objects and arrays are returned wrapped as well. A wrapper
+    is built once per child and cached, so repeated access like
+    `response.data[i].link` doesn't allocate; the decoded JSON must not
+    be modified afterwards.
+
+    A response built with `from_bytes()` keeps the raw body and decodes
+    it only on first access.
+    """
+
+    __slots__ = (
+        "_source_dict",
+        "_name",
+        "_children",
+        "_raw",
+        "_decode",
+        "_lock",
+    )
+
     def __init__(self, source_dict, name="data"):
         self._source_dict = source_dict
         self._name = name
+        self._children = None
+        self._raw = None
+        self._decode = None
+        self._lock = None
+
+    @classmethod
+    def from_bytes(cls, raw, decode, name="data"):
+        """
+        Make a response decoding `raw` on first access.
+
+        Args:
+            raw (bytes): Raw JSON.
+            decode (callable): Function decoding `raw`.
+            name (str, optional): Name used in error messages.
+
+        Returns:
+            (DynamicResponseData): Response, not decoded yet.
+        """
+        obj = cls.__new__(cls)
+        obj._name = name
+        obj._children = None
+        obj._raw = raw
+        obj._decode = decode
+        obj._lock = threading.Lock()
+        return obj
+
+    def _decode_lazily(self):
+        """Decode a lazy response, once even if threads race for it."""
+        lock = self._lock
+        if lock is None:
+            raise AttributeError("_source_dict")
+        with lock:
+            try:
+                # Another thread may have decoded it meanwhile.
+                return object.__getattribute__(self, "_source_dict")
+            except AttributeError:
+                pass
+            source_dict = self._decode(self._raw)
+            self._source_dict = source_dict
+            self._raw = self._decode = None
+            return source_dict
+
+    def _wrap(self, key, value, name):
+        """Value of `key`, containers wrapped once and cached."""
+        if not isinstance(value, (list, tuple, dict)):
+            return value
+        children = self._children
+        if children is None:
+            children = self._children = dict()
+        child = children.get(key)
+        if child is None:
+            child = children[key] = self.__class__(value, name=name)
+        return child
 
     def __getattr__(self, item):
+        if item == "_source_dict":
+            # Decode a lazy response on first access.
+            return self._decode_lazily()
+        if item in DynamicResponseData.__slots__:
+            # Not initialized yet, e.g. while being copied.
+            raise AttributeError(item)
+        children = self._children
+        if children is not None and item in children:
+            return children[item]
         if isinstance(self._source_dict, (list, tuple)):
             raise AttributeError(
                 f"'{self._name}' object represents an array, use the "
@@ -75,23 +404,23 @@ class DynamicResponseData:
             )
 
         if item in self._source_dict:
-            value = self._source_dict[item]
-            if isinstance(value, (list, tuple, dict)):
-                return self.__class__(self._source_dict[item], name=item)
-            return value
+            return self._wrap(item, self._source_dict[item], item)
         raise AttributeError(
             f"'{self._name}' object does not have '{item}' attribute"
         )
 
     def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.__class__(self._source_dict[key], name=self._name)
+        children = self._children
+        if children is not None and key in children:
+            return children[key]
         try:
-            if isinstance(self._source_dict[key], (list, tuple, dict)):
-                return self.__class__(
-                    self._source_dict[key],
-                    name=f"'{key}' item of '{self._name}'",
-                )
-
-            return self._source_dict[key]
+            return self._wrap(
+                key,
+                self._source_dict[key],
+                f"'{key}' item of '{self._name}'",
+            )
         except IndexError as exc:
             raise IndexError(
                 f"Unable to get item by index '{key}' of array '{self._name}'"
@@ -101,6 +430,18 @@ class DynamicResponseData:
                 f"Unable to get item by key '{key}' of object '{self._name}'"
             ) from exc
 
+    def __iter__(self):
+        """Items of an array, or keys of an object."""
+        if isinstance(self._source_dict, dict):
+            return iter(self._source_dict)
+        return (self[index] for index in range(len(self._source_dict)))
+
+    def __len__(self):
+        return len(self._source_dict)
+
+    def __contains__(self, item):
+        return item in self._source_dict
+
     def __dir__(self):
         return itertools.chain(super().__dir__(), self._source_dict.keys())
 
@@ -109,7 +450,8 @@ class DynamicResponseData:
 
     def __repr__(self):
         obj = f"{self.__class__.__module__}.{self.__class__.__name__}"
-        attrs = f"name='{self._name}', content={json.dumps(self._source_dict)}"
+        content = json.dumps(self._source_dict)
+        attrs = f"name='{self._name}', content={content}"
         return f"<{obj} object at {hex(id(self))} ({attrs})>"
 
     def as_dict(self):
@@ -1,4 +1,7 @@
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import faker
 import pytest
@@ -9,14 +12,18 @@ from .utils import get_template, load_data_from_file, get_random_imgur_id
 class ResponseFixture:
     FIXTURE_DIR = "tests/fixtures/"
 
-    def __init__(self, status=200, reason="OK", content=b""):
+    def __init__(self, status=200, reason="OK", content=b"", headers=None):
         self.status = status
         self.reason = reason
         self.content = content
+        self.headers = headers or {}
 
     def read(self):
         return self.content
 
+    def close(self):
+        pass
+
     def json(self):
         return json.loads(self.content.decode("utf-8"))
 
@@ -112,3 +119,75 @@ def title_fixture():
 def description_fixture():
     fake = faker.Faker()
     return fake.text()
+
+
+class LocalHTTPServer(ThreadingHTTPServer):
+    """HTTP/1.1 server replaying canned responses in transport tests."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), LocalRequestHandler)
+        self.connections = 0
+        self.requests = []
+        self.responses = {}
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def set_response(
+        self, path, status=200, body=b"{}", headers=None, delay=0
+    ):
+        """
+        Reply to requests of `path` with a canned response.
+
+        `body` may be a function taking the request body and returning
+        the status and the body of the response.
+        """
+        self.responses[path] = (status, body, headers or {}, delay)
+
+
+class LocalRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append((self.command, self.path, body))
+        status, content, headers, delay = self.server.responses.get(
+            self.path, (200, b"{}", {}, 0)
+        )
+        time.sleep(delay)
+        if callable(content):
+            status, content = content(body)
+        etag = headers.get("ETag")
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            status, content = 304, b""
+        self.send_response(status)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_DELETE = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = LocalHTTPServer()
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.01,), daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import urllib.request
+
+import pytest
+
+from pyimgurapi import AsyncImgurAPI
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Album, Comment, Image
+from pyimgurapi.exceptions import PyImgurApiNotFound
+from pyimgurapi.utils import DynamicResponseData
+
+
+def make_endpoint(endpoint_class, server, pool):
+    endpoint = endpoint_class(transport=pool)
+    endpoint.base_url = server.url
+    return endpoint
+
+
+class TestAsyncEndpoints:
+    def test_get_image(self, local_server, imgur_image_get_200_response):
+        content = imgur_image_get_200_response.content
+        img_id = imgur_image_get_200_response.json()["data"]["id"]
+        local_server.set_response(f"/3/image/{img_id}", body=content)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                image = make_endpoint(Image, local_server, pool)
+                return await image.get_image(img_id)
+
+        res = asyncio.run(main())
+
+        assert isinstance(res, DynamicResponseData)
+        assert res.data.id == img_id
+        assert local_server.requests[0][:2] == ("GET", f"/3/image/{img_id}")
+
+    def test_post_comment(self, local_server, imgur_comment_post_200_response):
+        local_server.set_response(
+            "/3/comment", body=imgur_comment_post_200_response.content
+        )
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                comment = make_endpoint(Comment, local_server, pool)
+                return await comment.create("3MvMVho", "Lorem ipsum")
+
+        res = asyncio.run(main())
+
+        method, path, body = local_server.requests[0]
+        assert (method, path) == ("POST", "/3/comment")
+        assert b"Lorem ipsum" in body
+        assert res.as_dict() == imgur_comment_post_200_response.json()
+
+    def test_not_found(self, local_server):
+        local_server.set_response("/3/image/abc", status=404)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                image = make_endpoint(Image, local_server, pool)
+                await image.get_image("abc")
+
+        with pytest.raises(PyImgurApiNotFound):
+            asyncio.run(main())
+
+    def test_stream_album_images(self, local_server):
+        images = [{"id": str(i)} for i in range(1000)]
+        local_server.set_response(
+            "/3/album/abc/images",
+            body=json.dumps({"data": images, "success": True}).encode(),
+        )
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                album = make_endpoint(Album, local_server, pool)
+                album = album.with_options(stream=True)
+                streamed = list()
+                for _ in range(2):
+                    items = await album.album_images("abc")
+                    streamed.append([image.id async for image in items])
+                return streamed
+
+        streamed, streamed_again = asyncio.run(main())
+
+        assert streamed == streamed_again == [str(i) for i in range(1000)]
+        assert local_server.connections == 1
+
+
+class TestAsyncConnectionPool:
+    def test_concurrent_requests_share_connections(self, local_server):
+        local_server.set_response("/3/image/abc", body=b'{"data": 1}')
+
+        async def main():
+            pool = AsyncConnectionPool(max_concurrency=4)
+            image = make_endpoint(Image, local_server, pool)
+            results = await asyncio.gather(
+                *(image.get_image("abc") for _ in range(20))
+            )
+            await pool.close()
+            return results
+
+        results = asyncio.run(main())
+
+        assert [res.data for res in results] == [1] * 20
+        assert len(local_server.requests) == 20
+        assert local_server.connections <= 4
+
+    def test_acquire_times_out(self, local_server):
+        key = ("http", "127.0.0.1", local_server.server_address[1])
+
+        async def main():
+            async with AsyncConnectionPool(max_connections_per_host=1) as pool:
+                await pool.acquire(key)
+                await pool.acquire(key, timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(main())
+
+    def test_post_not_replayed_on_stale_connection(self, local_server):
+        def drop(body):
+            # Closes the connection without a response.
+            raise ConnectionResetError
+
+        local_server.set_response("/drop", body=drop)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                request = urllib.request.Request(f"{local_server.url}/ok")
+                await (await pool.urlopen(request)).read()
+                request = urllib.request.Request(
+                    f"{local_server.url}/drop", data=b"{}", method="POST"
+                )
+                await pool.urlopen(request)
+
+        with pytest.raises(asyncio.IncompleteReadError):
+            asyncio.run(main())
+
+        assert [r[0] for r in local_server.requests] == ["GET", "POST"]
+
+
+class TestAsyncImgurAPI:
+    def test_endpoints_are_awaitable(self):
+        api = AsyncImgurAPI(client_id="client")
+
+        assert isinstance(api.image, Image)
+        assert api.comment.transport is api.transport
+        assert api.transport.max_concurrency == 100
+
+    def test_sync_context_manager_rejected(self):
+        with pytest.raises(TypeError, match="async with"):
+            with AsyncImgurAPI():
+                pass
+
+    def test_endpoint_requires_transport(self):
+        with pytest.raises(TypeError, match="requires a transport"):
+            Image()
@@ -3,6 +3,8 @@ from unittest.mock import patch
 
 import pytest
 
+from pyimgurapi.cache import ResponseCache
+from pyimgurapi.endpoints import Image
 from pyimgurapi.endpoints.base_endpoint import BaseEndpoint
 
 
@@ -53,3 +55,40 @@ class TestBaseEndpoint:
             )
 
         urlopen_mock.assert_not_called()
+
+    @patch("urllib.request.urlopen")
+    def test_raw_mode(self, urlopen_mock, imgur_image_get_200_response):
+        urlopen_mock.return_value = imgur_image_get_200_response
+
+        image = Image(codec="json").with_options(raw=True)
+        with patch.object(json, "loads", wraps=json.loads) as loads_mock:
+            res = image.get_image("abc")
+
+        assert res == imgur_image_get_200_response.content
+        loads_mock.assert_not_called()
+
+    @patch("urllib.request.urlopen")
+    def test_lazy_mode(self, urlopen_mock, imgur_image_get_200_response):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        expected = imgur_image_get_200_response.json()
+
+        image = Image(codec="json").with_options(lazy=True)
+        with patch.object(json, "loads", wraps=json.loads) as loads_mock:
+            res = image.get_image("abc")
+            loads_mock.assert_not_called()
+            assert res.data.id == expected["data"]["id"]
+            assert res.as_dict() == expected
+
+        loads_mock.assert_called_once()
+
+    def test_raw_mode_cached(self, local_server):
+        body = b'{"data": {"id": "abc"}}'
+        local_server.set_response("/3/image/abc", body=body)
+
+        image = Image(cache=ResponseCache())
+        image.base_url = local_server.url
+        parsed = image.get_image("abc")
+        raw = image.with_options(raw=True).get_image("abc")
+
+        assert raw == body and parsed.data.id == "abc"
+        assert len(local_server.requests) == 1
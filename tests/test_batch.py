@@ -0,0 +1,87 @@
+import asyncio
+import random
+import threading
+import time
+from unittest.mock import patch
+
+from pyimgurapi import ImgurAPI
+from pyimgurapi.batch import amap_concurrently, map_concurrently
+from pyimgurapi.exceptions import PyImgurApiNotFound
+
+
+class TestMapConcurrently:
+    def test_results_in_input_order(self):
+        def slow_square(x):
+            time.sleep(random.random() / 100)
+            return x * x
+
+        results = list(map_concurrently(slow_square, range(50)))
+
+        assert [res.index for res in results] == list(range(50))
+        assert [res.result for res in results] == [x * x for x in range(50)]
+
+    def test_errors_collected_per_item(self):
+        def func(x):
+            if x % 3 == 0:
+                raise PyImgurApiNotFound("Not Found")
+            return x
+
+        results = list(map_concurrently(func, range(9), ordered=False))
+
+        assert sorted(res.index for res in results) == list(range(9))
+        failed = [res for res in results if not res.ok]
+        assert sorted(res.item for res in failed) == [0, 3, 6]
+        assert all(isinstance(r.error, PyImgurApiNotFound) for r in failed)
+
+    def test_max_in_flight_bounded(self):
+        lock, running, peak = threading.Lock(), [0], [0]
+
+        def func(x):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+            return x
+
+        consumed = iter(range(10**9))
+        results = map_concurrently(
+            func, consumed, max_workers=4, max_in_flight=4
+        )
+        for _ in range(20):
+            next(results)
+        results.close()
+
+        assert peak[0] <= 4
+        # Only the bounded window was pulled from the infinite input.
+        assert next(consumed) <= 20 + 4
+
+    def test_amap_concurrently(self):
+        async def func(x):
+            await asyncio.sleep(random.random() / 100)
+            if x == 2:
+                raise ValueError(x)
+            return x
+
+        async def main():
+            return [res async for res in amap_concurrently(func, range(5))]
+
+        results = asyncio.run(main())
+
+        assert [res.result for res in results] == [0, 1, None, 3, 4]
+        assert isinstance(results[2].error, ValueError)
+
+
+class TestImgurAPIMap:
+    @patch("pyimgurapi.transport.ConnectionPool.urlopen")
+    def test_map_get_image(self, urlopen_mock, imgur_image_get_200_response):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        api = ImgurAPI()
+        hashes = [f"hash{i}" for i in range(10)]
+
+        results = list(api.map(api.image.get_image, hashes, max_workers=3))
+
+        assert urlopen_mock.call_count == 10
+        assert [res.item for res in results] == hashes
+        assert all(res.ok for res in results)
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import random
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pyimgurapi import AsyncImgurAPI, ImgurAPI
+from pyimgurapi.bulk import UploadManifest
+from pyimgurapi.endpoints.base_endpoint import BaseEndpoint
+
+ALBUM = json.dumps({"data": {"id": "alb", "deletehash": "albdel"}}).encode()
+
+
+def upload_response(failing=()):
+    def respond(body):
+        name = re.search(rb'filename="(\w+)\.jpg"', body).group(1).decode()
+        time.sleep(random.random() / 50)
+        if name in failing:
+            return 500, b"{}"
+        data = dict(id=name, deletehash=f"{name}-del", link=f"{name}.jpg")
+        return 200, json.dumps({"data": data}).encode()
+
+    return respond
+
+
+def image_ids(body, field):
+    return re.findall(rb'name="%s\[\]"\r\n\r\n(\S+)\r\n' % field, body)
+
+
+@pytest.fixture
+def images(tmp_path, test_image):
+    paths = list()
+    for name in "abcdef":
+        path = tmp_path / f"{name}.jpg"
+        path.write_bytes(test_image)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def local_server(local_server):
+    with patch.object(BaseEndpoint, "base_url", local_server.url):
+        yield local_server
+
+
+def make_api(cls=ImgurAPI, access_token=None):
+    api = cls(client_id="client")
+    api.access_token = access_token
+    return api
+
+
+def requests_of(local_server, path):
+    return [body for _, p, body in local_server.requests if p == path]
+
+
+class TestBulkUpload:
+    def test_album_in_input_order(self, local_server, images):
+        local_server.set_response("/3/upload", body=upload_response())
+        local_server.set_response("/3/album", body=ALBUM)
+
+        with make_api(access_token="token") as api:
+            res = api.bulk_upload(images, create_album=True, max_workers=4)
+
+        assert res.ok
+        assert [upload.result.id for upload in res.uploads] == list("abcdef")
+        assert [upload.item for upload in res.uploads] == [
+            str(path) for path in images
+        ]
+        assert res.album == ("alb", "albdel", tuple("abcdef"))
+        (album_body,) = requests_of(local_server, "/3/album")
+        assert image_ids(album_body, b"ids") == [n.encode() for n in "abcdef"]
+
+    def test_upload_errors_leave_album_alone(self, local_server, images):
+        local_server.set_response(
+            "/3/upload", body=upload_response(failing={"c"})
+        )
+
+        with make_api() as api:
+            res = api.bulk_upload(images, create_album=True)
+
+        assert not res.ok and res.album is None
+        (failed,) = [upload for upload in res.uploads if not upload.ok]
+        assert failed.index == 2
+        assert failed.error.code == 500
+        assert not requests_of(local_server, "/3/album")
+
+    def test_resumed_from_manifest(self, local_server, images, tmp_path):
+        manifest = tmp_path / "upload.manifest"
+        local_server.set_response(
+            "/3/upload", body=upload_response(failing={"c"})
+        )
+        local_server.set_response("/3/album", body=ALBUM)
+
+        with make_api() as api:
+            api.bulk_upload(images[:4], create_album=True, manifest=manifest)
+            assert len(requests_of(local_server, "/3/upload")) == 4
+
+            local_server.set_response("/3/upload", body=upload_response())
+            res = api.bulk_upload(
+                images[:4], create_album=True, manifest=manifest
+            )
+
+        assert res.ok
+        assert len(requests_of(local_server, "/3/upload")) == 5
+        (album_body,) = requests_of(local_server, "/3/album")
+        assert image_ids(album_body, b"deletehashes") == [
+            b"a-del",
+            b"b-del",
+            b"c-del",
+            b"d-del",
+        ]
+        assert UploadManifest(manifest).album == res.album
+
+    def test_existing_album_extended(self, local_server, images, tmp_path):
+        manifest = tmp_path / "upload.manifest"
+        local_server.set_response("/3/upload", body=upload_response())
+        local_server.set_response("/3/album", body=ALBUM)
+
+        with make_api() as api:
+            api.bulk_upload(images[:3], create_album=True, manifest=manifest)
+            res = api.bulk_upload(images, manifest=manifest)
+
+        assert res.album == ("alb", "albdel", tuple("abcdef"))
+        assert len(requests_of(local_server, "/3/upload")) == 6
+        # Anonymous albums are modified by their deletehash.
+        (add_body,) = requests_of(local_server, "/3/album/albdel/add")
+        assert image_ids(add_body, b"deletehashes") == [
+            b"d-del",
+            b"e-del",
+            b"f-del",
+        ]
+
+    def test_torn_manifest_line_ignored(self, tmp_path):
+        manifest = tmp_path / "upload.manifest"
+        line = dict(type="image", source="a", id="a", deletehash="d", link="")
+        manifest.write_text(json.dumps(line) + "\n" + '{"type": "im')
+
+        assert list(UploadManifest(manifest).uploads) == ["a"]
+
+    def test_async_bulk_upload(self, local_server, images):
+        local_server.set_response("/3/upload", body=upload_response())
+
+        async def main():
+            api = make_api(AsyncImgurAPI, access_token="t")
+            async with api:
+                return await api.bulk_upload(images, album="xyz")
+
+        res = asyncio.run(main())
+
+        assert res.album == ("xyz", None, tuple("abcdef"))
+        (add_body,) = requests_of(local_server, "/3/album/xyz/add")
+        assert image_ids(add_body, b"ids") == [n.encode() for n in "abcdef"]
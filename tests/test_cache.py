@@ -0,0 +1,295 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Image as AsyncImage
+from pyimgurapi.cache import ResponseCache, dependency_tags, make_cache_key
+from pyimgurapi.endpoints import Album, Comment, Image
+from pyimgurapi.transport import ConnectionPool
+from pyimgurapi.utils import DynamicResponseData
+
+from .conftest import ResponseFixture
+
+
+class TestResponseCache:
+    def test_lru_eviction_by_entries(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", b"1", 1)
+        cache.set("b", b"2", 2)
+        cache.get("a")
+        cache.set("c", b"3", 3)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats().evictions == 1
+
+    def test_eviction_by_bytes(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.set("a", b"x" * 6, None)
+        cache.set("b", b"x" * 6, None)
+
+        assert len(cache) == 1
+        assert cache.stats().size == 6
+        assert cache.set("c", b"x" * 11, None) is None
+
+    def test_per_resource_ttl(self):
+        cache = ResponseCache(ttl=60, ttls={"album_images": 0.01})
+        cache.set("image", b"{}", {}, resource="image")
+        cache.set("images", b"[]", [], resource="album_images")
+        time.sleep(0.02)
+
+        assert cache.get("image") is not None
+        assert cache.get("images") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_zero_ttl_disables_resource(self):
+        cache = ResponseCache(ttls={"comment": 0})
+
+        assert cache.set("key", b"{}", {}, resource="comment") is None
+        assert len(cache) == 0
+
+    def test_key_depends_on_identity(self):
+        url = "https://api.imgur.com/3/account/me"
+
+        assert make_cache_key("GET", url, "Bearer a") != make_cache_key(
+            "GET", url, "Bearer b"
+        )
+        assert "Bearer" not in make_cache_key("GET", url, "Bearer a")
+
+
+class TestCachedEndpoints:
+    @patch("urllib.request.urlopen")
+    def test_hit_served_without_network(
+        self, urlopen_mock, imgur_image_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        img_id = imgur_image_get_200_response.json()["data"]["id"]
+        cache = ResponseCache()
+        image = Image(access_token="token", cache=cache)
+
+        first = image.get_image(img_id)
+        second = image.get_image(img_id)
+
+        urlopen_mock.assert_called_once()
+        assert isinstance(second, DynamicResponseData)
+        assert second.data.id == first.data.id == img_id
+        assert cache.stats().hits == 1
+
+    @patch("urllib.request.urlopen")
+    def test_identities_do_not_share_entries(
+        self, urlopen_mock, imgur_album_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_album_get_200_response
+        cache = ResponseCache()
+
+        Album(access_token="first", cache=cache).get_album("abc")
+        Album(access_token="second", cache=cache).get_album("abc")
+
+        assert urlopen_mock.call_count == 2
+
+    @patch("urllib.request.urlopen")
+    def test_projections_cached_separately(
+        self, urlopen_mock, imgur_image_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        data = imgur_image_get_200_response.json()["data"]
+        cache = ResponseCache()
+        image = Image(cache=cache)
+
+        projected = image.get_image(data["id"], fields=("id", "link"))
+        full = image.get_image(data["id"])
+        again = image.with_options(raw=True).get_image(
+            data["id"], fields=["link", "id"]
+        )
+
+        assert urlopen_mock.call_count == 2
+        assert full.as_dict()["data"] == data
+        assert json.loads(again) == projected.as_dict()
+        assert set(projected.as_dict()["data"]) == {"id", "link"}
+        assert len(again) < len(imgur_image_get_200_response.content) / 4
+        # Tagged by the deletehash although it was dropped.
+        cache.invalidate({f"image:{data['deletehash']}"})
+        assert len(cache) == 0
+
+    @patch("urllib.request.urlopen")
+    def test_mutations_and_bypass_not_cached(
+        self, urlopen_mock, imgur_common_200_response
+    ):
+        urlopen_mock.return_value = imgur_common_200_response
+        cache = ResponseCache()
+        image = Image(cache=cache)
+
+        image.favorite("abc")
+        image.with_options(cache=None).get_image("abc")
+
+        assert len(cache) == 0
+
+
+class TestRevalidation:
+    def test_not_modified_refreshes_entry(self, local_server):
+        local_server.set_response(
+            "/3/album/abc/images",
+            body=b'{"data": [{"id": "x"}]}',
+            headers={"ETag": '"v1"'},
+        )
+        cache = ResponseCache(ttls={"album_images": 0.01})
+
+        with ConnectionPool() as pool:
+            album = Album(transport=pool, cache=cache)
+            album.base_url = local_server.url
+            album.album_images("abc")
+            time.sleep(0.02)
+            res = album.album_images("abc")
+            album.album_images("abc")
+
+        assert len(local_server.requests) == 2
+        assert res.data[0].id == "x"
+        stats = cache.stats()
+        assert (stats.hits, stats.revalidations) == (1, 1)
+
+    def test_modified_replaces_entry(self, local_server):
+        local_server.set_response(
+            "/3/image/abc", body=b'{"data": 1}', headers={"ETag": '"v1"'}
+        )
+        cache = ResponseCache(ttl=0.01)
+
+        with ConnectionPool() as pool:
+            image = Image(transport=pool, cache=cache)
+            image.base_url = local_server.url
+            image.get_image("abc")
+            time.sleep(0.02)
+            local_server.set_response(
+                "/3/image/abc", body=b'{"data": 2}', headers={"ETag": '"v2"'}
+            )
+            res = image.get_image("abc")
+
+        assert res.data == 2
+        assert cache.stats().revalidations == 0
+
+    def test_async_not_modified(self, local_server):
+        local_server.set_response(
+            "/3/image/abc",
+            body=b'{"data": 1}',
+            headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        cache = ResponseCache(ttl=0.01)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                image = AsyncImage(transport=pool, cache=cache)
+                image.base_url = local_server.url
+                await image.get_image("abc")
+                await asyncio.sleep(0.02)
+                local_server.set_response("/3/image/abc", status=304, body=b"")
+                return await image.get_image("abc")
+
+        res = asyncio.run(main())
+
+        assert res.data == 1
+        assert cache.stats().revalidations == 1
+
+    def test_stale_entry_without_validators_dropped(self):
+        cache = ResponseCache(ttl=0.01)
+        cache.set("key", b"{}", {})
+        time.sleep(0.02)
+
+        assert cache.get("key", stale=True) is None
+        assert "key" not in cache
+
+
+class TestInvalidation:
+    def test_dependency_tags(self):
+        images = {"data": [{"id": "x", "deletehash": "dx"}, {"id": "y"}]}
+        replies = {"data": {"id": 1, "children": [{"id": 2, "children": []}]}}
+
+        assert dependency_tags("album_images", images) == {
+            "image:x",
+            "image:dx",
+            "image:y",
+        }
+        assert dependency_tags("comment_replies", replies) == {
+            "comment:1",
+            "comment:2",
+        }
+        assert dependency_tags("account", {"data": {"id": 1}}) == set()
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        cache.set("album", b"[]", [], tags={"album:a", "image:x"})
+        cache.set("image", b"{}", {}, tags={"image:x"})
+        cache.set("other", b"{}", {}, tags={"image:y"})
+
+        assert cache.invalidate(["image:x"]) == 2
+        assert len(cache) == 1 and "other" in cache
+        assert cache.invalidate(["image:x"]) == 0
+
+    def test_update_evicts_image_and_album_images(self, local_server):
+        local_server.set_response(
+            "/3/album/abc/images",
+            body=b'{"data": [{"id": "x", "deletehash": "dx"}, {"id": "y"}]}',
+        )
+        local_server.set_response("/3/album/def/images", body=b'{"data": []}')
+        local_server.set_response(
+            "/3/image/x", body=b'{"data": {"id": "x", "deletehash": "dx"}}'
+        )
+        cache = ResponseCache(ttl=3600)
+
+        with ConnectionPool() as pool:
+            album = Album(transport=pool, cache=cache)
+            image = Image(transport=pool, cache=cache)
+            album.base_url = image.base_url = local_server.url
+
+            def load():
+                album.album_images("abc")
+                album.album_images("def")
+                image.get_image("x")
+
+            load()
+            image.update("x", title="New title")
+            load()
+            image.delete("dx")
+            load()
+
+        paths = [path for _, path, _ in local_server.requests]
+        assert paths.count("/3/album/abc/images") == 3
+        assert paths.count("/3/image/x") == 4
+        assert paths.count("/3/album/def/images") == 1
+
+    @patch("urllib.request.urlopen")
+    def test_album_mutations_evict_album(
+        self, urlopen_mock, imgur_common_200_response
+    ):
+        urlopen_mock.return_value = imgur_common_200_response
+        cache = ResponseCache()
+        album = Album(cache=cache)
+
+        for mutate in (
+            lambda: album.add("abc", image_ids=["x"]),
+            lambda: album.remove_images("abc", image_ids=["x"]),
+            lambda: album.set_images("abc", image_ids=["x"]),
+        ):
+            album.get_album("abc")
+            album.album_images("abc")
+            assert len(cache) == 2
+            mutate()
+            assert len(cache) == 0
+
+    @patch("urllib.request.urlopen")
+    def test_comment_delete_evicts_parent_replies(
+        self, urlopen_mock, imgur_common_200_response
+    ):
+        urlopen_mock.return_value = ResponseFixture(
+            content=b'{"data": {"id": 1, "children": [{"id": 2}]}}'
+        )
+        cache = ResponseCache()
+        comment = Comment(cache=cache)
+        comment.replies(1)
+
+        urlopen_mock.return_value = imgur_common_200_response
+        comment.delete(2)
+
+        assert len(cache) == 0
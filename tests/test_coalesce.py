@@ -0,0 +1,146 @@
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Album as AsyncAlbum
+from pyimgurapi.coalesce import AsyncSingleFlight, SingleFlight
+from pyimgurapi.endpoints import Album
+from pyimgurapi.exceptions import PyImgurApiNotFound, PyImgurApiTimeout
+from pyimgurapi.timeouts import Deadline
+from pyimgurapi.transport import ConnectionPool
+
+
+def call_concurrently(func, count=8):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(func) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight:
+    def test_identical_gets_share_one_call(self, local_server):
+        local_server.set_response(
+            "/3/album/abc/images", body=b'{"data": [1, 2]}', delay=0.2
+        )
+        single_flight = SingleFlight()
+
+        with ConnectionPool() as pool:
+            album = Album(transport=pool, single_flight=single_flight)
+            album.base_url = local_server.url
+            results = call_concurrently(lambda: album.album_images("abc"))
+
+        assert len(local_server.requests) == 1
+        assert all(res is results[0] for res in results)
+        assert results[0].as_dict() == {"data": [1, 2]}
+        assert single_flight.coalesced == 7
+
+    def test_error_shared(self, local_server):
+        local_server.set_response("/3/album/abc", status=404, delay=0.2)
+
+        with ConnectionPool() as pool:
+            album = Album(transport=pool, single_flight=SingleFlight())
+            album.base_url = local_server.url
+
+            def get_album():
+                with pytest.raises(PyImgurApiNotFound):
+                    album.get_album("abc")
+
+            call_concurrently(get_album, count=4)
+
+        assert len(local_server.requests) == 1
+
+    def test_different_identities_not_coalesced(self, local_server):
+        local_server.set_response("/3/album/abc", delay=0.2)
+        single_flight = SingleFlight()
+
+        with ConnectionPool() as pool:
+            albums = [
+                Album(
+                    access_token=token,
+                    transport=pool,
+                    single_flight=single_flight,
+                )
+                for token in ("first", "second")
+            ]
+            for album in albums:
+                album.base_url = local_server.url
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                list(executor.map(lambda a: a.get_album("abc"), albums))
+
+        assert len(local_server.requests) == 2
+
+    def test_response_modes_not_coalesced(self, local_server):
+        body = b'{"data": {"id": "abc"}}'
+        local_server.set_response("/3/album/abc", body=body, delay=0.2)
+        single_flight = SingleFlight()
+
+        with ConnectionPool() as pool:
+            album = Album(transport=pool, single_flight=single_flight)
+            album.base_url = local_server.url
+            albums = [album, album.with_options(raw=True)]
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                results = executor.map(lambda a: a.get_album("abc"), albums)
+                parsed, raw = results
+
+        assert parsed.data.id == "abc" and raw == body
+        assert len(local_server.requests) == 2
+
+    def test_waiter_deadline(self, local_server):
+        local_server.set_response("/3/album/abc", delay=0.3)
+        single_flight = SingleFlight()
+
+        with ConnectionPool() as pool:
+            album = Album(transport=pool, single_flight=single_flight)
+            album.base_url = local_server.url
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                leader = executor.submit(album.get_album, "abc")
+                time.sleep(0.05)
+                with Deadline(0.05):
+                    with pytest.raises(PyImgurApiTimeout):
+                        album.get_album("abc")
+                assert leader.result().as_dict() == {}
+
+        assert single_flight.coalesced == 1
+        assert len(local_server.requests) == 1
+
+
+class TestAsyncSingleFlight:
+    def test_identical_gets_share_one_call(self, local_server):
+        local_server.set_response(
+            "/3/album/abc/images", body=b'{"data": [1, 2]}', delay=0.2
+        )
+        single_flight = AsyncSingleFlight()
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                album = AsyncAlbum(transport=pool, single_flight=single_flight)
+                album.base_url = local_server.url
+                return await asyncio.gather(
+                    *(album.album_images("abc") for _ in range(8))
+                )
+
+        results = asyncio.run(main())
+
+        assert len(local_server.requests) == 1
+        assert all(res is results[0] for res in results)
+        assert single_flight.coalesced == 7
+
+    def test_cancelled_waiter_does_not_cancel_call(self, local_server):
+        local_server.set_response("/3/album/abc", delay=0.2)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                album = AsyncAlbum(
+                    transport=pool, single_flight=AsyncSingleFlight()
+                )
+                album.base_url = local_server.url
+                first = asyncio.ensure_future(album.get_album("abc"))
+                second = asyncio.ensure_future(album.get_album("abc"))
+                await asyncio.sleep(0.05)
+                first.cancel()
+                return await second
+
+        assert asyncio.run(main()).as_dict() == {}
+        assert len(local_server.requests) == 1
@@ -0,0 +1,65 @@
+import importlib
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pyimgurapi import ImgurAPI
+from pyimgurapi.codec import CODECS, JSONCodec, get_codec
+from pyimgurapi.endpoints import Image
+
+
+class TestCodec:
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_round_trip(self, name, general_json_dict):
+        pytest.importorskip(name)
+        codec = get_codec(name)
+
+        encoded = codec.dumps(general_json_dict)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == general_json_dict
+        assert codec.loads(codec.dumps(general_json_dict, indent=True)) == (
+            general_json_dict
+        )
+
+    def test_auto_prefers_installed_backends(self):
+        for name in CODECS:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                continue
+            assert get_codec().name == name
+            break
+        assert get_codec() is get_codec("auto") is get_codec(None)
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_codec("yaml")
+
+    def test_selected_per_api(self):
+        codec = JSONCodec()
+        api = ImgurAPI(json_codec=codec)
+
+        assert api.image.codec is api.album.codec is codec
+        assert ImgurAPI(json_codec="json").album.codec is get_codec("json")
+        assert Image().with_options(codec="json").codec is get_codec("json")
+
+    @patch("urllib.request.urlopen")
+    def test_body_logged_only_at_debug_level(
+        self, urlopen_mock, imgur_image_get_200_response, caplog
+    ):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        codec = Mock(wraps=JSONCodec())
+        image = Image(codec=codec)
+
+        caplog.set_level(logging.INFO)
+        image.get_image("abc")
+        codec.dumps.assert_not_called()
+
+        caplog.set_level(logging.DEBUG)
+        res = image.get_image("abc")
+        codec.dumps.assert_called_once()
+        assert codec.loads.call_count == 2
+        assert "Response body:\n{\n" in caplog.text
+        assert res.as_dict() == imgur_image_get_200_response.json()
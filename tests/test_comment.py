@@ -1,8 +1,15 @@
+import asyncio
+import json
+import time
 from unittest.mock import patch
 
 import pytest
 
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Comment as AsyncComment
 from pyimgurapi.endpoints import Comment
+from pyimgurapi.threads import ThreadComment
+from pyimgurapi.transport import ConnectionPool
 from pyimgurapi.utils import EOL, DynamicResponseData
 from tests.utils import get_random_imgur_id, get_random_imgur_digit_id
 
@@ -158,3 +165,74 @@ class TestComment:
             comment.report(comment_id, reason)
 
         urlopen_mock.assert_not_called()
+
+
+def set_thread(local_server, tree, delay=0):
+    """Serve the replies of every comment of `{id: [reply ids]}`."""
+    parents = {child: parent for parent in tree for child in tree[parent]}
+
+    def comment(comment_id):
+        return dict(
+            id=comment_id,
+            parent_id=parents.get(comment_id, 0),
+            author=f"user{comment_id}",
+            points=comment_id % 7,
+            comment=f"text {comment_id}",
+            children=[],
+        )
+
+    for comment_id, replies in tree.items():
+        data = dict(
+            comment(comment_id),
+            children=[comment(reply) for reply in replies],
+        )
+        local_server.set_response(
+            f"/3/comment/{comment_id}/replies",
+            body=json.dumps({"data": data}).encode(),
+            delay=delay,
+        )
+
+
+class TestCommentThread:
+    tree = {1: [2, 3], 2: [4, 5], 3: [6], 4: [7], 5: [], 6: [], 7: []}
+
+    def test_breadth_first(self, local_server):
+        set_thread(local_server, self.tree, delay=0.1)
+
+        with ConnectionPool() as pool:
+            comment = Comment(transport=pool)
+            comment.base_url = local_server.url
+            started = time.monotonic()
+            thread = comment.thread(1)
+            elapsed = time.monotonic() - started
+
+        assert [c.id for c in thread] == [1, 2, 3, 4, 5, 6, 7]
+        assert thread[3] == ThreadComment(4, 2, "user4", 4, "text 4")
+        assert thread[0].parent_id == 0
+        # The replies of each level are fetched concurrently.
+        assert len(local_server.requests) == 7
+        assert elapsed < 0.6
+
+    def test_depth_and_size_caps(self, local_server):
+        set_thread(local_server, self.tree)
+
+        with ConnectionPool() as pool:
+            comment = Comment(transport=pool)
+            comment.base_url = local_server.url
+            shallow = comment.thread(1, max_depth=1)
+            assert len(local_server.requests) == 1
+            small = comment.thread(1, max_comments=4)
+
+        assert [c.id for c in shallow] == [1, 2, 3]
+        assert [c.id for c in small] == [1, 2, 3, 4]
+
+    def test_async_thread(self, local_server):
+        set_thread(local_server, self.tree)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                comment = AsyncComment(transport=pool)
+                comment.base_url = local_server.url
+                return await comment.thread(1, max_depth=2)
+
+        assert [c.id for c in asyncio.run(main())] == [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import io
+import json
+import os
+import threading
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from pyimgurapi import AsyncImgurAPI, ImgurAPI
+from pyimgurapi.dedupe import DedupeIndex, file_digest
+from pyimgurapi.endpoints.base_endpoint import BaseEndpoint
+from pyimgurapi.utils import File
+
+UPLOADED = json.dumps(
+    {"data": {"id": "abc", "deletehash": "abc-del", "link": "abc.jpg"}}
+).encode()
+
+
+@pytest.fixture
+def local_server(local_server):
+    local_server.set_response("/3/upload", body=UPLOADED)
+    with patch.object(BaseEndpoint, "base_url", local_server.url):
+        yield local_server
+
+
+def uploads(local_server):
+    return [
+        path for _, path, _ in local_server.requests if path == "/3/upload"
+    ]
+
+
+class TestDedupeIndex:
+    def test_journal_survives_restart(self, tmp_path):
+        path = tmp_path / "dedupe.jsonl"
+        index = DedupeIndex(path)
+        index.add("d1", ("a", "a-del", "a.jpg"))
+        index.add("d2", ("b", "b-del", "b.jpg"))
+        assert index.discard(["b-del"]) == 1
+
+        index = DedupeIndex(path)
+
+        assert index.get("d1") == ("a", "a-del", "a.jpg")
+        assert "d2" not in index and len(index) == 1
+        assert index.hits == 1
+
+    def test_torn_journal_line_ignored(self, tmp_path):
+        path = tmp_path / "dedupe.jsonl"
+        path.write_text('["d1", ["a", "a-del", "a.jpg"]]\n["d2", ["b", "')
+
+        assert len(DedupeIndex(path)) == 1
+
+    def test_digest_streamed(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        content = os.urandom(8 * 2**20)
+        path.write_bytes(content)
+
+        tracemalloc.start()
+        try:
+            digest = file_digest(File("video.mp4", path, "image"))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert digest == hashlib.sha256(content).hexdigest()
+        assert peak < 2**20
+
+
+class TestDedupedUpload:
+    def test_identical_content_uploaded_once(self, local_server, test_image):
+        index = DedupeIndex()
+        with ImgurAPI(client_id="client", dedupe=index) as api:
+            first = api.image.upload(io.BytesIO(test_image), "cat.jpg")
+            second = api.image.upload(io.BytesIO(test_image), "copy.jpg")
+            other = api.image.upload(io.BytesIO(b"other"), "other.jpg")
+
+        assert len(uploads(local_server)) == 2
+        assert second.data.id == first.data.id == other.data.id == "abc"
+        assert second.data.deletehash == "abc-del"
+        assert index.hits == 1 and len(index) == 2
+
+    def test_deleted_image_uploaded_again(self, local_server, test_image):
+        with ImgurAPI(client_id="client", dedupe=DedupeIndex()) as api:
+            api.image.upload(io.BytesIO(test_image), "cat.jpg")
+            api.image.delete("abc-del")
+            api.image.upload(io.BytesIO(test_image), "cat.jpg")
+
+        assert len(uploads(local_server)) == 2
+
+    def test_bypassed(self, local_server, test_image):
+        with ImgurAPI(client_id="client", dedupe=DedupeIndex()) as api:
+            api.image.upload(io.BytesIO(test_image), "cat.jpg")
+            api.image.with_options(dedupe=None).upload(
+                io.BytesIO(test_image), "cat.jpg"
+            )
+            api.image.upload(io.BytesIO(test_image), "cat.jpg", album="x")
+
+        assert len(uploads(local_server)) == 3
+
+    def test_bulk_upload_skips_duplicates(
+        self, local_server, tmp_path, test_image
+    ):
+        paths = list()
+        for name in "abcd":
+            path = tmp_path / f"{name}.jpg"
+            path.write_bytes(test_image if name in "ac" else name.encode())
+            paths.append(path)
+
+        with ImgurAPI(client_id="client", dedupe=DedupeIndex()) as api:
+            api.image.upload(paths[0])
+            res = api.bulk_upload(paths, max_workers=4)
+
+        assert res.ok
+        assert len(uploads(local_server)) == 3
+
+    def test_async_upload(self, local_server, test_image):
+        index = DedupeIndex()
+
+        async def main():
+            async with AsyncImgurAPI(client_id="client", dedupe=index) as api:
+                for _ in range(3):
+                    res = await api.image.upload(
+                        io.BytesIO(test_image), "cat.jpg"
+                    )
+                return res
+
+        digest = index.digest
+        threads = list()
+
+        def record_thread(file):
+            threads.append(threading.current_thread())
+            return digest(file)
+
+        with patch.object(index, "digest", record_thread):
+            assert asyncio.run(main()).data.id == "abc"
+
+        assert len(uploads(local_server)) == 1
+        assert index.hits == 2
+        # Hashed off the event loop.
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
@@ -20,6 +20,21 @@ class TestImage:
         assert isinstance(res, DynamicResponseData)
         assert res.data.id == img_id
 
+    @patch("urllib.request.urlopen")
+    def test_get_image_fields(
+        self, urlopen_mock, imgur_image_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        expected = imgur_image_get_200_response.json()
+
+        res = Image().get_image("abc", fields=("id", "link"))
+
+        assert res.as_dict()["data"] == {
+            "id": expected["data"]["id"],
+            "link": expected["data"]["link"],
+        }
+        assert res.success is True and res.status == 200
+
     @patch("urllib.request.urlopen")
     def test_upload(
         self, urlopen_mock, imgur_image_post_200_response, test_image
@@ -0,0 +1,84 @@
+import json
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from pyimgurapi.endpoints import Account, Album, Comment
+from pyimgurapi.models import Album as AlbumModel
+from pyimgurapi.models import Comment as CommentModel
+from pyimgurapi.models import Image as ImageModel
+from pyimgurapi.transport import ConnectionPool
+
+
+class TestModels:
+    @patch("urllib.request.urlopen")
+    def test_album_from_response(
+        self, urlopen_mock, imgur_album_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_album_get_200_response
+        data = imgur_album_get_200_response.json()["data"]
+
+        album = AlbumModel.from_response(Album().get_album(data["id"]))
+
+        assert album.id == data["id"] and album.title == data["title"]
+        assert album.images == ()
+        with pytest.raises(AttributeError):
+            album.ad_config
+
+    @patch("urllib.request.urlopen")
+    def test_comment_children(
+        self, urlopen_mock, imgur_replies_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_replies_get_200_response
+        data = imgur_replies_get_200_response.json()["data"]
+
+        comment = CommentModel.from_response(Comment().replies(data["id"]))
+
+        assert comment.points == data["points"]
+        assert [c.points for c in comment.children] == [5, 3]
+        assert comment.children[0].children == ()
+
+    def test_missing_fields_are_none(self):
+        image = ImageModel.from_dict({"id": "abc", "ad_config": {}})
+
+        assert image == ImageModel(id="abc")
+        assert image.link is None
+        assert not hasattr(image, "__dict__")
+        assert image.as_dict()["id"] == "abc"
+
+    def test_album_images(self):
+        album = AlbumModel.from_dict({"id": "x", "images": [{"id": "a"}]})
+
+        assert album.images == (ImageModel(id="a"),)
+
+    def test_smaller_than_dict(self, imgur_image_get_200_response):
+        body = imgur_image_get_200_response.content
+
+        def retained(build):
+            tracemalloc.start()
+            objects = [build(json.loads(body)["data"]) for _ in range(100)]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del objects
+            return size
+
+        assert retained(ImageModel.from_dict) < retained(dict) / 2
+
+    def test_listing_decoded_into_models(self, local_server):
+        local_server.set_response(
+            "/3/account/me/images/count", body=b'{"data": 2}'
+        )
+        for page, images in enumerate([[{"id": "a"}, {"id": "b"}], []]):
+            local_server.set_response(
+                f"/3/account/me/images/{page}",
+                body=json.dumps({"data": images}).encode(),
+            )
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            gathered = account.all_images(model=ImageModel)
+            iterated = list(account.iter_images(model=ImageModel))
+
+        assert gathered == iterated == [ImageModel(id="a"), ImageModel(id="b")]
@@ -0,0 +1,182 @@
+import asyncio
+import io
+import mmap
+import os
+import socket
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Image as AsyncImage
+from pyimgurapi.endpoints import Image
+from pyimgurapi.form_factories import get_image_form
+from pyimgurapi.transport import ConnectionPool
+from pyimgurapi.utils import Field, File, MultipartForm
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / "video.mp4"
+    with open(path, "wb") as file:
+        for _ in range(16):
+            file.write(os.urandom(2**20))
+    return path
+
+
+class TestMultipartForm:
+    def test_stream_matches_in_memory_body(self, test_image):
+        fields = [Field("title", "Cat")]
+        streamed = MultipartForm(
+            fields=fields,
+            files=[File("cat.jpg", io.BytesIO(test_image), "image")],
+        )
+        in_memory = MultipartForm(
+            fields=fields, files=[File("cat.jpg", test_image, "image")]
+        )
+        in_memory.boundary = streamed.boundary
+
+        assert streamed.is_stream and not in_memory.is_stream
+        assert bytes(streamed) == bytes(in_memory)
+        assert streamed.content_length() == len(bytes(in_memory))
+        assert isinstance(in_memory.payload(), bytes)
+        assert streamed.payload() is streamed
+
+    def test_encoded_once(self, test_image):
+        form = get_image_form(title="Cat")
+        form.files = [File("cat.jpg", test_image, "image")]
+
+        with patch.object(
+            form, "_field_part", wraps=form._field_part
+        ) as field_part:
+            assert len(form) == len(bytes(form))
+            assert bytes(form) is bytes(form) is form.payload()
+
+        field_part.assert_called_once()
+
+    def test_iteration_rewinds_file(self, test_image):
+        file_obj = io.BytesIO(b"prefix" + test_image)
+        file_obj.seek(6)
+        form = MultipartForm(files=[File("cat.jpg", file_obj, "image")])
+
+        assert bytes(form) == bytes(form)
+        assert test_image in bytes(form)
+        assert test_image[:6] + b"prefix" not in bytes(form)
+
+    def test_peak_memory_flat(self, big_file):
+        with open(big_file, "rb") as file_obj:
+            form = get_image_form(file_obj, "video.mp4", title="Video")
+
+            tracemalloc.start()
+            try:
+                length = sum(len(chunk) for chunk in form)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert length == form.content_length() > 16 * 2**20
+        assert peak < 2**20
+
+    def test_unsized_file_read_into_memory(self, test_image):
+        class Stream:
+            def read(self):
+                return test_image
+
+        form = get_image_form(Stream(), "cat.jpg")
+
+        assert not form.is_stream
+        assert test_image in bytes(form)
+
+
+class TestZeroCopySources:
+    def test_path_source(self, big_file):
+        form = get_image_form(big_file, title="Video")
+
+        assert form.files[0].name == "video.mp4"
+        assert form.files[0].is_file
+        assert len(form) == len(bytes(form))
+        assert big_file.read_bytes() in bytes(form)
+
+    def test_filename_of_opened_file(self, big_file):
+        with open(big_file, "rb") as file_obj:
+            form = get_image_form(file_obj)
+
+            assert form.files[0].name == "video.mp4"
+
+    def test_filename_required(self, test_image):
+        with pytest.raises(TypeError, match="filename is required"):
+            get_image_form(test_image, title="Cat")
+
+    def test_buffers_not_copied(self, big_file):
+        with open(big_file, "rb") as file_obj:
+            mapped = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            form = get_image_form(mapped, "video.mp4")
+
+            tracemalloc.start()
+            try:
+                payload = form.payload()
+                length = sum(len(chunk) for chunk in payload)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            assert payload is form
+            assert length == len(form) > 16 * 2**20
+            assert peak < 2**20
+            del payload, form
+        finally:
+            mapped.close()
+
+    def test_bytearray_source(self, test_image):
+        form = get_image_form(bytearray(test_image), "cat.jpg")
+
+        assert form.is_stream and not form.files[0].is_file
+        assert test_image in bytes(form)
+
+    def test_sendfile_used(self, local_server, big_file):
+        sendfile = socket.socket.sendfile
+        with ConnectionPool() as pool, patch.object(
+            socket.socket, "sendfile", autospec=True, side_effect=sendfile
+        ) as sendfile_mock:
+            image = Image(transport=pool)
+            image.base_url = local_server.url
+            image.upload(big_file, title="Video")
+
+        sendfile_mock.assert_called_once()
+        body = local_server.requests[0][2]
+        assert big_file.read_bytes() in body
+        assert b'filename="video.mp4"' in body
+
+
+class TestStreamingUpload:
+    def test_upload_streamed(self, local_server, big_file):
+        with ConnectionPool() as pool:
+            image = Image(transport=pool)
+            image.base_url = local_server.url
+            with open(big_file, "rb") as file_obj:
+                image.upload(file_obj, "video.mp4")
+
+        method, path, body = local_server.requests[0]
+        assert (method, path) == ("POST", "/3/upload")
+        assert big_file.read_bytes() in body
+
+    def test_upload_streamed_urllib(self, local_server, test_image):
+        image = Image()
+        image.base_url = local_server.url
+        image.upload(io.BytesIO(test_image), "cat.jpg")
+
+        assert test_image in local_server.requests[0][2]
+
+    def test_async_upload_streamed(self, local_server, big_file):
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                image = AsyncImage(transport=pool)
+                image.base_url = local_server.url
+                with open(big_file, "rb") as file_obj:
+                    await image.upload(file_obj, "video.mp4")
+
+        asyncio.run(main())
+
+        assert big_file.read_bytes() in local_server.requests[0][2]
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Account as AsyncAccount
+from pyimgurapi.endpoints import Account
+from pyimgurapi.exceptions import PyImgurApiNotFound
+from pyimgurapi.transport import ConnectionPool
+
+
+def set_pages(local_server, path, pages, delay=0):
+    for page, items in enumerate(pages + [[]]):
+        local_server.set_response(
+            f"{path}/{page}",
+            body=json.dumps({"data": items}).encode(),
+            delay=delay,
+        )
+
+
+def requested(local_server):
+    return [path for _, path, _ in local_server.requests]
+
+
+class TestPagination:
+    def test_items_of_all_pages(self, local_server):
+        pages = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+        set_pages(local_server, "/3/account/me/images", pages)
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            ids = [image.id for image in account.iter_images()]
+
+        assert ids == ["a", "b", "c"]
+        assert requested(local_server) == [
+            "/3/account/me/images/0",
+            "/3/account/me/images/1",
+            "/3/account/me/images/2",
+        ]
+
+    def test_next_page_prefetched(self, local_server):
+        pages = [["a", "b"], ["c"]]
+        set_pages(local_server, "/3/account/me/images/ids", pages)
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            image_ids = account.iter_image_ids()
+            assert next(image_ids) == "a"
+            time.sleep(0.2)
+            assert requested(local_server) == [
+                "/3/account/me/images/ids/0",
+                "/3/account/me/images/ids/1",
+            ]
+            assert list(image_ids) == ["b", "c"]
+
+    def test_no_prefetch(self, local_server):
+        set_pages(local_server, "/3/account/me/favorites", [["a"], ["b"]])
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            favorites = account.iter_favorites(prefetch=False)
+            assert next(favorites) == "a"
+            time.sleep(0.1)
+            assert len(local_server.requests) == 1
+            assert list(favorites) == ["b"]
+
+    def test_abandoned_iterator(self, local_server):
+        path = "/3/account/me/gallery_favorites"
+        set_pages(local_server, path, [["a"], ["b"]], delay=0.1)
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            for item in account.iter_gallery_favorites():
+                break
+
+        assert item == "a"
+        assert len(local_server.requests) <= 2
+
+    def test_async_iterator(self, local_server):
+        pages = [[{"id": "a"}], [{"id": "b"}, {"id": "c"}]]
+        set_pages(local_server, "/3/account/me/images", pages, delay=0.05)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                account = AsyncAccount(transport=pool)
+                account.base_url = local_server.url
+                return [image.id async for image in account.iter_images()]
+
+        assert asyncio.run(main()) == ["a", "b", "c"]
+        assert len(local_server.requests) == 3
+
+
+class TestGatherPages:
+    def set_count(self, local_server, count):
+        local_server.set_response(
+            "/3/account/me/images/count",
+            body=json.dumps({"data": count}).encode(),
+        )
+
+    def test_pages_fetched_concurrently(self, local_server):
+        pages = [[{"id": f"{p}-{i}"} for i in range(50)] for p in range(3)]
+        # An upload during the scan shifted an image to the next page.
+        pages[1].insert(0, pages[0][-1])
+        self.set_count(local_server, 150)
+        set_pages(local_server, "/3/account/me/images", pages, delay=0.2)
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            started = time.monotonic()
+            images = account.all_images()
+            elapsed = time.monotonic() - started
+
+        assert [image.id for image in images] == [
+            f"{p}-{i}" for p in range(3) for i in range(50)
+        ]
+        # The pages and the empty one after them, not one by one.
+        assert elapsed < 0.6
+        assert "/3/account/me/images/3" in requested(local_server)
+
+    def test_items_added_during_scan(self, local_server):
+        self.set_count(local_server, 2)
+        set_pages(
+            local_server, "/3/account/me/images/ids", [["a", "b"], ["c"]]
+        )
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            assert account.all_image_ids() == ["a", "b", "c"]
+
+    def test_failed_page_raises(self, local_server):
+        self.set_count(local_server, 120)
+        set_pages(local_server, "/3/account/me/images", [[{"id": "a"}]] * 3)
+        local_server.set_response("/3/account/me/images/1", status=404)
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            with pytest.raises(PyImgurApiNotFound):
+                account.all_images()
+
+    def test_async(self, local_server):
+        self.set_count(local_server, 75)
+        pages = [[str(i) for i in range(50)], [str(i) for i in range(50, 75)]]
+        set_pages(local_server, "/3/account/me/images/ids", pages, delay=0.1)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                account = AsyncAccount(transport=pool)
+                account.base_url = local_server.url
+                return await account.all_image_ids()
+
+        assert asyncio.run(main()) == [str(i) for i in range(75)]
+
+    def test_fields(self, local_server):
+        self.set_count(local_server, 2)
+        images = [{"id": "a", "link": "a.jpg", "ad_config": {}}, {"id": "b"}]
+        set_pages(local_server, "/3/account/me/images", [images])
+
+        with ConnectionPool() as pool:
+            account = Account(transport=pool)
+            account.base_url = local_server.url
+            gathered = account.all_images(fields=["link"])
+
+        assert [image.as_dict() for image in gathered] == [
+            {"id": "a", "link": "a.jpg"},
+            {"id": "b"},
+        ]
@@ -0,0 +1,120 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pyimgurapi import ImgurAPI
+from pyimgurapi.exceptions import PyImgurApiRateLimited
+from pyimgurapi.ratelimit import RateLimiter, RateLimitTracker, TokenBucket
+from pyimgurapi.retry import RetryPolicy
+
+
+def rate_limit_headers(user_remaining=400, post_remaining=1000, reset=3600):
+    return {
+        "X-RateLimit-UserLimit": "500",
+        "X-RateLimit-UserRemaining": str(user_remaining),
+        "X-RateLimit-UserReset": str(int(time.time()) + reset),
+        "X-RateLimit-ClientLimit": "12500",
+        "X-RateLimit-ClientRemaining": "12000",
+        "X-Post-Rate-Limit-Limit": "1250",
+        "X-Post-Rate-Limit-Remaining": str(post_remaining),
+        "X-Post-Rate-Limit-Reset": str(reset),
+    }
+
+
+class TestRateLimitTracker:
+    def test_update(self):
+        tracker = RateLimitTracker()
+
+        updated = tracker.update(rate_limit_headers())
+
+        assert updated == {"user", "client", "post"}
+        assert tracker.get("user").remaining == 400
+        assert tracker.get("client").limit == 12500
+        assert tracker.get("post").reset_at == pytest.approx(
+            time.time() + 3600, abs=5
+        )
+
+    def test_update_without_headers(self):
+        tracker = RateLimitTracker()
+
+        assert tracker.update({"Content-Type": "application/json"}) == set()
+        assert tracker.budgets == {}
+
+
+class TestTokenBucket:
+    def test_unconfigured_bucket_never_delays(self):
+        bucket = TokenBucket(capacity=1)
+        now = time.monotonic()
+        for _ in range(100):
+            assert bucket.delay(now) == 0
+            bucket.consume()
+
+    def test_configured_bucket_paces(self):
+        bucket = TokenBucket(capacity=2)
+        now = time.monotonic()
+        bucket.configure(available=10, window=10, now=now)
+
+        for _ in range(2):
+            assert bucket.delay(now) == 0
+            bucket.consume()
+        assert bucket.delay(now) == pytest.approx(1)
+
+    def test_exhausted_bucket_blocks_until_reset(self):
+        bucket = TokenBucket()
+        now = time.monotonic()
+        bucket.configure(available=0, window=30, now=now)
+
+        assert bucket.delay(now) == pytest.approx(30)
+        assert bucket.delay(now + 31) == 0
+
+
+class TestRateLimiter:
+    def test_post_uses_own_budget(self):
+        limiter = RateLimiter(reserve=0, burst=1)
+        limiter.update(rate_limit_headers(post_remaining=0))
+
+        assert limiter._reserve("GET") == 0
+        assert limiter._reserve("POST") == pytest.approx(3600, abs=5)
+
+    def test_reserve_is_kept(self):
+        limiter = RateLimiter(reserve=10)
+        limiter.update(rate_limit_headers(user_remaining=10))
+
+        assert limiter._reserve("GET") > 0
+
+    def test_rate_limited_response_blocks(self):
+        limiter = RateLimiter()
+        limiter.update({"Retry-After": "5"}, status=429)
+
+        assert limiter._reserve("GET") == pytest.approx(5, abs=0.1)
+
+
+class TestEndpointRateLimiting:
+    @patch("pyimgurapi.transport.ConnectionPool.urlopen")
+    def test_headers_feed_shared_limiter(
+        self, urlopen_mock, imgur_image_get_200_response
+    ):
+        imgur_image_get_200_response.headers = rate_limit_headers()
+        urlopen_mock.return_value = imgur_image_get_200_response
+        api = ImgurAPI()
+
+        api.image.get_image("3MvMVho")
+
+        assert api.album.rate_limiter is api.rate_limiter
+        assert api.rate_limiter.tracker.get("user").remaining == 400
+
+    def test_too_many_requests(self, local_server):
+        local_server.set_response(
+            "/3/image/abc", status=429, headers={"Retry-After": "7"}
+        )
+        api = ImgurAPI(retry_policy=RetryPolicy(max_attempts=1))
+        image = api.image
+        image.base_url = local_server.url
+
+        with pytest.raises(PyImgurApiRateLimited) as exc_info:
+            image.get_image("abc")
+
+        assert exc_info.value.headers["Retry-After"] == "7"
+        assert api.rate_limiter._reserve("GET") > 6
+        api.close()
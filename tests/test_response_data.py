@@ -0,0 +1,80 @@
+import concurrent.futures
+import copy
+import json
+import time
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from pyimgurapi.utils import DynamicResponseData
+
+
+@pytest.fixture
+def album_images():
+    images = [{"id": str(i), "link": f"{i}.jpg"} for i in range(1000)]
+    return DynamicResponseData({"data": images, "success": True})
+
+
+class TestDynamicResponseData:
+    def test_children_cached(self, album_images):
+        assert album_images.data is album_images.data
+        assert album_images["data"][5] is album_images.data[5]
+        assert album_images.data[5].link == "5.jpg"
+
+    def test_repeated_access_does_not_allocate(self, album_images):
+        for image in album_images.data:
+            image.link
+
+        tracemalloc.start()
+        try:
+            for i in range(len(album_images.data)):
+                album_images.data[i].link
+            allocated = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert allocated < 1024
+
+    def test_iteration_and_len(self, album_images):
+        assert len(album_images) == 2 and len(album_images.data) == 1000
+        assert list(album_images) == ["data", "success"]
+        assert "success" in album_images
+        assert [image.id for image in album_images.data][:3] == list("012")
+        assert [i.id for i in album_images.data[1:3]] == ["1", "2"]
+
+    def test_slots(self, album_images):
+        assert not hasattr(album_images, "__dict__")
+        with pytest.raises(AttributeError):
+            album_images.data.link
+        assert copy.copy(album_images).data[0].id == "0"
+
+    def test_errors_unchanged(self, album_images):
+        with pytest.raises(IndexError, match="index '1000'"):
+            album_images.data[1000]
+        with pytest.raises(AttributeError, match="'missing' attribute"):
+            album_images.missing
+
+    def test_decoded_lazily(self):
+        decode = Mock(side_effect=json.loads)
+        response = DynamicResponseData.from_bytes(b'{"data": [1, 2]}', decode)
+
+        decode.assert_not_called()
+        assert list(response.data) == [1, 2]
+        assert len(response) == 1
+        decode.assert_called_once()
+
+    def test_decoded_once_by_racing_threads(self):
+        def decode(raw):
+            time.sleep(0.05)
+            return json.loads(raw)
+
+        decode = Mock(side_effect=decode)
+        response = DynamicResponseData.from_bytes(b'{"data": [1, 2]}', decode)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(lambda: response.data) for _ in range(8)]
+            results = [future.result() for future in futures]
+
+        assert all(list(data) == [1, 2] for data in results)
+        decode.assert_called_once()
@@ -0,0 +1,119 @@
+import io
+import socket
+import urllib.error
+from unittest.mock import patch
+
+import pytest
+
+from pyimgurapi.endpoints import Image
+from pyimgurapi.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def http_error(code, headers=None):
+    return urllib.error.HTTPError(
+        "https://api.imgur.com/", code, "Error", headers or {}, io.BytesIO()
+    )
+
+
+class TestRetryPolicy:
+    def test_backoff_full_jitter(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+        for attempt in range(1, 6):
+            delays = [policy.backoff(attempt) for _ in range(100)]
+            cap = min(5, 2 ** (attempt - 1))
+            assert all(0 <= delay <= cap for delay in delays)
+
+    def test_idempotent_methods_retried(self):
+        policy = RetryPolicy()
+
+        assert policy.next_delay(1, "GET", http_error(502)) is not None
+        assert policy.next_delay(1, "DELETE", socket.timeout()) is not None
+        assert policy.next_delay(1, "GET", http_error(404)) is None
+        assert policy.next_delay(3, "GET", http_error(502)) is None
+
+    def test_post_retried_on_opt_in(self):
+        policy = RetryPolicy()
+
+        assert policy.next_delay(1, "POST", http_error(502)) is None
+        assert policy.next_delay(1, "GET", http_error(502), False) is None
+        assert policy.next_delay(1, "POST", http_error(502), True) >= 0
+        policy.retry_non_idempotent = True
+        assert policy.next_delay(1, "POST", http_error(502)) >= 0
+
+    def test_retry_after_honored(self):
+        policy = RetryPolicy(backoff_base=0.01, max_retry_after=10)
+
+        error = http_error(503, {"Retry-After": "4"})
+        assert policy.next_delay(1, "GET", error) == 4
+        error = http_error(503, {"Retry-After": "3600"})
+        assert policy.next_delay(1, "GET", error) is None
+
+    def test_parse_retry_after_http_date(self):
+        headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+        assert parse_retry_after(headers) == 0
+        assert parse_retry_after({}) is None
+
+    def test_budget_exhausted(self):
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.5, initial=1))
+
+        assert policy.next_delay(1, "GET", http_error(502)) is not None
+        assert policy.next_delay(1, "GET", http_error(502)) is None
+        policy.record_request()
+        policy.record_request()
+        assert policy.next_delay(1, "GET", http_error(502)) is not None
+
+
+@patch("pyimgurapi.endpoints.base_endpoint.time.sleep")
+class TestMakeRequestRetries:
+    @patch("urllib.request.urlopen")
+    def test_transient_error_retried(
+        self, urlopen_mock, sleep_mock, imgur_image_get_200_response
+    ):
+        urlopen_mock.side_effect = [
+            http_error(502),
+            ConnectionResetError(),
+            imgur_image_get_200_response,
+        ]
+
+        image = Image(retry_policy=RetryPolicy())
+        res = image.get_image("3MvMVho")
+
+        assert urlopen_mock.call_count == 3
+        assert sleep_mock.call_count == 2
+        assert res.as_dict() == imgur_image_get_200_response.json()
+
+    @patch("urllib.request.urlopen")
+    def test_upload_not_retried_by_default(
+        self, urlopen_mock, sleep_mock, test_image
+    ):
+        urlopen_mock.side_effect = http_error(502)
+
+        image = Image(retry_policy=RetryPolicy())
+        with pytest.raises(urllib.error.HTTPError):
+            image.upload(io.BytesIO(test_image), "cat.jpg")
+
+        urlopen_mock.assert_called_once()
+
+    @patch("urllib.request.urlopen")
+    def test_upload_retried_on_opt_in(
+        self,
+        urlopen_mock,
+        sleep_mock,
+        test_image,
+        imgur_image_post_200_response,
+    ):
+        urlopen_mock.side_effect = [
+            http_error(503),
+            imgur_image_post_200_response,
+        ]
+
+        image = Image(retry_policy=RetryPolicy()).with_options(retry=True)
+        image.upload(io.BytesIO(test_image), "cat.jpg")
+
+        assert urlopen_mock.call_count == 2
+
+    def test_unknown_option(self, sleep_mock):
+        with pytest.raises(TypeError):
+            Image().with_options(retries=5)
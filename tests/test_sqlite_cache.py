@@ -0,0 +1,152 @@
+import multiprocessing
+import sqlite3
+import time
+import zlib
+from unittest.mock import Mock, patch
+
+from pyimgurapi.batch import map_concurrently
+from pyimgurapi.codec import JSONCodec
+from pyimgurapi.endpoints import Image
+from pyimgurapi.sqlite_cache import SQLiteCache
+
+
+def fill_cache(path, worker):
+    cache = SQLiteCache(path)
+    for i in range(20):
+        cache.set(f"{worker}-{i}", b'{"data": %d}' % i, None)
+    cache.close()
+
+
+class TestSQLiteCache:
+    def test_survives_restart(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = SQLiteCache(path)
+        cache.set("key", b'{"data": 1}', {"data": 1}, resource="image")
+        cache.close()
+
+        entry = SQLiteCache(path).get("key")
+
+        assert entry.value == {"data": 1}
+        assert entry.body == b'{"data": 1}'
+        assert entry.resource == "image"
+
+    def test_bodies_compressed(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        body = b'{"data": [%s]}' % b", ".join([b'"lorem ipsum"'] * 500)
+        cache = SQLiteCache(path)
+        cache.set("key", body, None)
+
+        with sqlite3.connect(path) as connection:
+            (stored,) = connection.execute(
+                "SELECT body FROM responses"
+            ).fetchone()
+        assert zlib.decompress(stored) == body
+        assert cache.stats().size == len(stored) < len(body) // 10
+
+    def test_lru_eviction(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3", max_entries=2)
+        cache.set("a", b"1", 1)
+        time.sleep(0.01)
+        cache.set("b", b"2", 2)
+        time.sleep(0.01)
+        cache.get("a")
+        cache.set("c", b"3", 3)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats().evictions == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = SQLiteCache(
+            tmp_path / "cache.sqlite3", ttls={"album_images": 0.01}
+        )
+        cache.set("image", b"{}", {}, resource="image")
+        cache.set("images", b"[]", [], resource="album_images")
+        time.sleep(0.02)
+
+        assert cache.get("image") is not None
+        assert cache.get("images") is None
+        assert len(cache) == 1
+
+    def test_stale_entry_revalidated(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3", ttl=0.01)
+        cache.set("key", b"{}", {}, headers={"ETag": '"v1"'})
+        time.sleep(0.02)
+
+        entry = cache.get("key", stale=True)
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+        with patch.object(SQLiteCache, "_make_entry") as make_entry_mock:
+            assert cache.refresh("key", {"ETag": '"v2"'})
+        make_entry_mock.assert_not_called()
+
+        assert cache.get("key").etag == '"v2"'
+        assert cache.stats().revalidations == 1
+
+    def test_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        SQLiteCache(path, max_entries=100).close()
+
+        processes = [
+            multiprocessing.Process(target=fill_cache, args=(path, worker))
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+        assert len(SQLiteCache(path)) == 80
+
+    def test_connections_bounded_with_thread_churn(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3")
+        cache.set("key", b'{"data": 1}', {"data": 1})
+
+        with patch("sqlite3.connect", wraps=sqlite3.connect) as connect_mock:
+            for _ in range(20):
+                results = list(
+                    map_concurrently(lambda key: cache.get(key), ["key"] * 8)
+                )
+                assert all(res.result.value == {"data": 1} for res in results)
+
+        assert connect_mock.call_count == 0
+        cache.close()
+
+    @patch("urllib.request.urlopen")
+    def test_endpoint_starts_warm(
+        self, urlopen_mock, tmp_path, imgur_image_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        img_id = imgur_image_get_200_response.json()["data"]["id"]
+        path = tmp_path / "cache.sqlite3"
+
+        Image(cache=SQLiteCache(path)).get_image(img_id)
+        res = Image(cache=SQLiteCache(path)).get_image(img_id)
+
+        urlopen_mock.assert_called_once()
+        assert res.as_dict() == imgur_image_get_200_response.json()
+
+    @patch("urllib.request.urlopen")
+    def test_entries_decoded_with_endpoint_codec(
+        self, urlopen_mock, tmp_path, imgur_image_get_200_response
+    ):
+        urlopen_mock.return_value = imgur_image_get_200_response
+        path = tmp_path / "cache.sqlite3"
+        Image(cache=SQLiteCache(path)).get_image("abc")
+        codec = Mock(wraps=JSONCodec())
+
+        Image(cache=SQLiteCache(path), codec=codec).get_image("abc")
+
+        urlopen_mock.assert_called_once()
+        codec.loads.assert_called_once()
+
+    def test_invalidate(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3")
+        cache.set("album", b"[]", [], tags={"album:a", "image:x"})
+        cache.set("image", b"{}", {}, tags={"image:x"})
+        cache.set("other", b"{}", {}, tags={"image:y"})
+        cache.set("other", b"{}", {}, tags={"image:z"})
+
+        assert cache.invalidate(["image:x", "image:y"]) == 2
+        assert len(cache) == 1
+        assert cache.invalidate(["image:z"]) == 1
@@ -0,0 +1,214 @@
+import asyncio
+import gc
+import io
+import json
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Album as AsyncAlbum
+from pyimgurapi.endpoints import Account, Album, Comment, Image
+from pyimgurapi.streaming import JSONArrayScanner, iter_json_array
+from pyimgurapi.transport import ConnectionPool
+from pyimgurapi.utils import DynamicResponseData
+
+
+def split(content, size):
+    chunks = list()
+    for start in range(0, len(content), size):
+        end = start + size
+        chunks.append(content[start:end])
+    return chunks
+
+
+class ChunkedStream:
+    """Stream returning the document in chunks of a fixed size."""
+
+    def __init__(self, content, size):
+        self.chunks = split(content, size)
+        self.headers = {}
+        self.reads = 0
+        self.closed = False
+
+    def read(self, amt=None):
+        self.reads += 1
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def close(self):
+        self.closed = True
+
+
+def scan(content, size, path=("data",)):
+    scanner = JSONArrayScanner(path)
+    items = list()
+    for chunk in split(content, size):
+        items.extend(scanner.feed(chunk))
+    items.extend(scanner.close())
+    return items
+
+
+class TestJSONArrayScanner:
+    def test_any_chunking(self):
+        document = {
+            "success": True,
+            "skipped": [1, {"data": "ü"}],
+            "data": [1.5e10, -3, "ü€", {"k": [1, 2]}, None, True, 12.25],
+            "status": 200,
+        }
+        content = json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+        for size in range(1, 16):
+            assert scan(content, size) == document["data"]
+
+    def test_nested_array(self, imgur_replies_get_200_response):
+        content = imgur_replies_get_200_response.content
+        children = imgur_replies_get_200_response.json()["data"]["children"]
+
+        assert scan(content, 7, path=("data", "children")) == children
+
+    @pytest.mark.parametrize(
+        "content, error",
+        [
+            (b'{"data": {"id": 1}}', "'data' is not an array"),
+            (b'{"success": false}', "Missing 'data'"),
+            (b'{"data": [1, 2', "Truncated JSON document"),
+            (b'{"data": [1 2]}', "Expected ',]'"),
+        ],
+    )
+    def test_invalid_document(self, content, error):
+        with pytest.raises(ValueError, match=error):
+            scan(content, 4)
+
+
+class TestIterJSONArray:
+    def test_items_available_as_they_arrive(self):
+        items = [{"id": i} for i in range(100)]
+        stream = ChunkedStream(json.dumps({"data": items}).encode(), 64)
+
+        iterator = iter_json_array(stream)
+        first = next(iterator)
+
+        assert isinstance(first, DynamicResponseData) and first.id == 0
+        assert stream.reads == 1
+        iterator.close()
+        assert stream.closed
+
+    def test_unstarted_iterator_closes_stream(self):
+        stream = ChunkedStream(b'{"data": [1, 2]}', 4)
+
+        iterator = iter_json_array(stream)
+        del iterator
+        gc.collect()
+
+        assert stream.closed and stream.reads == 0
+
+    def test_memory_bounded_by_item(self):
+        images = [
+            {"id": f"img{i:07d}", "link": "x" * 200} for i in range(20000)
+        ]
+        content = json.dumps({"data": images, "success": True}).encode()
+
+        tracemalloc.start()
+        count = sum(1 for _ in iter_json_array(io.BytesIO(content)))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert count == 20000
+        assert peak < len(content) / 10
+
+
+class TestStreamMode:
+    def test_album_images(self, local_server):
+        images = [{"id": str(i)} for i in range(1000)]
+        local_server.set_response(
+            "/3/album/abc/images",
+            body=json.dumps({"data": images, "success": True}).encode(),
+        )
+
+        with ConnectionPool() as pool:
+            album = Album(transport=pool).with_options(stream=True)
+            album.base_url = local_server.url
+            streamed = [image.id for image in album.album_images("abc")]
+            streamed_again = [image.id for image in album.album_images("abc")]
+
+        assert streamed == streamed_again == [str(i) for i in range(1000)]
+        assert local_server.connections == 1
+
+    def test_unstarted_stream_releases_connection(self, local_server):
+        local_server.set_response(
+            "/3/album/abc/images", body=b'{"data": [{"id": "1"}]}'
+        )
+
+        with ConnectionPool(max_connections_per_host=1) as pool:
+            album = Album(transport=pool).with_options(stream=True, timeout=1)
+            album.base_url = local_server.url
+            album.album_images("abc")
+            gc.collect()
+            images = album.album_images("abc")
+
+            assert [image.id for image in images] == ["1"]
+
+    def test_async_unstarted_stream_releases_connection(self, local_server):
+        local_server.set_response(
+            "/3/album/abc/images", body=b'{"data": [{"id": "1"}]}'
+        )
+
+        async def main():
+            async with AsyncConnectionPool(max_concurrency=1) as pool:
+                album = AsyncAlbum(transport=pool).with_options(
+                    stream=True, timeout=1
+                )
+                album.base_url = local_server.url
+                await album.album_images("abc")
+                gc.collect()
+                images = await album.album_images("abc")
+                return [image.id async for image in images]
+
+        assert asyncio.run(main()) == ["1"]
+
+    def test_other_calls_not_streamed(self, local_server):
+        local_server.set_response(
+            "/3/image/abc", body=b'{"data": {"id": "abc"}}'
+        )
+        for page, items in enumerate([[{"id": "a"}], []]):
+            local_server.set_response(
+                f"/3/account/me/images/{page}",
+                body=json.dumps({"data": items}).encode(),
+            )
+
+        with ConnectionPool() as pool:
+            image = Image(transport=pool).with_options(stream=True)
+            account = Account(transport=pool).with_options(stream=True)
+            for endpoint in (image, account):
+                endpoint.base_url = local_server.url
+
+            assert image.get_image("abc").data.id == "abc"
+            assert [i.id for i in account.iter_images()] == ["a"]
+
+    @patch("urllib.request.urlopen")
+    def test_comment_replies(
+        self, urlopen_mock, imgur_replies_get_200_response
+    ):
+        urlopen_mock.return_value = ChunkedStream(
+            imgur_replies_get_200_response.content, 100
+        )
+
+        replies = Comment().with_options(stream=True).replies(632941205)
+
+        assert [reply.points for reply in replies] == [5, 3]
+        assert urlopen_mock.return_value.closed
+
+    @patch("urllib.request.urlopen")
+    def test_fields(self, urlopen_mock, imgur_replies_get_200_response):
+        urlopen_mock.return_value = ChunkedStream(
+            imgur_replies_get_200_response.content, 100
+        )
+
+        replies = Comment().with_options(stream=True).replies(1, ["points"])
+
+        assert [reply.as_dict() for reply in replies] == [
+            {"points": 5},
+            {"points": 3},
+        ]
@@ -0,0 +1,113 @@
+import asyncio
+import socket
+import time
+
+import pytest
+
+from pyimgurapi import ImgurAPI
+from pyimgurapi.aio import AsyncConnectionPool
+from pyimgurapi.aio.endpoints import Album as AsyncAlbum
+from pyimgurapi.endpoints import Album
+from pyimgurapi.exceptions import PyImgurApiTimeout
+from pyimgurapi.retry import RetryPolicy
+from pyimgurapi.timeouts import Deadline, Timeout
+from pyimgurapi.transport import ConnectionPool
+
+
+def make_album(server, **kwargs):
+    album = Album(transport=ConnectionPool(), **kwargs)
+    album.base_url = server.url
+    return album
+
+
+class TestDeadline:
+    def test_nested_deadline_cannot_extend(self):
+        with Deadline(1) as outer:
+            with Deadline(60) as inner:
+                assert inner is outer
+                assert Deadline.current() is outer
+            with Deadline(0.5) as tighter:
+                assert Deadline.current() is tighter
+            assert Deadline.current() is outer
+        assert Deadline.current() is None
+
+    def test_check(self):
+        deadline = Deadline(0)
+
+        assert deadline.expired
+        with pytest.raises(PyImgurApiTimeout):
+            deadline.check()
+
+    def test_socket_timeouts_clipped(self):
+        deadline = Deadline(2)
+
+        connect, read = Timeout(connect=1, read=10).socket_timeouts(deadline)
+
+        assert connect == 1
+        assert read == pytest.approx(2, abs=0.1)
+
+    def test_call_deadline(self):
+        album = Album(timeout=Timeout(total=30))
+
+        with Deadline(5):
+            assert album.call_deadline().remaining() <= 5
+        assert 5 < album.call_deadline().remaining() <= 30
+        assert Album().call_deadline() is None
+
+
+class TestTimeouts:
+    def test_read_timeout(self, local_server):
+        local_server.set_response("/3/album/abc", delay=0.5)
+        album = make_album(
+            local_server,
+            timeout=Timeout(read=0.1),
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+        with pytest.raises(socket.timeout):
+            album.get_album("abc")
+
+    def test_per_call_override(self, local_server):
+        local_server.set_response("/3/album/abc", delay=0.2)
+        album = make_album(local_server, timeout=Timeout(read=0.05))
+
+        res = album.with_options(timeout=5).get_album("abc")
+
+        assert res.as_dict() == {}
+
+    def test_deadline_spans_calls_and_retries(self, local_server):
+        local_server.set_response("/3/album/abc", delay=0.15)
+        local_server.set_response("/3/album/abc/images", status=503)
+        album = make_album(
+            local_server, retry_policy=RetryPolicy(max_attempts=100)
+        )
+
+        started = time.monotonic()
+        with pytest.raises(PyImgurApiTimeout):
+            with Deadline(0.5):
+                album.get_album("abc")
+                album.album_images("abc")
+
+        assert time.monotonic() - started < 1
+        assert len(local_server.requests) >= 2
+
+    def test_api_default_timeout(self):
+        api = ImgurAPI()
+
+        assert api.image.timeout.connect == 10
+        assert api.image.with_options(timeout=3).timeout == 3
+
+    def test_async_deadline(self, local_server):
+        local_server.set_response("/3/album/abc", delay=0.5)
+
+        async def main():
+            async with AsyncConnectionPool() as pool:
+                album = AsyncAlbum(transport=pool)
+                album.base_url = local_server.url
+                with Deadline(0.1):
+                    await album.get_album("abc")
+
+        started = time.monotonic()
+        with pytest.raises(PyImgurApiTimeout):
+            asyncio.run(main())
+        assert time.monotonic() - started < 0.5
@@ -0,0 +1,136 @@
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from pyimgurapi import ImgurAPI
+from pyimgurapi.endpoints.base_endpoint import BaseEndpoint
+from pyimgurapi.timeouts import Timeout
+from pyimgurapi.transport import ConnectionPool
+
+
+class TestConnectionPool:
+    def test_connection_reused(self, local_server):
+        local_server.set_response("/3/image/abc", body=b'{"data": 1}')
+        pool = ConnectionPool()
+
+        for _ in range(3):
+            request = urllib.request.Request(f"{local_server.url}/3/image/abc")
+            assert pool.urlopen(request).read() == b'{"data": 1}'
+
+        assert local_server.connections == 1
+        assert len(local_server.requests) == 3
+        pool.close()
+
+    def test_http_error_raised(self, local_server):
+        local_server.set_response("/missing", status=404, body=b"{}")
+        pool = ConnectionPool()
+
+        request = urllib.request.Request(f"{local_server.url}/missing")
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            pool.urlopen(request)
+
+        assert exc_info.value.code == 404
+        # The error body was drained, so the socket is reusable.
+        request = urllib.request.Request(f"{local_server.url}/ok")
+        pool.urlopen(request).read()
+        assert local_server.connections == 1
+        pool.close()
+
+    def test_per_host_limit(self, local_server):
+        pool = ConnectionPool(max_connections_per_host=1)
+        key = ("http", "127.0.0.1", local_server.server_address[1])
+        connection, _ = pool.acquire(key)
+        acquired = threading.Event()
+
+        def worker():
+            pool.release(key, pool.acquire(key)[0])
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.1)
+
+        pool.release(key, connection)
+        assert acquired.wait(1)
+        thread.join()
+        pool.close()
+
+    def test_acquire_times_out(self, local_server):
+        pool = ConnectionPool(max_connections_per_host=1)
+        key = ("http", "127.0.0.1", local_server.server_address[1])
+        pool.acquire(key)
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(key, timeout=0.1)
+
+    def test_failed_read_releases_connection(self, local_server):
+        # The body is shorter than announced, so reading it times out.
+        local_server.set_response(
+            "/stalled", body=b"{}", headers={"Content-Length": "100"}
+        )
+        local_server.set_response("/ok", body=b'{"data": 1}')
+
+        with ConnectionPool(max_connections_per_host=1) as pool:
+            endpoint = BaseEndpoint(
+                transport=pool, timeout=Timeout(connect=1, read=0.2)
+            )
+            endpoint.base_url = local_server.url
+            for _ in range(2):
+                with pytest.raises(OSError):
+                    endpoint.make_request("/stalled")
+
+            assert endpoint.make_request("/ok").data == 1
+
+    def test_post_not_replayed_on_stale_connection(self, local_server):
+        def drop(body):
+            # Closes the connection without a response.
+            raise ConnectionResetError
+
+        local_server.set_response("/drop", body=drop)
+        pool = ConnectionPool()
+        pool.urlopen(urllib.request.Request(f"{local_server.url}/ok")).read()
+
+        request = urllib.request.Request(
+            f"{local_server.url}/drop", data=b"{}", method="POST"
+        )
+        with pytest.raises(ConnectionError):
+            pool.urlopen(request)
+
+        assert [r[0] for r in local_server.requests] == ["GET", "POST"]
+        pool.close()
+
+    def test_idle_connections_evicted(self, local_server):
+        pool = ConnectionPool(idle_timeout=0.05)
+        request = urllib.request.Request(f"{local_server.url}/a")
+        pool.urlopen(request).read()
+        time.sleep(0.1)
+        pool.urlopen(request).read()
+
+        assert local_server.connections == 2
+        pool.close()
+
+
+class TestSharedTransport:
+    def test_endpoints_share_api_transport(self):
+        api = ImgurAPI()
+
+        assert api.image.transport is api.transport
+        assert api.album.transport is api.transport
+        assert api.comment.transport is api.transport
+        assert api.account.transport is api.transport
+
+    def test_make_request_uses_transport(self, local_server):
+        local_server.set_response("/3/image/abc", body=b'{"data": "ok"}')
+        pool = ConnectionPool()
+        endpoint = BaseEndpoint(transport=pool)
+        endpoint.base_url = local_server.url
+
+        res = endpoint.make_request("/3/image/abc")
+        endpoint.make_request("/3/image/abc")
+
+        assert res.data == "ok"
+        assert local_server.connections == 1
+        pool.close()